@@ -9,6 +9,9 @@ class Settings(BaseSettings):
     # MongoDB (Atlas)
     MONGO_URI: str
     DB_NAME: str
+    MONGO_MAX_POOL_SIZE: int = 50  # Per process - keep workers * this under the server's connection limit
+    MONGO_MIN_POOL_SIZE: int = 5
+    MONGO_COMPRESSORS: str = "zstd,zlib"  # Wire compression, negotiated with the server
 
     # JWT
     JWT_SECRET: str
@@ -23,6 +26,7 @@ class Settings(BaseSettings):
     # Google Gemini AI
     GEMINI_API_KEY: str  # Required from .env file
     GEMINI_MODEL: str = "gemini-2.0-flash"
+    GEMINI_MAX_CONCURRENCY: int = 16  # Max in-flight Gemini requests per process
     
     # Groq API Configuration
     GROQ_API_KEY: str | None = None  # Load from .env file
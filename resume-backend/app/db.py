@@ -1,43 +1,96 @@
 # app/db.py
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import OperationFailure
 from app.config import settings
-import asyncio
+import contextlib
+import logging
 
-client = AsyncIOMotorClient(settings.MONGO_URI)
+client = AsyncIOMotorClient(
+    settings.MONGO_URI,
+    maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+    minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+    waitQueueTimeoutMS=2000,  # Fail fast instead of queueing behind an exhausted pool
+    serverSelectionTimeoutMS=3000,
+    retryWrites=True,
+    compressors=settings.MONGO_COMPRESSORS
+)
 db = client[settings.DB_NAME]
 
+log = logging.getLogger(__name__)
+
+async def _ensure_index(collection, keys, **kwargs) -> bool:
+    """Create one index; a failure (e.g. existing duplicates under a unique index) is logged, not fatal"""
+    try:
+        await collection.create_index(keys, **kwargs)
+        return True
+    except Exception:
+        log.exception("❌ Failed to create index %s on %s", kwargs.get("name", keys), collection.name)
+        return False
+
 async def init_db():
-    async def create_indexes():
+    """Create indexes one at a time so a single failure doesn't skip the rest (awaited at startup)"""
+    # Only never-applied/never-saved jobs are cleanup candidates, so the partial index stays small.
+    # It replaces the old multikey (created_at, applied_by, saved_by) index the $expr filter couldn't use.
+    with contextlib.suppress(OperationFailure):
+        await db.jobs.drop_index("lifecycle_cleanup_index")
+    
+    results = [
         # User indexes
-        await db.users.create_index("email", unique=True)
+        await _ensure_index(db.users, "email", unique=True),
         
         # Job indexes - basic
-        await db.jobs.create_index([("created_at", -1)])
+        await _ensure_index(db.jobs, [("created_at", -1)]),
         
         # Job indexes - lifecycle management
-        await db.jobs.create_index([("expires_at", 1)], name="expiration_index")
-        await db.jobs.create_index([("created_at", 1), ("applied_by", 1), ("saved_by", 1)], name="lifecycle_cleanup_index")
+        await _ensure_index(db.jobs, [("expires_at", 1)], name="expiration_index"),
+        await _ensure_index(
+            db.jobs,
+            [("created_at", 1)],
+            partialFilterExpression={"apply_count": 0, "save_count": 0},
+            name="lifecycle_cleanup_partial"
+        ),
         
         # Job indexes - scraping and filtering
-        await db.jobs.create_index([("source_platform", 1)])
-        await db.jobs.create_index([("category", 1)])
-        await db.jobs.create_index([("remote_type", 1)])
-        await db.jobs.create_index([("job_url", 1)], unique=True, sparse=True)  # Prevent duplicate scraping
+        await _ensure_index(db.jobs, [("source_platform", 1)]),
+        await _ensure_index(db.jobs, [("category", 1)]),
+        await _ensure_index(db.jobs, [("remote_type", 1)]),
+        await _ensure_index(db.jobs, [("job_url", 1)], unique=True, sparse=True),  # Prevent duplicate scraping
+        await _ensure_index(db.jobs, [("fingerprint", 1)], sparse=True),  # title/company/location fallback dedup
         
         # Application indexes
-        await db.applications.create_index([("user_id", 1), ("job_id", 1)], unique=False)
-        await db.applications.create_index([("user_id", 1), ("status", 1)])
+        await _ensure_index(db.applications, [("user_id", 1), ("job_id", 1)], unique=False),
+        await _ensure_index(db.applications, [("user_id", 1), ("status", 1)]),
+        
+        # Resume indexes - per-user listing sorted newest first
+        await _ensure_index(db.resumes, [("user_id", 1), ("created_at", -1)]),
+        
+        # Resume analysis cache - entries expire after 30 days
+        await _ensure_index(db.resume_extractions, [("created_at", 1)], expireAfterSeconds=30 * 24 * 3600),
         
         # User preferences indexes
-        await db.user_preferences.create_index([("user_id", 1)], unique=True)
+        await _ensure_index(db.user_preferences, [("user_id", 1)], unique=True),
         
-        # Lifecycle logs indexes
-        await db.job_lifecycle_logs.create_index([("timestamp", -1)])
-        await db.system_logs.create_index([("timestamp", -1)])
+        # Notification indexes - equality on user/read, then sort on created_at
+        await _ensure_index(db.notifications, [("user_id", 1), ("read", 1), ("created_at", -1)]),
         
-        print("✅ Database indexes created successfully")
+        # Notification indexes - unread-only (badge listing, mark-all-read); stays small and hot
+        await _ensure_index(
+            db.notifications,
+            [("user_id", 1), ("created_at", -1)],
+            partialFilterExpression={"read": False},
+            name="notif_user_unread_partial"
+        ),
+        
+        # Lifecycle logs indexes
+        await _ensure_index(db.job_lifecycle_logs, [("timestamp", -1)]),
+        await _ensure_index(db.system_logs, [("timestamp", -1)]),
+    ]
     
-    asyncio.create_task(create_indexes())
+    failed = results.count(False)
+    if failed:
+        log.warning("⚠️ Database indexes created with %d failure(s)", failed)
+    else:
+        log.info("✅ Database indexes created successfully")
 
 async def close_db():
     client.close()
@@ -0,0 +1,43 @@
+# app/logging_setup.py
+"""
+Non-blocking logging for request handlers.
+
+Handlers log through the stdlib logging module; records are pushed onto an
+in-memory queue and a QueueListener thread does the formatting and the
+actual stdout writes, so a slow terminal/pipe never stalls the event loop.
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+_listener = None
+
+
+def setup_logging(level: str = None):
+    """Route the root logger through a QueueHandler (idempotent)"""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level or os.getenv("LOG_LEVEL", "INFO").upper())
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging():
+    """Flush and stop the background listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
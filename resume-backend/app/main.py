@@ -1,6 +1,10 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.config import settings
+from app.logging_setup import setup_logging, shutdown_logging
+
+setup_logging()
 
 # Import ALL routers
 from app.routers import auth, jobs, resume, apply, feedback, admin, chatbot, analytics, preferences, interview, ai_interview, notifications
@@ -16,6 +20,21 @@ allow_origins_list = [
     origin.strip() for origin in settings.ALLOW_ORIGINS.split(",")
 ]
 
+# Refuse oversized resume uploads from Content-Length, before the multipart
+# body is read and spooled. Registered before CORS so the 413 still gets CORS headers
+RESUME_UPLOAD_PATH = "/api/resume/upload"
+
+@app.middleware("http")
+async def limit_resume_upload_size(request: Request, call_next):
+    if request.url.path == RESUME_UPLOAD_PATH:
+        try:
+            content_length = int(request.headers.get("content-length", 0))
+        except ValueError:
+            content_length = 0
+        if content_length > resume.MAX_UPLOAD_REQUEST_BYTES:
+            return JSONResponse(status_code=413, content={"detail": "Resume too large (max 10MB)"})
+    return await call_next(request)
+
 # CORS Configuration - MUST BE FIRST
 app.add_middleware(
     CORSMiddleware,
@@ -96,12 +115,25 @@ async def startup_event():
     print("   ✅ /api/admin/jobs/trigger-cleanup (POST) - NEW")
     print("=" * 80)
     
+    # Ensure indexes (incl. the unique job_url index scrapers rely on for dedup)
+    from app.db import init_db
+    await init_db()
+    
     # Start job lifecycle scheduler
     try:
         from app.services.job_scheduler import scheduler
         scheduler.start()
     except Exception as e:
         print(f"⚠️ Failed to start scheduler: {e}")
+    
+    # Batch job lifecycle events into insert_many writes
+    from app.services.job_lifecycle import start_event_writer
+    start_event_writer()
+    
+    # Backfill users.unread_notifications for accounts created before the counter.
+    # Awaited so it finishes before requests are served: a live $inc on a user
+    # without the field would create it and the backfill would then skip that user
+    await notifications.seed_unread_counters()
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -113,3 +145,18 @@ async def shutdown_event():
         scheduler.stop()
     except Exception as e:
         print(f"⚠️ Failed to stop scheduler: {e}")
+    
+    # Write out queued job lifecycle events
+    from app.services.job_lifecycle import stop_event_writer
+    await stop_event_writer()
+    
+    # Close pooled scraper connections
+    from app.scrapers.base_scraper import BaseScraper
+    await BaseScraper.close_client()
+    
+    # Stop the worker processes (resume parsing, large scrape batches)
+    from app.process_pool import shutdown_process_pool
+    shutdown_process_pool()
+    
+    # Flush queued log records
+    shutdown_logging()
@@ -1,5 +1,5 @@
 # app/models.py
-from pydantic import BaseModel, EmailStr, Field, HttpUrl
+from pydantic import BaseModel, EmailStr, Field, HttpUrl, field_validator
 from typing import Optional, List, Literal, Dict
 from datetime import datetime
 
@@ -171,6 +171,13 @@ class NotificationOut(BaseModel):
     created_at: datetime
 
 # ---------------- User Preferences models ----------------
+VALID_JOB_CATEGORIES = frozenset({
+    "Data Science", "Machine Learning", "Frontend", "Backend",
+    "DevOps", "Mobile", "Full Stack", "Other"
+})
+VALID_REMOTE_PREFERENCES = frozenset({"Remote", "Hybrid", "On-site", "Any"})
+VALID_EXPERIENCE_LEVELS = frozenset({"Entry", "Mid", "Senior", "Lead"})
+
 class UserPreferences(BaseModel):
     job_categories: List[str] = []  # Data Science, ML, Frontend, Backend, DevOps, Mobile, Full Stack, Other
     preferred_locations: List[str] = []
@@ -185,6 +192,31 @@ class UserPreferences(BaseModel):
         "application_updates": True
     }
 
+    @field_validator("job_categories")
+    @classmethod
+    def check_job_categories(cls, v: List[str]) -> List[str]:
+        invalid = set(v) - VALID_JOB_CATEGORIES
+        if invalid:
+            raise ValueError(
+                f"Invalid job category: {', '.join(sorted(invalid))}. "
+                f"Valid categories: {', '.join(sorted(VALID_JOB_CATEGORIES))}"
+            )
+        return v
+
+    @field_validator("remote_preference")
+    @classmethod
+    def check_remote_preference(cls, v: Optional[str]) -> Optional[str]:
+        if v and v not in VALID_REMOTE_PREFERENCES:
+            raise ValueError(f"Invalid remote preference. Valid options: {', '.join(sorted(VALID_REMOTE_PREFERENCES))}")
+        return v
+
+    @field_validator("experience_level")
+    @classmethod
+    def check_experience_level(cls, v: Optional[str]) -> Optional[str]:
+        if v and v not in VALID_EXPERIENCE_LEVELS:
+            raise ValueError("Invalid experience level. Valid options: Entry, Mid, Senior, Lead")
+        return v
+
 class PreferencesOut(BaseModel):
     user_id: str
     preferences: UserPreferences
@@ -0,0 +1,71 @@
+# app/process_pool.py
+"""
+Shared worker process pool for CPU-bound work (resume parsing, large scrape batches).
+
+One small pool for the whole app: os.cpu_count() reports the host's CPUs rather
+than the container's quota, so sizing by it can exceed the memory limit. Workers
+are spawned rather than forked, so they don't inherit the QueueListener or pymongo
+monitor threads; each one logs straight to stdout.
+"""
+
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+PROCESS_POOL_WORKERS = min(2, os.cpu_count() or 1)
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _init_worker():
+    """Worker logging: the parent's log queue isn't shared, so write to stdout directly"""
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        stream=sys.stdout,
+        format="%(asctime)s %(levelname)s [%(name)s] %(message)s"
+    )
+
+
+def _deadline_expired(signum, frame):
+    raise TimeoutError("worker deadline expired")
+
+
+def call_with_deadline(seconds: float, func: Callable, *args) -> Any:
+    """
+    Run func(*args) inside a worker, raising TimeoutError once it runs past
+    `seconds`. SIGALRM interrupts the work itself, so the worker is free again
+    rather than still busy behind an abandoned future (no-op where SIGALRM is missing).
+    """
+    if not hasattr(signal, "setitimer"):
+        return func(*args)
+    previous = signal.signal(signal.SIGALRM, _deadline_expired)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        return func(*args)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=PROCESS_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker
+        )
+    return _pool
+
+
+def shutdown_process_pool():
+    """Stop the worker processes (app shutdown)"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
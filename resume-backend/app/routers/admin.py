@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 from app.db import db
 from app.security import require_role
+from app.services.job_matcher import invalidate_user_context
 from bson import ObjectId
 
 # ✅ Remove /api prefix - main.py will add it with prefix="/api"
@@ -176,6 +177,7 @@ async def delete_user(
         await db.users.delete_one({"_id": ObjectId(user_id)})
         await db.resumes.delete_many({"user_id": user_id})
         await db.applications.delete_many({"user_id": user_id})
+        invalidate_user_context(user_id)
         return {"message": "User and related data deleted"}
     except Exception as e:
         print(f"❌ User delete error: {e}")
@@ -276,7 +278,10 @@ async def trigger_scrape(
     """Manually trigger job scraping from all platforms"""
     try:
         from app.services.scraping_orchestrator import orchestrator
+        from app.scrapers.remoteok_scraper import invalidate_remoteok_cache
         
+        # A manual trigger should see fresh data, not the scheduler's cached feed
+        invalidate_remoteok_cache()
         result = await orchestrator.scrape_all_platforms(limit_per_platform=limit_per_platform)
         
         return {
@@ -19,14 +19,24 @@ from app.db import db
 from app.security import get_current_user
 from app.config import settings
 import google.generativeai as genai
-import json
+import orjson
 import re
+from functools import lru_cache
 
 router = APIRouter(prefix="/ai-interview", tags=["ai-interview"])
 
 # Initialize Gemini
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
+# Shared model for prompts without a per-session system instruction
+_GEMINI_MODEL = genai.GenerativeModel(settings.GEMINI_MODEL)
+
+
+@lru_cache(maxsize=64)
+def _interviewer_model(system_prompt: str) -> genai.GenerativeModel:
+    """Model carrying a session's interviewer system instruction, reused across its turns"""
+    return genai.GenerativeModel(settings.GEMINI_MODEL, system_instruction=system_prompt)
+
 
 # Pydantic Models
 class StartConversationalInterview(BaseModel):
@@ -158,16 +168,12 @@ async def start_conversational_interview(
         
         # Get initial greeting from AI
         try:
-            model = genai.GenerativeModel(
-                settings.GEMINI_MODEL,
-                system_instruction=system_prompt
-            )
+            model = _interviewer_model(system_prompt)
             response = model.generate_content("Hello, I'm ready for the interview.")
             ai_greeting = response.text
         except Exception:
             # Fallback if system_instruction not supported or error
-            model = genai.GenerativeModel(settings.GEMINI_MODEL)
-            response = model.generate_content(f"{system_prompt}\n\nUser: Hello, I'm ready for the interview.")
+            response = _GEMINI_MODEL.generate_content(f"{system_prompt}\n\nUser: Hello, I'm ready for the interview.")
             ai_greeting = response.text
         
         # Create conversation history
@@ -253,10 +259,7 @@ async def send_message(
         
         # Get AI response
         try:
-            model = genai.GenerativeModel(
-                settings.GEMINI_MODEL,
-                system_instruction=session["system_prompt"]
-            )
+            model = _interviewer_model(session["system_prompt"])
             chat = model.start_chat(history=history)
             response = chat.send_message(request.message)
             ai_response = response.text
@@ -478,13 +481,12 @@ Provide comprehensive feedback in JSON format:
     "recommendation": "hire/maybe/no" 
 }}"""
 
-        model = genai.GenerativeModel(settings.GEMINI_MODEL)
-        response = model.generate_content(prompt)
+        response = _GEMINI_MODEL.generate_content(prompt)
         feedback_text = response.text.replace("```json", "").replace("```", "").strip()
         
         # Try to parse JSON
         try:
-            feedback = json.loads(feedback_text)
+            feedback = orjson.loads(feedback_text)
         except:
             # Fallback feedback
             feedback = {
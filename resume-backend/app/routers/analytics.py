@@ -23,6 +23,8 @@ async def get_user_analytics(current_user: dict = Depends(get_current_user)):
             if isinstance(skills_list, list):
                 all_skills.extend(skills_list)
         
+        all_skills_lower = {s.lower() for s in all_skills}
+        
         # Get applications
         apps = []
         async for app in db.applications.find({"user_id": user_id}):
@@ -39,7 +41,7 @@ async def get_user_analytics(current_user: dict = Depends(get_current_user)):
                     required_skills = job.get("required_skills", [])
                     job_skills.extend(required_skills)
                     for skill in required_skills:
-                        if skill.lower() in [s.lower() for s in all_skills]:
+                        if skill.lower() in all_skills_lower:
                             skill_frequency[skill] += 1
             except:
                 continue
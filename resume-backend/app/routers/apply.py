@@ -1,6 +1,6 @@
 import os
-import re
-import json
+import logging
+import orjson
 import httpx
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -9,6 +9,10 @@ from typing import Optional
 from bson import ObjectId
 from app.db import db
 from app.security import get_current_user
+from app.routers.jobs import invalidate_jobs_cache
+from app.utils import extract_json_object
+
+log = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/apply", tags=["apply"])
 
@@ -55,17 +59,17 @@ Return ONLY a JSON object:
     try:
         content = await ai_service.generate_content(prompt)
         
-        json_match = re.search(r'\{[\s\S]*\}', content)
-        if json_match:
-            result = json.loads(json_match.group(0))
+        json_str = extract_json_object(content)
+        if json_str:
+            result = orjson.loads(json_str)
             score = float(result.get("match_score", 65))
-            print(f"✅ AI match score: {score}% - {result.get('reasoning', '')}")
+            log.info("✅ AI match score: %s%% - %s", score, result.get('reasoning', ''))
             return max(0, min(100, score))
         else:
             return fallback_match_calculation(resume_text, required_skills)
             
     except Exception as e:
-        print(f"❌ AI match score error: {e}")
+        log.error("❌ AI match score error: %s", e)
         return fallback_match_calculation(resume_text, required_skills)
 
 def fallback_match_calculation(resume_text: str, required_skills: list) -> float:
@@ -76,7 +80,7 @@ def fallback_match_calculation(resume_text: str, required_skills: list) -> float
     resume_lower = resume_text.lower()
     matched = sum(1 for skill in required_skills if skill.lower() in resume_lower)
     score = (matched / len(required_skills)) * 100
-    print(f"✅ Fallback match score: {score:.1f}% ({matched}/{len(required_skills)} skills)")
+    log.info("✅ Fallback match score: %.1f%% (%s/%s skills)", score, matched, len(required_skills))
     return round(score, 1)
 
 
@@ -171,6 +175,8 @@ async def apply_to_job(payload: ApplyRequest, current_user: dict = Depends(get_c
                 "$unset": {"expires_at": ""}  # Remove expiration mark - job will be kept permanently
             }
         )
+        # apply_count is shown to every viewer, not just this user
+        invalidate_jobs_cache()
         
         # Log lifecycle event
         from app.services.job_lifecycle import log_job_event
@@ -179,8 +185,8 @@ async def apply_to_job(payload: ApplyRequest, current_user: dict = Depends(get_c
             "match_score": match_score
         })
         
-        print(f"✅ Application created: {result.inserted_id} (Match: {match_score}%)")
-        print(f"✅ Job {job_id} marked as applied by user {user_id}")
+        log.info("✅ Application created: %s (Match: %s%%)", result.inserted_id, match_score)
+        log.info("✅ Job %s marked as applied by user %s", job_id, user_id)
         
         return {
             "message": "Application submitted successfully. Job will be kept in your history permanently.",
@@ -190,7 +196,7 @@ async def apply_to_job(payload: ApplyRequest, current_user: dict = Depends(get_c
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error applying to job: {e}")
+        log.error("❌ Error applying to job: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -223,12 +229,12 @@ async def get_my_applications(
                     "created_at": app.get("created_at")
                 })
             except Exception as e:
-                print(f"Error processing application: {e}")
+                log.error("Error processing application: %s", e)
                 continue
         
         return applications
     except Exception as e:
-        print(f"❌ Error fetching applications: {e}")
+        log.error("❌ Error fetching applications: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -266,22 +272,17 @@ async def update_application_status(
             "notes": request.notes
         }
         
-        # Update application
-        update_data = {
-            "status": request.status,
-            "updated_at": datetime.utcnow()
-        }
-        
-        # Add timeline event
+        # Update application and add timeline event (updated_at stamped by the server)
         await db.applications.update_one(
             {"_id": ObjectId(application_id)},
             {
-                "$set": update_data,
-                "$push": {"timeline": timeline_event}
+                "$set": {"status": request.status},
+                "$push": {"timeline": timeline_event},
+                "$currentDate": {"updated_at": True}
             }
         )
         
-        print(f"✅ Updated application {application_id} status to {request.status}")
+        log.info("✅ Updated application %s status to %s", application_id, request.status)
         
         return {
             "message": "Status updated successfully",
@@ -291,7 +292,7 @@ async def update_application_status(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error updating status: {e}")
+        log.error("❌ Error updating status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -325,11 +326,11 @@ async def add_application_note(
             {"_id": ObjectId(application_id)},
             {
                 "$push": {"notes": note},
-                "$set": {"updated_at": datetime.utcnow()}
+                "$currentDate": {"updated_at": True}
             }
         )
         
-        print(f"✅ Added note to application {application_id}")
+        log.info("✅ Added note to application %s", application_id)
         
         return {
             "message": "Note added successfully",
@@ -339,7 +340,7 @@ async def add_application_note(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error adding note: {e}")
+        log.error("❌ Error adding note: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -372,7 +373,7 @@ async def get_application_timeline(
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error fetching timeline: {e}")
+        log.error("❌ Error fetching timeline: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -413,7 +414,7 @@ async def get_application_stats(
         return stats
         
     except Exception as e:
-        print(f"❌ Error fetching stats: {e}")
+        log.error("❌ Error fetching stats: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/{application_id}")
@@ -433,12 +434,12 @@ async def delete_application(application_id: str, current_user: dict = Depends(g
         if result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Application not found")
         
-        print(f"✅ Application deleted: {application_id}")
+        log.info("✅ Application deleted: %s", application_id)
         return {"message": "Application deleted"}
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error deleting application: {e}")
+        log.error("❌ Error deleting application: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -511,8 +512,9 @@ async def mark_external_application(payload: ExternalApplyRequest, current_user:
                 "$inc": {"apply_count": 1}
             }
         )
+        invalidate_jobs_cache()
         
-        print(f"✅ External application marked: {job.get('title')} by user {user_id}")
+        log.info("✅ External application marked: %s by user %s", job.get('title'), user_id)
         
         return {
             "message": "Application marked successfully",
@@ -524,6 +526,6 @@ async def mark_external_application(payload: ExternalApplyRequest, current_user:
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error marking external application: {e}")
+        log.error("❌ Error marking external application: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, EmailStr
 from app.db import db
-from app.security import create_access_token, verify_password, get_password_hash, get_current_user
+from app.security import create_access_token, verify_and_update_password, get_password_hash, get_current_user
 from bson import ObjectId
 
 # ✅ NO /api prefix
@@ -29,10 +29,15 @@ async def login(credentials: UserLogin):
     
     user = await db.users.find_one({"email": credentials.email})
     
-    if not user or not verify_password(credentials.password, user.get("password", "")):
+    valid, new_hash = await verify_and_update_password(credentials.password, user.get("password", "")) if user else (False, None)
+    if not valid:
         print(f"❌ Invalid credentials for: {credentials.email}")
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
+    if new_hash:
+        # Upgrade legacy bcrypt hashes to argon2id now that we have the plaintext
+        await db.users.update_one({"_id": user["_id"]}, {"$set": {"password": new_hash}})
+    
     user_id = str(user["_id"]) if isinstance(user["_id"], ObjectId) else user["_id"]
     
     token = create_access_token(
@@ -64,9 +69,13 @@ async def admin_login(credentials: UserLogin):
     if user.get("role") != "admin":
         raise HTTPException(status_code=401, detail="Admin access required")
     
-    if not verify_password(credentials.password, user.get("password", "")):
+    valid, new_hash = await verify_and_update_password(credentials.password, user.get("password", ""))
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
+    if new_hash:
+        await db.users.update_one({"_id": user["_id"]}, {"$set": {"password": new_hash}})
+    
     user_id = str(user["_id"]) if isinstance(user["_id"], ObjectId) else user["_id"]
     
     token = create_access_token(
@@ -97,8 +106,9 @@ async def signup(user_data: UserCreate):
     new_user = {
         "name": user_data.name,
         "email": user_data.email,
-        "password": get_password_hash(user_data.password),
+        "password": await get_password_hash(user_data.password),
         "role": "user",
+        "unread_notifications": 0,  # Counter kept by the notifications router
         "created_at": datetime.utcnow()
     }
     
@@ -12,21 +12,31 @@ Uses Groq AI for generating questions and evaluating answers.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
+from difflib import SequenceMatcher
 from app.db import db
 from app.security import get_current_user
 from app.config import settings
 import google.generativeai as genai
-import json
-import re
+import asyncio
+import logging
+import orjson
+import random
 
-router = APIRouter(prefix="/interview", tags=["interview"])
+log = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/interview", tags=["interview"], default_response_class=ORJSONResponse)
 
 # Initialize Gemini
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
+# Shared model + concurrency gate so bursts of answers don't open a connection storm
+_GEMINI_MODEL = genai.GenerativeModel(settings.GEMINI_MODEL)
+_GEMINI_SEM = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+
 
 # Pydantic Models
 class InterviewStartRequest(BaseModel):
@@ -151,6 +161,13 @@ INTERVIEW_TEMPLATES = {
     }
 }
 
+# Freeze question pools once at import; /start samples straight from the tuples
+INTERVIEW_TEMPLATES = {
+    interview_type: {difficulty: tuple(pool) for difficulty, pool in pools.items()}
+    for interview_type, pools in INTERVIEW_TEMPLATES.items()
+}
+QUESTIONS_PER_INTERVIEW = 5
+
 
 @router.post("/start")
 async def start_interview(
@@ -180,8 +197,7 @@ async def start_interview(
         questions_pool = INTERVIEW_TEMPLATES[request.interview_type][request.difficulty]
         
         # Select 5 questions
-        import random
-        selected_questions = random.sample(questions_pool, min(5, len(questions_pool)))
+        selected_questions = random.sample(questions_pool, min(QUESTIONS_PER_INTERVIEW, len(questions_pool)))
         
         # Create interview session
         interview_doc = {
@@ -205,6 +221,9 @@ async def start_interview(
             "total_questions": len(selected_questions),
             "started_at": datetime.utcnow(),
             "completed_at": None,
+            # Running totals so completion never has to rewrite the questions array
+            "score_sum": 0,
+            "answered_count": 0,
             "overall_score": None,
             "overall_feedback": None
         }
@@ -212,7 +231,7 @@ async def start_interview(
         result = await db.interviews.insert_one(interview_doc)
         interview_id = str(result.inserted_id)
         
-        print(f"✅ Started {request.interview_type} interview for user {user_id}")
+        log.info("✅ Started %s interview for user %s", request.interview_type, user_id)
         
         return {
             "interview_id": interview_id,
@@ -229,7 +248,7 @@ async def start_interview(
         }
         
     except Exception as e:
-        print(f"❌ Error starting interview: {e}")
+        log.error("❌ Error starting interview: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -273,15 +292,31 @@ async def submit_answer(
         )
         
         # Update interview with answer and feedback
+        previous_feedback = question_data.get("feedback")
         interview["questions"][question_idx]["answer"] = request.answer
         interview["questions"][question_idx]["feedback"] = feedback
         
+        # Only the delta is applied so re-answering a question doesn't double count
+        score = feedback.get("score", 0)
+        score_delta = score - (previous_feedback or {}).get("score", 0)
+        answered_delta = 0 if previous_feedback else 1
+        
+        update_fields = {
+            f"questions.{question_idx}.answer": request.answer,
+            f"questions.{question_idx}.feedback": feedback
+        }
+        increments = {"score_sum": score_delta, "answered_count": answered_delta}
+        
         # Check if this was the last question
         is_last_question = request.question_number >= interview["total_questions"]
         
         if is_last_question:
-            # Calculate overall score
-            total_score = sum(q.get("feedback", {}).get("score", 0) for q in interview["questions"])
+            # Calculate overall score from the running total (older sessions predate it)
+            if "score_sum" in interview:
+                total_score = interview["score_sum"] + score_delta
+            else:
+                total_score = sum((q.get("feedback") or {}).get("score", 0) for q in interview["questions"])
+                increments["score_sum"] = total_score
             overall_score = total_score / interview["total_questions"]
             
             # Generate overall feedback
@@ -292,16 +327,17 @@ async def submit_answer(
                 {"_id": ObjectId(request.interview_id)},
                 {
                     "$set": {
-                        "questions": interview["questions"],
+                        **update_fields,
                         "status": "completed",
                         "completed_at": datetime.utcnow(),
                         "overall_score": round(overall_score, 1),
                         "overall_feedback": overall_feedback
-                    }
+                    },
+                    "$inc": increments
                 }
             )
             
-            print(f"✅ Completed interview {request.interview_id} with score {overall_score}")
+            log.info("✅ Completed interview %s with score %s", request.interview_id, overall_score)
             
             return {
                 "feedback": feedback,
@@ -318,9 +354,10 @@ async def submit_answer(
                 {"_id": ObjectId(request.interview_id)},
                 {
                     "$set": {
-                        f"questions.{question_idx}": interview["questions"][question_idx],
+                        **update_fields,
                         "current_question": request.question_number + 1
-                    }
+                    },
+                    "$inc": increments
                 }
             )
             
@@ -336,7 +373,7 @@ async def submit_answer(
             }
         
     except Exception as e:
-        print(f"❌ Error submitting answer: {e}")
+        log.error("❌ Error submitting answer: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -363,7 +400,7 @@ async def get_interview_history(
         }
         
     except Exception as e:
-        print(f"❌ Error fetching interview history: {e}")
+        log.error("❌ Error fetching interview history: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -390,11 +427,33 @@ async def get_interview_details(
         return interview
         
     except Exception as e:
-        print(f"❌ Error fetching interview: {e}")
+        log.error("❌ Error fetching interview: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Answers that get canned feedback without a Gemini round-trip
+TRIVIAL_ANSWERS = {"", "i don't know", "idk", "n/a"}
+MIN_ANSWER_WORDS = 8
+
+TRIVIAL_ANSWER_FEEDBACK = {
+    "score": 20,
+    "strengths": [],
+    "improvements": ["Answer too short/unclear"],
+    "detailed_feedback": "Please provide a substantive response."
+}
+
+
 # Helper Functions
+def is_trivial_answer(question: str, answer: str) -> bool:
+    """Cheap check for empty, one-liner, or copy-of-the-question answers"""
+    answer = answer.strip()
+    if answer.lower() in TRIVIAL_ANSWERS:
+        return True
+    if len(answer.split()) < MIN_ANSWER_WORDS:
+        return True
+    return SequenceMatcher(None, answer.lower(), question.strip().lower()).ratio() > 0.85
+
+
 async def generate_answer_feedback(
     question: str,
     answer: str,
@@ -403,6 +462,9 @@ async def generate_answer_feedback(
 ) -> Dict[str, Any]:
     """Generate AI feedback for an interview answer using Gemini"""
     
+    if is_trivial_answer(question, answer):
+        return dict(TRIVIAL_ANSWER_FEEDBACK)
+    
     try:
         prompt = f"""You are an expert interviewer evaluating a candidate's answer for a {job_role} position.
 
@@ -424,21 +486,21 @@ Respond in JSON format:
     "detailed_feedback": "detailed feedback text"
 }}"""
 
-        model = genai.GenerativeModel(settings.GEMINI_MODEL)
-        response = model.generate_content(prompt)
+        async with _GEMINI_SEM:
+            response = await _GEMINI_MODEL.generate_content_async(prompt)
         feedback_text = response.text.replace("```json", "").replace("```", "").strip()
         
         # Try to parse JSON
         try:
             # Extract JSON from potential partial text (find first { and last })
-            json_match = re.search(r'\{[\s\S]*\}', feedback_text)
-            if json_match:
-                feedback = json.loads(json_match.group(0))
+            start, end = feedback_text.find("{"), feedback_text.rfind("}")
+            if start != -1 and end > start:
+                feedback = orjson.loads(feedback_text[start:end + 1])
             else:
-                feedback = json.loads(feedback_text)
+                feedback = orjson.loads(feedback_text)
         except:
             # Fallback if JSON parsing fails
-            print(f"⚠️ JSON parsing failed for feedback: {feedback_text}")
+            log.warning("⚠️ JSON parsing failed for feedback: %s", feedback_text)
             feedback = {
                 "score": 70,
                 "strengths": ["Good attempt", "Shows understanding"],
@@ -449,7 +511,7 @@ Respond in JSON format:
         return feedback
         
     except Exception as e:
-        print(f"⚠️ Error generating feedback: {e}")
+        log.warning("⚠️ Error generating feedback: %s", e)
         # Return default feedback
         return {
             "score": 70,
@@ -1,21 +1,27 @@
-from datetime import datetime
+from datetime import datetime, timezone
+import logging
 import re
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
+from cachetools import TTLCache
 
 from app.db import db
 from app.security import require_role, get_current_user, get_current_user_optional
 from app.services.job_lifecycle import (
     cleanup_expired_jobs,
     log_job_event,
-    remove_deletion_mark,
     mark_job_for_deletion
 )
-from app.services.job_matcher import calculate_job_match
+from app.services.job_matcher import calculate_job_matches
 
-router = APIRouter(prefix="/jobs", tags=["Jobs"])
+log = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"], default_response_class=ORJSONResponse)
 
 
 # =========================
@@ -30,7 +36,7 @@ class JobCreate(BaseModel):
     job_type: str = "Full-time"
     description: str
     required_skills: List[str]
-    end_date: Optional[str] = None
+    end_date: Optional[datetime] = None
 
 
 class JobUpdate(BaseModel):
@@ -41,7 +47,75 @@ class JobUpdate(BaseModel):
     job_type: Optional[str] = None
     description: Optional[str] = None
     required_skills: Optional[List[str]] = None
-    end_date: Optional[str] = None
+    end_date: Optional[datetime] = None
+
+
+# =========================
+# Projections
+# =========================
+
+# Fields read by JobMatcher.calculate_match_score
+MATCH_FIELDS = {
+    "skills_required": 1,
+    "experience_level": 1,
+    "location": 1,
+    "remote_type": 1,
+    "salary_min": 1,
+    "salary_max": 1,
+    "salary_mid": 1,
+    "job_type": 1,
+    "category": 1
+}
+
+JOB_LIST_PROJECTION = {
+    **MATCH_FIELDS,
+    "title": 1,
+    "company": 1,
+    "salary": 1,
+    "description": 1,
+    "required_skills": 1,
+    "created_at": 1,
+    "end_date": 1,
+    "apply_count": 1,
+    "save_count": 1,
+    "source_platform": 1,
+    "job_url": 1,
+    "saved_by": 1,
+    "applied_by.user_id": 1
+}
+
+JOB_RECOMMENDATION_PROJECTION = {
+    **MATCH_FIELDS,
+    "title": 1,
+    "company": 1,
+    "salary": 1,
+    "required_skills": 1,
+    "created_at": 1
+}
+
+
+# =========================
+# List Cache
+# =========================
+
+# (category, remote_type, source_platform, user_id or "anon") -> list_jobs payload
+_jobs_cache = TTLCache(maxsize=512, ttl=30)
+
+
+def invalidate_jobs_cache(user_id: Optional[str] = None) -> None:
+    """
+    Drop cached job lists.
+    With a user_id only that user's entries are dropped (their resume or
+    preferences, and so their match scores, changed); without one the whole
+    cache is cleared. Anything that changes job data or the apply/save counts
+    every viewer sees must clear the whole cache.
+    """
+    if user_id is None:
+        _jobs_cache.clear()
+        return
+
+    for key in [k for k in list(_jobs_cache.keys()) if k[-1] == user_id]:
+        _jobs_cache.pop(key, None)
 
 
 # =========================
@@ -64,7 +138,13 @@ async def list_jobs(
         # 🔄 Run lifecycle cleanup in background
         background_tasks.add_task(cleanup_expired_jobs)
 
-        now = datetime.utcnow()
+        user_id = current_user.get("user_id") if current_user else None
+        cache_key = (category, remote_type, source_platform, user_id or "anon")
+        cached = _jobs_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        now = datetime.now(timezone.utc)
         query = {
             "$or": [
                 {"end_date": {"$gte": now}},
@@ -79,19 +159,20 @@ async def list_jobs(
         if source_platform:
             query["source_platform"] = source_platform
 
-        docs = await db.jobs.find(query).sort("created_at", -1).limit(100).to_list(100)
+        # Stream in batches so BSON decode overlaps with the next network batch
+        cursor = db.jobs.find(query, JOB_LIST_PROJECTION).sort("created_at", -1).limit(100).batch_size(50)
+
+        jobs = [job async for job in cursor]
+        matches = await calculate_job_matches(jobs, user_id, db, include_recommendations=False)
 
-        user_id = current_user.get("user_id") if current_user else None
         output = []
 
-        for job in docs:
+        for job, match_data in zip(jobs, matches):
             is_saved = user_id in job.get("saved_by", []) if user_id else False
             is_applied = any(
                 a.get("user_id") == user_id for a in job.get("applied_by", [])
             ) if user_id else False
 
-            match_data = await calculate_job_match(job, user_id, db)
-
             output.append({
                 "_id": str(job["_id"]),
                 "title": job.get("title"),
@@ -114,13 +195,13 @@ async def list_jobs(
                 "job_url": job.get("job_url")  # Added for external job applications
             })
 
-        print(f"✅ Returning {len(output)} jobs")  # Debug log
+        _jobs_cache[cache_key] = output
+
+        log.debug("✅ Returning %s jobs", len(output))
         return output
 
     except Exception as e:
-        print(f"❌ Error fetching jobs: {e}")  # Debug log
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Error fetching jobs: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -154,11 +235,11 @@ async def get_job_recommendations(
             skill_regexes = [re.compile(re.escape(skill), re.IGNORECASE) for skill in user_skills]
             query = {
                 "required_skills": {"$in": skill_regexes},
-                "end_date": {"$gte": datetime.utcnow()} # Only active jobs
+                "end_date": {"$gte": datetime.now(timezone.utc)} # Only active jobs
             }
         
         # 3. Get jobs
-        jobs = await db.jobs.find(query).sort("created_at", -1).limit(limit).to_list(limit)
+        jobs = await db.jobs.find(query, JOB_RECOMMENDATION_PROJECTION).sort("created_at", -1).limit(limit).to_list(limit)
         
         # 4. If few matches, fill with recent jobs
         if len(jobs) < limit:
@@ -168,19 +249,18 @@ async def get_job_recommendations(
             fallback_query = {
                 "_id": {"$nin": exclude_ids},
                  "$or": [
-                    {"end_date": {"$gte": datetime.utcnow()}},
+                    {"end_date": {"$gte": datetime.now(timezone.utc)}},
                     {"end_date": None}
                 ]
             }
             
-            recent_jobs = await db.jobs.find(fallback_query).sort("created_at", -1).limit(remaining).to_list(remaining)
+            recent_jobs = await db.jobs.find(fallback_query, JOB_RECOMMENDATION_PROJECTION).sort("created_at", -1).limit(remaining).to_list(remaining)
             jobs.extend(recent_jobs)
             
         # 5. Format output
+        matches = await calculate_job_matches(jobs, user_id, db, include_recommendations=False)
         output = []
-        for job in jobs:
-            match_data = await calculate_job_match(job, user_id, db)
-            
+        for job, match_data in zip(jobs, matches):
             output.append({
                 "_id": str(job["_id"]),
                 "title": job.get("title"),
@@ -196,7 +276,7 @@ async def get_job_recommendations(
         return output
 
     except Exception as e:
-        print(f"❌ Error getting recommendations: {e}")
+        log.error("❌ Error getting recommendations: %s", e)
         return []
 
 # =========================
@@ -205,10 +285,12 @@ async def get_job_recommendations(
 
 @router.get("/{job_id}")
 async def get_job(job_id: str, current_user: Optional[dict] = Depends(get_current_user_optional)):
-    if not ObjectId.is_valid(job_id):
+    try:
+        job_oid = ObjectId(job_id)
+    except (InvalidId, TypeError):
         raise HTTPException(status_code=400, detail="Invalid job ID")
 
-    job = await db.jobs.find_one({"_id": ObjectId(job_id)})
+    job = await db.jobs.find_one({"_id": job_oid})
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
@@ -242,54 +324,74 @@ async def get_job(job_id: str, current_user: Optional[dict] = Depends(get_curren
 # =========================
 
 @router.post("/{job_id}/save")
-async def save_job(job_id: str, current_user: dict = Depends(get_current_user)):
-    if not ObjectId.is_valid(job_id):
+async def save_job(
+    job_id: str,
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(get_current_user)
+):
+    try:
+        job_oid = ObjectId(job_id)
+    except (InvalidId, TypeError):
         raise HTTPException(status_code=400, detail="Invalid job ID")
-
     user_id = current_user["user_id"]
-    job = await db.jobs.find_one({"_id": ObjectId(job_id)})
 
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-
-    if user_id in job.get("saved_by", []):
-        return {"message": "Already saved"}
-
-    await db.jobs.update_one(
-        {"_id": ObjectId(job_id)},
+    # Guarded update: only matches if the user hasn't saved it yet
+    result = await db.jobs.update_one(
+        {"_id": job_oid, "saved_by": {"$ne": user_id}},
         {
-            "$push": {"saved_by": user_id},
+            "$addToSet": {"saved_by": user_id},
             "$inc": {"save_count": 1},
             "$unset": {"expires_at": ""}
         }
     )
 
-    await log_job_event(job_id, "saved", user_id)
-    await remove_deletion_mark(job_id)
+    if result.modified_count == 0:
+        if not await db.jobs.count_documents({"_id": job_oid}, limit=1):
+            raise HTTPException(status_code=404, detail="Job not found")
+        return {"message": "Already saved"}
+
+    # save_count is shown to every viewer, not just this user
+    invalidate_jobs_cache()
+
+    # expires_at is already unset by the update above; logging can happen after the response
+    background_tasks.add_task(log_job_event, job_id, "saved", user_id)
 
     return {"message": "Job saved successfully"}
 
 
 @router.post("/{job_id}/unsave")
-async def unsave_job(job_id: str, current_user: dict = Depends(get_current_user)):
-    if not ObjectId.is_valid(job_id):
+async def unsave_job(
+    job_id: str,
+    background_tasks: BackgroundTasks,
+    current_user: dict = Depends(get_current_user)
+):
+    try:
+        job_oid = ObjectId(job_id)
+    except (InvalidId, TypeError):
         raise HTTPException(status_code=400, detail="Invalid job ID")
-
     user_id = current_user["user_id"]
 
-    await db.jobs.update_one(
-        {"_id": ObjectId(job_id)},
+    # Guarded update: only matches (and decrements) if the user had saved it
+    job = await db.jobs.find_one_and_update(
+        {"_id": job_oid, "saved_by": user_id},
         {
             "$pull": {"saved_by": user_id},
             "$inc": {"save_count": -1}
-        }
+        },
+        projection={"saved_by": 1, "applied_by": 1},
+        return_document=ReturnDocument.AFTER
     )
 
-    await log_job_event(job_id, "unsaved", user_id)
+    if not job:
+        return {"message": "Job unsaved successfully"}
+
+    # save_count is shown to every viewer, not just this user
+    invalidate_jobs_cache()
 
-    job = await db.jobs.find_one({"_id": ObjectId(job_id)})
-    if job and not job.get("saved_by") and not job.get("applied_by"):
-        await mark_job_for_deletion(job_id, days=3)
+    background_tasks.add_task(log_job_event, job_id, "unsaved", user_id)
+
+    if not job.get("saved_by") and not job.get("applied_by"):
+        background_tasks.add_task(mark_job_for_deletion, job_id, days=3)
 
     return {"message": "Job unsaved successfully"}
 
@@ -300,10 +402,6 @@ async def unsave_job(job_id: str, current_user: dict = Depends(get_current_user)
 
 @router.post("/")
 async def create_job(payload: JobCreate, user: dict = Depends(require_role(["admin"]))):
-    end_date = None
-    if payload.end_date:
-        end_date = datetime.fromisoformat(payload.end_date.replace("Z", "+00:00"))
-
     new_job = {
         "title": payload.title.strip(),
         "company": payload.company.strip(),
@@ -312,8 +410,8 @@ async def create_job(payload: JobCreate, user: dict = Depends(require_role(["adm
         "job_type": payload.job_type,
         "description": payload.description.strip(),
         "required_skills": payload.required_skills,
-        "created_at": datetime.utcnow(),
-        "end_date": end_date,
+        "created_at": datetime.now(timezone.utc),
+        "end_date": payload.end_date,
         "created_by": user["user_id"],
         "applied_by": [],
         "saved_by": [],
@@ -323,6 +421,7 @@ async def create_job(payload: JobCreate, user: dict = Depends(require_role(["adm
     }
 
     result = await db.jobs.insert_one(new_job)
+    invalidate_jobs_cache()
     await log_job_event(str(result.inserted_id), "created", user["user_id"])
 
     return {"_id": str(result.inserted_id), "message": "Job created successfully"}
@@ -334,30 +433,39 @@ async def update_job(
     payload: JobUpdate,
     user: dict = Depends(require_role(["admin"]))
 ):
-    if not ObjectId.is_valid(job_id):
+    try:
+        job_oid = ObjectId(job_id)
+    except (InvalidId, TypeError):
         raise HTTPException(status_code=400, detail="Invalid job ID")
 
     update_data = {k: v for k, v in payload.dict().items() if v is not None}
 
-    if "end_date" in update_data:
-        update_data["end_date"] = datetime.fromisoformat(
-            update_data["end_date"].replace("Z", "+00:00")
-        )
-
-    update_data["updated_at"] = datetime.utcnow()
-
-    await db.jobs.update_one({"_id": ObjectId(job_id)}, {"$set": update_data})
+    await db.jobs.update_one(
+        {"_id": job_oid},
+        {"$set": update_data, "$currentDate": {"updated_at": True}}
+    )
+    invalidate_jobs_cache()
     return {"message": "Job updated successfully"}
 
 
 @router.delete("/{job_id}")
 async def delete_job(job_id: str, user: dict = Depends(require_role(["admin"]))):
-    if not ObjectId.is_valid(job_id):
+    try:
+        job_oid = ObjectId(job_id)
+    except (InvalidId, TypeError):
         raise HTTPException(status_code=400, detail="Invalid job ID")
 
-    result = await db.jobs.delete_one({"_id": ObjectId(job_id)})
-    if result.deleted_count == 0:
+    deleted = await db.jobs.find_one_and_delete(
+        {"_id": job_oid},
+        projection={"title": 1, "created_by": 1}
+    )
+    if not deleted:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    await log_job_event(job_id, "deleted", user["user_id"])
+    invalidate_jobs_cache()
+    # The deleted job's title/creator go into the audit event, since the job itself is gone
+    await log_job_event(
+        job_id, "deleted", user["user_id"],
+        details={"title": deleted.get("title"), "created_by": deleted.get("created_by")}
+    )
     return {"message": "Job deleted successfully"}
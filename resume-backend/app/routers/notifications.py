@@ -2,16 +2,82 @@
 Notifications Router
 Real-time notification system for users
 """
+import logging
 from fastapi import APIRouter, Depends, HTTPException
 from datetime import datetime
 from typing import List
+from collections import Counter
 from app.security import get_current_user
 from app.db import db
 from app.models import NotificationOut
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+log = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
+NOTIFICATION_PROJECTION = {
+    "user_id": 1,
+    "title": 1,
+    "message": 1,
+    "type": 1,
+    "action_url": 1,
+    "read": 1,
+    "created_at": 1
+}
+
+
+# users.unread_notifications is a denormalized counter kept in step with
+# every notification write below, so the badge count is a single _id lookup
+async def adjust_unread_count(user_id: str, delta: int):
+    """Add delta to the user's unread notification counter"""
+    if delta:
+        await db.users.update_one({"_id": ObjectId(user_id)}, {"$inc": {"unread_notifications": delta}})
+
+
+async def sync_unread_count(user_id: str) -> int:
+    """Recount the user's unread notifications and store the result"""
+    count = await db.notifications.count_documents({"user_id": user_id, "read": False})
+    await db.users.update_one({"_id": ObjectId(user_id)}, {"$set": {"unread_notifications": count}})
+    return count
+
+
+async def seed_unread_counters():
+    """
+    Backfill unread_notifications for users that predate the counter.
+    Runs at every startup, but only does the aggregation while some user still lacks the field.
+    """
+    try:
+        if not await db.users.count_documents({"unread_notifications": {"$exists": False}}, limit=1):
+            return
+        
+        pipeline = [
+            {"$match": {"read": False}},
+            {"$group": {"_id": "$user_id", "count": {"$sum": 1}}}
+        ]
+        ops = []
+        async for row in db.notifications.aggregate(pipeline):
+            if ObjectId.is_valid(row["_id"]):
+                ops.append(UpdateOne(
+                    {"_id": ObjectId(row["_id"]), "unread_notifications": {"$exists": False}},
+                    {"$set": {"unread_notifications": row["count"]}}
+                ))
+        if ops:
+            await db.users.bulk_write(ops, ordered=False)
+        
+        # Everyone else has nothing unread
+        await db.users.update_many(
+            {"unread_notifications": {"$exists": False}},
+            {"$set": {"unread_notifications": 0}}
+        )
+        log.info("✅ Unread notification counters seeded")
+        
+    except Exception as e:
+        log.error("❌ Error seeding unread notification counters: %s", e)
+
 
 @router.get("/", response_model=List[NotificationOut])
 async def get_notifications(
@@ -27,9 +93,11 @@ async def get_notifications(
         if unread_only:
             query["read"] = False
         
-        notifications = []
-        async for notif in db.notifications.find(query).sort("created_at", -1).limit(limit):
-            notifications.append({
+        cursor = db.notifications.find(query, NOTIFICATION_PROJECTION).sort("created_at", -1).limit(limit).batch_size(limit)
+        docs = await cursor.to_list(length=limit)
+        
+        return [
+            {
                 "id": str(notif["_id"]),
                 "user_id": notif["user_id"],
                 "title": notif["title"],
@@ -38,12 +106,12 @@ async def get_notifications(
                 "action_url": notif.get("action_url"),
                 "read": notif.get("read", False),
                 "created_at": notif["created_at"]
-            })
-        
-        return notifications
+            }
+            for notif in docs
+        ]
         
     except Exception as e:
-        print(f"❌ Error fetching notifications: {e}")
+        log.error("❌ Error fetching notifications: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -52,15 +120,17 @@ async def get_unread_count(current_user: dict = Depends(get_current_user)):
     """Get count of unread notifications"""
     try:
         user_id = current_user.get("user_id")
-        count = await db.notifications.count_documents({
-            "user_id": user_id,
-            "read": False
-        })
+        user = await db.users.find_one({"_id": ObjectId(user_id)}, {"unread_notifications": 1})
+        
+        if user is None or "unread_notifications" not in user:
+            count = await sync_unread_count(user_id)
+        else:
+            count = max(0, user["unread_notifications"])
         
         return {"unread_count": count}
         
     except Exception as e:
-        print(f"❌ Error counting notifications: {e}")
+        log.error("❌ Error counting notifications: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -70,24 +140,37 @@ async def mark_as_read(
     current_user: dict = Depends(get_current_user)
 ):
     """Mark notification as read"""
+    try:
+        notification_oid = ObjectId(notification_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid notification ID")
+    
     try:
         user_id = current_user.get("user_id")
         
+        # Only an unread -> read flip touches the counter
         result = await db.notifications.update_one(
             {
-                "_id": ObjectId(notification_id),
-                "user_id": user_id
+                "_id": notification_oid,
+                "user_id": user_id,
+                "read": False
             },
             {"$set": {"read": True}}
         )
         
-        if result.matched_count == 0:
+        if result.modified_count:
+            await adjust_unread_count(user_id, -1)
+        elif not await db.notifications.count_documents(
+            {"_id": notification_oid, "user_id": user_id}, limit=1
+        ):
             raise HTTPException(status_code=404, detail="Notification not found")
         
         return {"message": "Notification marked as read"}
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ Error marking notification as read: {e}")
+        log.error("❌ Error marking notification as read: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -101,6 +184,7 @@ async def mark_all_read(current_user: dict = Depends(get_current_user)):
             {"user_id": user_id, "read": False},
             {"$set": {"read": True}}
         )
+        await adjust_unread_count(user_id, -result.modified_count)
         
         return {
             "message": "All notifications marked as read",
@@ -108,7 +192,7 @@ async def mark_all_read(current_user: dict = Depends(get_current_user)):
         }
         
     except Exception as e:
-        print(f"❌ Error marking all notifications as read: {e}")
+        log.error("❌ Error marking all notifications as read: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -118,25 +202,54 @@ async def delete_notification(
     current_user: dict = Depends(get_current_user)
 ):
     """Delete a notification"""
+    try:
+        notification_oid = ObjectId(notification_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid notification ID")
+    
     try:
         user_id = current_user.get("user_id")
         
-        result = await db.notifications.delete_one({
-            "_id": ObjectId(notification_id),
-            "user_id": user_id
-        })
+        deleted = await db.notifications.find_one_and_delete(
+            {"_id": notification_oid, "user_id": user_id},
+            projection={"read": 1}
+        )
         
-        if result.deleted_count == 0:
+        if not deleted:
             raise HTTPException(status_code=404, detail="Notification not found")
         
+        if not deleted.get("read", False):
+            await adjust_unread_count(user_id, -1)
+        
         return {"message": "Notification deleted"}
         
+    except HTTPException:
+        raise
     except Exception as e:
-        print(f"❌ Error deleting notification: {e}")
+        log.error("❌ Error deleting notification: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# Helper function to create notifications (used by other routers)
+# Helper functions to create notifications (used by other routers)
+def build_notification(
+    user_id: str,
+    title: str,
+    message: str,
+    notification_type: str = "info",
+    action_url: str = None
+) -> dict:
+    """Build a notification document ready for insertion"""
+    return {
+        "user_id": user_id,
+        "title": title,
+        "message": message,
+        "type": notification_type,
+        "action_url": action_url,
+        "read": False,
+        "created_at": datetime.utcnow()
+    }
+
+
 async def create_notification(
     user_id: str,
     title: str,
@@ -146,21 +259,63 @@ async def create_notification(
 ):
     """Create a new notification for a user"""
     try:
-        notification = {
-            "user_id": user_id,
-            "title": title,
-            "message": message,
-            "type": notification_type,
-            "action_url": action_url,
-            "read": False,
-            "created_at": datetime.utcnow()
-        }
+        notification = build_notification(user_id, title, message, notification_type, action_url)
         
         await db.notifications.insert_one(notification)
-        print(f"✅ Notification created for user {user_id}: {title}")
+        await adjust_unread_count(user_id, 1)
+        log.info("✅ Notification created for user %s: %s", user_id, title)
+        
+    except Exception as e:
+        log.error("❌ Error creating notification: %s", e)
+
+
+async def create_notifications_bulk(notifications: List[dict]) -> int:
+    """
+    Create many notifications in a single round-trip (fan-out to many users).
+    
+    Args:
+        notifications: Documents from build_notification()
+        
+    Returns:
+        Number of notifications inserted
+    """
+    if not notifications:
+        return 0
+    
+    try:
+        failed_indexes = set()
+        try:
+            await db.notifications.insert_many(notifications, ordered=False)
+        except BulkWriteError as bwe:
+            for write_error in bwe.details.get("writeErrors", []):
+                failed_indexes.add(write_error["index"])
+                log.error("❌ Error creating notification: %s", write_error.get("errmsg"))
+        
+        # One $inc per user, all in a single bulk_write, for the notifications that landed
+        per_user = Counter(
+            n["user_id"] for index, n in enumerate(notifications) if index not in failed_indexes
+        )
+        ops = [
+            UpdateOne({"_id": ObjectId(user_id)}, {"$inc": {"unread_notifications": count}})
+            for user_id, count in per_user.items()
+            if ObjectId.is_valid(user_id)
+        ]
+        if ops:
+            await db.users.bulk_write(ops, ordered=False)
+        
+        inserted = len(notifications) - len(failed_indexes)
+        log.info("✅ Created %s notifications", inserted)
+        return inserted
         
     except Exception as e:
-        print(f"❌ Error creating notification: {e}")
+        log.error("❌ Error creating notifications: %s", e)
+        return 0
 
 
-__all__ = ["router", "create_notification"]
+__all__ = [
+    "router",
+    "build_notification",
+    "create_notification",
+    "create_notifications_bulk",
+    "seed_unread_counters"
+]
@@ -5,13 +5,19 @@ User Preferences Router
 Manages user job preferences for personalized job recommendations.
 """
 
+import logging
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
+from pymongo import ReturnDocument
 from typing import Optional
 from app.db import db
 from app.security import get_current_user
+from app.routers.jobs import invalidate_jobs_cache
+from app.services.job_matcher import invalidate_user_context
 from app.models import UserPreferences, PreferencesOut
 
+log = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/preferences", tags=["preferences"])
 
 
@@ -22,7 +28,10 @@ async def get_preferences(current_user: dict = Depends(get_current_user)):
         user_id = current_user.get("user_id")
         
         # Find user preferences
-        prefs_doc = await db.user_preferences.find_one({"user_id": user_id})
+        prefs_doc = await db.user_preferences.find_one(
+            {"user_id": user_id},
+            {"_id": 0, "preferences": 1, "updated_at": 1}
+        )
         
         if not prefs_doc:
             # Return default preferences
@@ -39,7 +48,7 @@ async def get_preferences(current_user: dict = Depends(get_current_user)):
         )
         
     except Exception as e:
-        print(f"❌ Error getting preferences: {e}")
+        log.error("❌ Error getting preferences: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -52,60 +61,30 @@ async def update_preferences(
     try:
         user_id = current_user.get("user_id")
         
-        # Validate job categories
-        valid_categories = [
-            "Data Science", "Machine Learning", "Frontend", "Backend",
-            "DevOps", "Mobile", "Full Stack", "Other"
-        ]
-        
-        for category in preferences.job_categories:
-            if category not in valid_categories:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid job category: {category}. Valid categories: {', '.join(valid_categories)}"
-                )
-        
-        # Validate remote preference
-        valid_remote = ["Remote", "Hybrid", "On-site", "Any"]
-        if preferences.remote_preference and preferences.remote_preference not in valid_remote:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid remote preference. Valid options: {', '.join(valid_remote)}"
-            )
-        
-        # Validate experience level
-        valid_experience = ["Entry", "Mid", "Senior", "Lead", None]
-        if preferences.experience_level and preferences.experience_level not in valid_experience:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid experience level. Valid options: Entry, Mid, Senior, Lead"
-            )
-        
-        # Update or insert preferences
-        prefs_data = {
-            "user_id": user_id,
-            "preferences": preferences.dict(),
-            "updated_at": datetime.utcnow()
-        }
-        
-        await db.user_preferences.update_one(
+        # Update or insert preferences (updated_at stamped by the server)
+        prefs_doc = await db.user_preferences.find_one_and_update(
             {"user_id": user_id},
-            {"$set": prefs_data},
-            upsert=True
+            {
+                "$set": {"user_id": user_id, "preferences": preferences.dict()},
+                "$currentDate": {"updated_at": True}
+            },
+            projection={"_id": 0, "updated_at": 1},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
         )
+        invalidate_jobs_cache(user_id)
+        invalidate_user_context(user_id)
         
-        print(f"✅ Preferences updated for user {user_id}")
+        log.info("✅ Preferences updated for user %s", user_id)
         
         return PreferencesOut(
             user_id=user_id,
             preferences=preferences,
-            updated_at=datetime.utcnow()
+            updated_at=prefs_doc["updated_at"]
         )
         
-    except HTTPException:
-        raise
     except Exception as e:
-        print(f"❌ Error updating preferences: {e}")
+        log.error("❌ Error updating preferences: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -116,13 +95,15 @@ async def reset_preferences(current_user: dict = Depends(get_current_user)):
         user_id = current_user.get("user_id")
         
         result = await db.user_preferences.delete_one({"user_id": user_id})
+        invalidate_jobs_cache(user_id)
+        invalidate_user_context(user_id)
         
         if result.deleted_count > 0:
-            print(f"✅ Preferences reset for user {user_id}")
+            log.info("✅ Preferences reset for user %s", user_id)
             return {"message": "Preferences reset to defaults"}
         else:
             return {"message": "No preferences to reset"}
         
     except Exception as e:
-        print(f"❌ Error resetting preferences: {e}")
+        log.error("❌ Error resetting preferences: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
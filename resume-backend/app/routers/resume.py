@@ -2,12 +2,69 @@ from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
 from datetime import datetime
 from app.db import db
 from app.security import get_current_user
-from app.utils import extract_text_from_pdf, extract_text_from_docx, extract_skills_experience_gemini, validate_resume_content
+from app.routers.jobs import invalidate_jobs_cache
+from app.services.job_matcher import invalidate_user_context
+from app.utils import extract_text_from_pdf, extract_text_from_docx, analyze_resume
+from app.process_pool import get_process_pool, call_with_deadline
 from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import DeleteMany, InsertOne
+from cachetools import TTLCache
+import asyncio
+import hashlib
+import logging
 import os
 
+log = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/resume", tags=["Resume"])
 
+MAX_RESUME_BYTES = 10 * 1024 * 1024  # 10 MB
+# Largest upload request body accepted (checked in main.py before the form is parsed);
+# the slack covers multipart boundaries and part headers
+MAX_UPLOAD_REQUEST_BYTES = MAX_RESUME_BYTES + 64 * 1024
+ALLOWED_CONTENT_TYPES = {
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/octet-stream",  # some browsers/clients send this for .docx
+}
+
+# pypdf / lxml parsing is CPU-bound - parse off the event loop, in the shared process pool
+EXTRACTION_TIMEOUT = 15  # Seconds of parsing an upload gets before the worker abandons it
+
+# Hot entries of db.resume_extractions: sha256(text) -> {"skills": [...], "experience": [...]}
+_analysis_cache = TTLCache(maxsize=256, ttl=300)
+
+
+async def get_cached_analysis(text_hash: str):
+    """Look up a previous AI analysis of identical resume text (memory, then Mongo)"""
+    cached = _analysis_cache.get(text_hash)
+    if cached is not None:
+        return cached
+    
+    doc = await db.resume_extractions.find_one({"_id": text_hash}, {"skills": 1, "experience": 1})
+    if not doc:
+        return None
+    
+    cached = {"skills": doc.get("skills", []), "experience": doc.get("experience", [])}
+    _analysis_cache[text_hash] = cached
+    return cached
+
+
+async def store_analysis(text_hash: str, validation: dict, skills: list, experience: list):
+    """Persist a successful analysis; expired by the TTL index on created_at"""
+    cached = {"skills": skills, "experience": experience}
+    _analysis_cache[text_hash] = cached
+    
+    try:
+        await db.resume_extractions.update_one(
+            {"_id": text_hash},
+            {"$set": {**cached, "validation": validation, "created_at": datetime.utcnow()}},
+            upsert=True
+        )
+    except Exception as e:
+        log.warning("⚠️ Failed to cache resume analysis: %s", e)
+
 @router.post("/upload")
 async def upload_resume(file: UploadFile = File(...), current_user: dict = Depends(get_current_user)):
     """Upload and analyze resume with Groq AI extraction"""
@@ -17,61 +74,87 @@ async def upload_resume(file: UploadFile = File(...), current_user: dict = Depen
         # Validate file type
         if not file.filename.lower().endswith(('.pdf', '.docx')):
             raise HTTPException(status_code=400, detail="Only PDF and DOCX files are allowed")
+        if file.content_type and file.content_type not in ALLOWED_CONTENT_TYPES:
+            raise HTTPException(status_code=400, detail="Only PDF and DOCX files are allowed")
         
-        # Read file content
+        # The form is already parsed and spooled by now (oversized bodies with a
+        # Content-Length were refused in main.py); check the size, then read it once
+        if file.size is not None and file.size > MAX_RESUME_BYTES:
+            raise HTTPException(status_code=413, detail="Resume too large (max 10MB)")
         content = await file.read()
         
-        # Extract text based on file type
-        if file.filename.lower().endswith('.pdf'):
-            text = extract_text_from_pdf(content)
-        else:
-            text = extract_text_from_docx(content)
+        # Extract text based on file type (in the process pool)
+        extractor = extract_text_from_pdf if file.filename.lower().endswith('.pdf') else extract_text_from_docx
+        # The deadline is enforced inside the worker, so a pathological file can't hold a pool slot
+        try:
+            text = await asyncio.get_running_loop().run_in_executor(
+                get_process_pool(), call_with_deadline, EXTRACTION_TIMEOUT, extractor, content
+            )
+        except TimeoutError:
+            log.warning("⚠️ Text extraction timed out for %s", file.filename)
+            raise HTTPException(status_code=422, detail="Resume took too long to read - please upload a simpler file")
         
         if not text or len(text.strip()) < 100:
             raise HTTPException(status_code=400, detail="Unable to extract text from resume or content too short")
         
-        print(f"📄 Extracted {len(text)} characters from {file.filename}")
-        
-        # Validate if it's actually a resume
-        validation = await validate_resume_content(text)
-        if not validation.get("is_resume", False):
-            raise HTTPException(
-                status_code=400,
-                detail=f"❌ Not a valid resume: {validation.get('reason', 'Unknown reason')}"
-            )
-        
-        print(f"✅ Resume validated: {validation.get('reason')}")
+        log.info("📄 Extracted %s characters from %s", len(text), file.filename)
         
-        # ✅ EXTRACT SKILLS AND EXPERIENCE USING GEMINI AI
-        extraction = await extract_skills_experience_gemini(text)
-        skills = extraction.get("skills", [])
-        experience = extraction.get("experience", [])
+        # Re-uploads of the same text reuse the earlier validation + extraction
+        text_hash = hashlib.sha256(text.encode()).hexdigest()
+        cached = await get_cached_analysis(text_hash)
         
-        print(f"✅ Extracted {len(skills)} skills and {len(experience)} experience entries")
-        print(f"Skills: {skills[:5]}")  # Debug log
-        print(f"Experience: {experience[:3]}")  # Debug log
-        
-        # Delete old resume if exists
-        await db.resumes.delete_many({"user_id": user_id})
+        if cached:
+            log.info("♻️ Reusing cached analysis for %s", file.filename)
+            skills = cached["skills"]
+            experience = cached["experience"]
+        else:
+            # ✅ VALIDATE AND EXTRACT SKILLS/EXPERIENCE IN ONE AI CALL
+            analysis = await analyze_resume(text)
+            validation = analysis["validation"]
+            if not validation.get("is_resume", False):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"❌ Not a valid resume: {validation.get('reason', 'Unknown reason')}"
+                )
+            
+            log.info("✅ Resume validated: %s", validation.get('reason'))
+            skills = analysis.get("skills", [])
+            experience = analysis.get("experience", [])
+            
+            # Don't pin keyword-fallback results (AI outage) for the cache lifetime
+            if not analysis.get("fallback"):
+                await store_analysis(text_hash, validation, skills, experience)
+        
+        log.info("✅ Extracted %s skills and %s experience entries", len(skills), len(experience))
+        log.debug("Skills: %s", skills[:5])
+        log.debug("Experience: %s", experience[:3])
         
         # Save new resume to database with extracted data
         resume_data = {
+            "_id": ObjectId(),
             "user_id": user_id,
             "filename": file.filename,
-            "text_content": text[:5000],  # Store first 5000 chars for reference
             "skills": skills,  # ✅ Save extracted skills
+            "skills_lower": [skill.lower() for skill in skills],  # Matched against every listed job - lowercase once here
             "experience": experience,  # ✅ Save extracted experience
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow()
         }
         
-        result = await db.resumes.insert_one(resume_data)
+        # Delete old resume(s) and insert the new one in a single wire message
+        await db.resumes.bulk_write(
+            [DeleteMany({"user_id": user_id}), InsertOne(resume_data)],
+            ordered=True
+        )
+        invalidate_jobs_cache(user_id)
+        invalidate_user_context(user_id)
         
-        print(f"✅ Resume saved with ID: {result.inserted_id}")
+        resume_id = resume_data["_id"]
+        log.info("✅ Resume saved with ID: %s", resume_id)
         
         return {
             "message": "Resume uploaded and analyzed successfully!",
-            "resume_id": str(result.inserted_id),
+            "resume_id": str(resume_id),
             "filename": file.filename,
             "skills": skills,  # ✅ Return extracted skills
             "experience": experience,  # ✅ Return extracted experience
@@ -81,9 +164,7 @@ async def upload_resume(file: UploadFile = File(...), current_user: dict = Depen
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error uploading resume: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ Error uploading resume: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to process resume: {str(e)}")
 
 @router.get("/me")
@@ -91,7 +172,10 @@ async def get_my_resume(current_user: dict = Depends(get_current_user)):
     """Get current user's resume"""
     try:
         user_id = current_user.get("user_id")
-        resume = await db.resumes.find_one({"user_id": user_id})
+        resume = await db.resumes.find_one(
+            {"user_id": user_id},
+            {"user_id": 1, "filename": 1, "skills": 1, "experience": 1, "created_at": 1, "updated_at": 1}
+        )
         
         if not resume:
             return {
@@ -111,7 +195,7 @@ async def get_my_resume(current_user: dict = Depends(get_current_user)):
             "updated_at": resume.get("updated_at")
         }
     except Exception as e:
-        print(f"❌ Error fetching resume: {e}")
+        log.error("❌ Error fetching resume: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/all")
@@ -119,43 +203,51 @@ async def get_all_resumes(current_user: dict = Depends(get_current_user)):
     """Get all resumes for current user"""
     try:
         user_id = current_user.get("user_id")
-        resumes = []
         
-        async for resume in db.resumes.find({"user_id": user_id}).sort("created_at", -1):
-            resumes.append({
+        docs = await db.resumes.find(
+            {"user_id": user_id},
+            {"filename": 1, "created_at": 1, "skills": 1, "experience": 1}
+        ).sort("created_at", -1).to_list(length=None)
+        
+        return [
+            {
                 "_id": str(resume.get("_id")),
                 "filename": resume.get("filename", ""),
                 "created_at": resume.get("created_at"),
                 "skills": resume.get("skills", []),
                 "experience": resume.get("experience", [])
-            })
-        
-        return resumes
+            }
+            for resume in docs
+        ]
     except Exception as e:
-        print(f"❌ Error fetching resumes: {e}")
+        log.error("❌ Error fetching resumes: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/{resume_id}")
 async def delete_resume(resume_id: str, current_user: dict = Depends(get_current_user)):
     """Delete a resume"""
     try:
-        if not ObjectId.is_valid(resume_id):
+        try:
+            resume_oid = ObjectId(resume_id)
+        except (InvalidId, TypeError):
             raise HTTPException(status_code=400, detail="Invalid resume ID")
         
         user_id = current_user.get("user_id")
         
-        result = await db.resumes.delete_one({
-            "_id": ObjectId(resume_id),
-            "user_id": user_id
-        })
+        deleted = await db.resumes.find_one_and_delete(
+            {"_id": resume_oid, "user_id": user_id},
+            projection={"filename": 1}
+        )
         
-        if result.deleted_count == 0:
+        if not deleted:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        print(f"✅ Resume deleted: {resume_id}")
+        invalidate_jobs_cache(user_id)
+        invalidate_user_context(user_id)
+        log.info("✅ Resume deleted: %s (%s)", resume_id, deleted.get('filename', ''))
         return {"message": "Resume deleted successfully"}
     except HTTPException:
         raise
     except Exception as e:
-        print(f"❌ Error deleting resume: {e}")
+        log.error("❌ Error deleting resume: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,116 @@
+# app/scrapers/_patterns.py
+"""
+Shared matching constants for the scrapers
+
+Keyword tables, compiled regexes and Aho-Corasick automata used by the
+normalizers and the per-platform parsers. Everything here is built once at
+import, so the hot paths only ever run precompiled matchers.
+"""
+
+import re
+from typing import List
+import ahocorasick
+
+
+# Normalization keywords. Multi-word / hyphenated phrases are stored as
+# space-joined bigrams ("front-end" -> "front end") and matched the same way.
+TOKEN_RE = re.compile(r"[a-z0-9+]+")
+
+REMOTE_TERMS = frozenset({"remote", "remotely", "anywhere", "wfh", "from home"})
+HYBRID_TERMS = frozenset({"hybrid", "flexible"})
+
+FULL_TIME_TERMS = frozenset({"full", "fulltime"})
+PART_TIME_TERMS = frozenset({"part", "parttime"})
+CONTRACT_TERMS = frozenset({"contract", "contractor", "contracts", "contractual"})
+INTERNSHIP_TERMS = frozenset({"intern", "interns", "internship", "internships"})
+
+ENTRY_TERMS = frozenset({"entry", "junior", "graduate", "0 2"})
+MID_TERMS = frozenset({"mid", "intermediate", "2 5", "3 5"})
+SENIOR_TERMS = frozenset({"senior", "5+", "7+", "experienced"})
+LEAD_TERMS = frozenset({"lead", "principal", "staff", "architect"})
+
+# Earlier entries take priority when several categories match
+CATEGORY_TERMS = (
+    ("Machine Learning", frozenset({"data scientist", "machine learning", "ml engineer", "ai engineer", "deep learning"})),
+    ("Data Science", frozenset({"data analyst", "data engineer", "analytics"})),
+    ("Frontend", frozenset({"frontend", "front end", "react", "vue", "angular"})),
+    ("Backend", frozenset({"backend", "back end", "api", "apis", "server"})),
+    ("Full Stack", frozenset({"full stack", "fullstack"})),
+    ("Mobile", frozenset({"mobile", "ios", "android", "react native", "flutter"})),
+    ("DevOps", frozenset({"devops", "sre", "infrastructure", "cloud engineer", "kubernetes", "docker"})),
+)
+
+
+def term_set(text: str) -> set:
+    """Lowercase word tokens plus adjacent-word bigrams of text"""
+    tokens = TOKEN_RE.findall(text.lower())
+    return set(tokens).union(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+
+
+def _build_category_automaton() -> ahocorasick.Automaton:
+    """Aho-Corasick automaton over all category keywords -> (priority, category)"""
+    automaton = ahocorasick.Automaton()
+    for priority, (category, keywords) in enumerate(CATEGORY_TERMS):
+        for keyword in keywords:
+            # Space-padded so matches land on whole words of the token stream
+            automaton.add_word(f" {keyword} ", (priority, category))
+    automaton.make_automaton()
+    return automaton
+
+
+CATEGORY_AUTOMATON = _build_category_automaton()
+
+# Skills picked up locally when a scraper supplied too few
+LOCAL_SKILLS = (
+    "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust", "Ruby", "PHP",
+    "Swift", "Kotlin", "Scala", "SQL", "React", "Vue", "Angular", "Node.js", "Django",
+    "Flask", "FastAPI", "Spring", "GraphQL", "AWS", "Azure", "GCP", "Docker",
+    "Kubernetes", "Terraform", "PostgreSQL", "MongoDB", "MySQL", "Redis", "Kafka",
+    "Spark", "TensorFlow", "PyTorch", "Machine Learning", "DevOps"
+)
+
+
+def build_skill_automaton(skills) -> ahocorasick.Automaton:
+    """Aho-Corasick automaton mapping each lowercased skill to (length, canonical name)"""
+    automaton = ahocorasick.Automaton()
+    for skill in skills:
+        automaton.add_word(skill.lower(), (len(skill), skill))
+    automaton.make_automaton()
+    return automaton
+
+
+LOCAL_SKILL_AUTOMATON = build_skill_automaton(LOCAL_SKILLS)
+
+
+def extract_skills(text: str, automaton: ahocorasick.Automaton = None) -> List[str]:
+    """
+    Skills from a build_skill_automaton() automaton (LOCAL_SKILLS by default)
+    mentioned in text as whole words, in order of appearance.
+    
+    One pass over the lowercased text; only the (few) raw hits are checked for
+    word boundaries, so "java" doesn't match inside "javascript" nor "go"
+    inside "google", while "c++" and "node.js" still match.
+    """
+    if automaton is None:
+        automaton = LOCAL_SKILL_AUTOMATON
+    text = text.lower()
+    found = {}
+    for end, (length, skill) in automaton.iter(text):
+        start = end - length + 1
+        if start > 0 and text[start - 1].isalnum():
+            continue
+        if end + 1 < len(text) and text[end + 1].isalnum():
+            continue
+        found.setdefault(skill, None)
+    return list(found)
+
+
+# "$120,000 - $150,000", "$100K - $120K", "$45.50 to $60 an hour", "$90,000":
+# min, its K suffix, (optional) max and its K suffix captured in one match;
+# cents are matched but left out of the groups
+SALARY_PATTERN = re.compile(
+    r"\$?(\d{1,3}(?:,\d{3})*)(?:\.\d{2})?([kK])?"
+    r"(?:\s*(?:-|\u2013|to)\s*\$?(\d{1,3}(?:,\d{3})*)(?:\.\d{2})?([kK])?)?"
+)
+# Pay quoted per hour/day/week/month ("$45 an hour", "$30/hr") - not an annual salary
+NON_ANNUAL_PAY_PATTERN = re.compile(r"\b(?:hours?|hourly|hr|days?|daily|weeks?|weekly|months?|monthly)\b", re.IGNORECASE)
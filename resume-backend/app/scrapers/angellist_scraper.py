@@ -6,10 +6,103 @@ AngelList rebranded to Wellfound for their job platform.
 This scraper uses HTML parsing to extract startup jobs.
 """
 
+import logging
 from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-import re
-from app.scrapers.base_scraper import BaseScraper
+from datetime import datetime, timezone
+import copy
+from selectolax.parser import HTMLParser
+from urllib.parse import urljoin
+from app.scrapers.base_scraper import BaseScraper, normalize_job
+from app.scrapers._patterns import build_skill_automaton, extract_skills
+
+log = logging.getLogger(__name__)
+
+
+COMMON_SKILLS = (
+    "Python", "JavaScript", "TypeScript", "Java", "Go", "Rust", "Ruby",
+    "React", "Vue", "Angular", "Node.js", "Django", "Flask", "FastAPI",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "PostgreSQL", "MongoDB",
+    "Machine Learning", "AI", "DevOps", "Frontend", "Backend", "Full Stack"
+)
+
+SKILL_AUTOMATON = build_skill_automaton(COMMON_SKILLS)
+
+
+# Sample jobs for demonstration
+_SAMPLE_JOBS_RAW = [
+    {
+        "title": "Full Stack Engineer",
+        "company": "TechStartup Inc",
+        "location": "Remote",
+        "remote_type": "Remote",
+        "job_type": "Full-time",
+        "salary_min": 100000,
+        "salary_max": 150000,
+        "currency": "USD",
+        "skills": ["React", "Node.js", "TypeScript", "PostgreSQL", "AWS"],
+        "experience": "Mid",
+        "description": "Join our fast-growing startup as a full stack engineer...",
+        "url": "https://wellfound.com/jobs/example-1"
+    },
+    {
+        "title": "Senior Backend Engineer",
+        "company": "AI Startup",
+        "location": "San Francisco, CA",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 130000,
+        "salary_max": 180000,
+        "currency": "USD",
+        "skills": ["Python", "FastAPI", "PostgreSQL", "Redis", "Docker"],
+        "experience": "Senior",
+        "description": "Build scalable backend systems for our AI platform...",
+        "url": "https://wellfound.com/jobs/example-2"
+    },
+    {
+        "title": "Frontend Engineer - React",
+        "company": "FinTech Startup",
+        "location": "Remote",
+        "remote_type": "Remote",
+        "job_type": "Full-time",
+        "salary_min": 110000,
+        "salary_max": 160000,
+        "currency": "USD",
+        "skills": ["React", "TypeScript", "CSS", "GraphQL", "Jest"],
+        "experience": "Mid",
+        "description": "Create beautiful user experiences for our fintech platform...",
+        "url": "https://wellfound.com/jobs/example-3"
+    },
+    {
+        "title": "Machine Learning Engineer",
+        "company": "ML Startup",
+        "location": "Remote",
+        "remote_type": "Remote",
+        "job_type": "Full-time",
+        "salary_min": 120000,
+        "salary_max": 170000,
+        "currency": "USD",
+        "skills": ["Python", "TensorFlow", "PyTorch", "Kubernetes", "MLOps"],
+        "experience": "Senior",
+        "description": "Build ML models that power our product...",
+        "url": "https://wellfound.com/jobs/example-4"
+    },
+    {
+        "title": "DevOps Engineer",
+        "company": "Cloud Startup",
+        "location": "Austin, TX",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 115000,
+        "salary_max": 155000,
+        "currency": "USD",
+        "skills": ["Kubernetes", "Terraform", "AWS", "Python", "CI/CD"],
+        "experience": "Mid",
+        "description": "Manage our cloud infrastructure and deployment pipelines...",
+        "url": "https://wellfound.com/jobs/example-5"
+    }
+]
+
+_SAMPLE_JOBS_NORMALIZED = [normalize_job(job, "AngelList", None) for job in _SAMPLE_JOBS_RAW]
 
 
 class AngelListScraper(BaseScraper):
@@ -40,7 +133,7 @@ class AngelListScraper(BaseScraper):
         """
         
         try:
-            print(f"🔍 Fetching jobs from AngelList/Wellfound...")
+            log.info("Fetching jobs from AngelList/Wellfound...")
             
             # Set headers
             headers = {
@@ -49,36 +142,36 @@ class AngelListScraper(BaseScraper):
             }
             
             # Fetch the search results page
-            html = await self.fetch_with_retry(self.search_url, headers=headers)
+            html = await self.fetch_with_retry(self.search_url, headers=headers, as_bytes=True)
             
             if not html:
-                print("⚠️ Failed to fetch AngelList page, using sample data")
+                log.warning("Failed to fetch AngelList page, using sample data")
                 return self._get_sample_jobs(limit)
             
             # Parse HTML
-            soup = BeautifulSoup(html, 'html.parser')
+            tree = HTMLParser(html)
             
             # Find job listings (selectors may need updating)
-            job_cards = soup.find_all('div', class_='job-listing')
+            job_cards = tree.css("div.job-listing")
             
             if not job_cards:
                 # Try alternative selectors
-                job_cards = soup.find_all('a', href=re.compile(r'/jobs/'))
+                job_cards = tree.css("a[href*='/jobs/']")
             
             if not job_cards or len(job_cards) == 0:
-                print("⚠️ No job cards found, using sample data")
+                log.warning("No job cards found, using sample data")
                 return self._get_sample_jobs(limit)
             
-            normalized_jobs = []
+            raw_jobs = []
             
             for card in job_cards[:limit]:
                 try:
                     # Extract job details
-                    title = card.get_text(strip=True) if hasattr(card, 'get_text') else "Unknown"
+                    title = card.text(strip=True) or "Unknown"
                     
                     # Build job URL
-                    href = card.get('href', '') if hasattr(card, 'get') else ''
-                    job_url = self.base_url + href if href and not href.startswith('http') else href
+                    href = card.attributes.get('href') or ''
+                    job_url = urljoin(self.base_url, href) if href else href
                     
                     # Create raw data dict with defaults
                     raw_data = {
@@ -96,124 +189,40 @@ class AngelListScraper(BaseScraper):
                         "url": job_url or f"{self.base_url}/jobs/example"
                     }
                     
-                    # Normalize and add to list
-                    normalized_job = self.normalize_job_data(raw_data)
-                    normalized_jobs.append(normalized_job)
+                    raw_jobs.append(raw_data)
                     
                 except Exception as e:
-                    print(f"❌ Error parsing AngelList job: {e}")
+                    log.error("Error parsing AngelList job: %s", e)
                     continue
             
+            # Normalize the whole batch off the event loop
+            normalized_jobs = await self.normalize_jobs(raw_jobs)
+            
             if len(normalized_jobs) == 0:
-                print("⚠️ Parsing failed, using sample data")
+                log.warning("Parsing failed, using sample data")
                 return self._get_sample_jobs(limit)
             
-            print(f"✅ AngelList: Parsed {len(normalized_jobs)} jobs")
+            log.info("AngelList: Parsed %d jobs", len(normalized_jobs))
             return normalized_jobs
             
-        except Exception as e:
-            print(f"❌ AngelList scraping error: {e}")
-            print("⚠️ Returning sample data for demonstration")
+        except Exception:
+            log.exception("AngelList scraping error")
+            log.warning("Returning sample data for demonstration")
             return self._get_sample_jobs(limit)
     
     def _get_sample_jobs(self, limit: int) -> List[Dict[str, Any]]:
         """Return sample startup jobs for demonstration"""
-        sample_jobs = [
-            {
-                "title": "Full Stack Engineer",
-                "company": "TechStartup Inc",
-                "location": "Remote",
-                "remote_type": "Remote",
-                "job_type": "Full-time",
-                "salary_min": 100000,
-                "salary_max": 150000,
-                "currency": "USD",
-                "skills": ["React", "Node.js", "TypeScript", "PostgreSQL", "AWS"],
-                "experience": "Mid",
-                "description": "Join our fast-growing startup as a full stack engineer...",
-                "url": "https://wellfound.com/jobs/example-1"
-            },
-            {
-                "title": "Senior Backend Engineer",
-                "company": "AI Startup",
-                "location": "San Francisco, CA",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 130000,
-                "salary_max": 180000,
-                "currency": "USD",
-                "skills": ["Python", "FastAPI", "PostgreSQL", "Redis", "Docker"],
-                "experience": "Senior",
-                "description": "Build scalable backend systems for our AI platform...",
-                "url": "https://wellfound.com/jobs/example-2"
-            },
-            {
-                "title": "Frontend Engineer - React",
-                "company": "FinTech Startup",
-                "location": "Remote",
-                "remote_type": "Remote",
-                "job_type": "Full-time",
-                "salary_min": 110000,
-                "salary_max": 160000,
-                "currency": "USD",
-                "skills": ["React", "TypeScript", "CSS", "GraphQL", "Jest"],
-                "experience": "Mid",
-                "description": "Create beautiful user experiences for our fintech platform...",
-                "url": "https://wellfound.com/jobs/example-3"
-            },
-            {
-                "title": "Machine Learning Engineer",
-                "company": "ML Startup",
-                "location": "Remote",
-                "remote_type": "Remote",
-                "job_type": "Full-time",
-                "salary_min": 120000,
-                "salary_max": 170000,
-                "currency": "USD",
-                "skills": ["Python", "TensorFlow", "PyTorch", "Kubernetes", "MLOps"],
-                "experience": "Senior",
-                "description": "Build ML models that power our product...",
-                "url": "https://wellfound.com/jobs/example-4"
-            },
-            {
-                "title": "DevOps Engineer",
-                "company": "Cloud Startup",
-                "location": "Austin, TX",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 115000,
-                "salary_max": 155000,
-                "currency": "USD",
-                "skills": ["Kubernetes", "Terraform", "AWS", "Python", "CI/CD"],
-                "experience": "Mid",
-                "description": "Manage our cloud infrastructure and deployment pipelines...",
-                "url": "https://wellfound.com/jobs/example-5"
-            }
-        ]
-        
-        normalized_jobs = []
-        for job_data in sample_jobs[:limit]:
-            normalized_job = self.normalize_job_data(job_data)
-            normalized_jobs.append(normalized_job)
+        # Normalized once at import; hand out fresh copies with a current created_at
+        created_at = self._batch_time or datetime.now(timezone.utc)
+        normalized_jobs = copy.deepcopy(_SAMPLE_JOBS_NORMALIZED[:limit])
+        for job in normalized_jobs:
+            job["created_at"] = created_at
         
         return normalized_jobs
     
     def _extract_skills_from_title(self, title: str) -> List[str]:
-        """Extract skills from job title"""
-        skills = []
-        common_skills = [
-            "Python", "JavaScript", "TypeScript", "Java", "Go", "Rust", "Ruby",
-            "React", "Vue", "Angular", "Node.js", "Django", "Flask", "FastAPI",
-            "AWS", "Azure", "GCP", "Docker", "Kubernetes", "PostgreSQL", "MongoDB",
-            "Machine Learning", "AI", "DevOps", "Frontend", "Backend", "Full Stack"
-        ]
-        
-        title_lower = title.lower()
-        for skill in common_skills:
-            if skill.lower() in title_lower:
-                skills.append(skill)
-        
-        return skills
+        """Extract skills from job title (single Aho-Corasick pass)"""
+        return extract_skills(title, SKILL_AUTOMATON)
 
 
 # Example usage
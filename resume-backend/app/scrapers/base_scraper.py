@@ -11,79 +11,247 @@ Provides common functionality for all job scrapers:
 """
 
 import asyncio
+import copy
+import hashlib
+import logging
+import random
 import httpx
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple, Union, AsyncIterator, Callable
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from abc import ABC, abstractmethod
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from pybloom_live import ScalableBloomFilter
+from aiolimiter import AsyncLimiter
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from app.process_pool import get_process_pool, PROCESS_POOL_WORKERS
+from app.services.job_matcher import salary_midpoint
+from app.scrapers._patterns import (
+    TOKEN_RE, REMOTE_TERMS, HYBRID_TERMS, FULL_TIME_TERMS, PART_TIME_TERMS, CONTRACT_TERMS,
+    INTERNSHIP_TERMS, ENTRY_TERMS, MID_TERMS, SENIOR_TERMS, LEAD_TERMS, CATEGORY_AUTOMATON,
+    term_set, extract_skills
+)
+
+log = logging.getLogger(__name__)
+
+
+# Query params that identify the posting on hosts that carry the job id in the query
+_HOST_QUERY_ALLOWLIST = {
+    "linkedin.com": frozenset({"currentJobId"}),
+    "indeed.com": frozenset({"jk", "vjk"}),
+    "glassdoor.com": frozenset({"jl"}),
+}
+# Dropped everywhere else (utm_* is handled by prefix)
+_TRACKING_PARAMS = frozenset({"trk", "trkinfo", "ref", "refid", "src", "source", "from", "fbclid", "gclid", "trackingid"})
+
+
+def canonicalize_job_url(url: str) -> str:
+    """Lowercase scheme/host, drop the fragment and tracking params, sort what's left"""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    
+    allowlist = next((keys for domain, keys in _HOST_QUERY_ALLOWLIST.items() if host == domain or host.endswith("." + domain)), None)
+    if allowlist is not None:
+        params = [(k, v) for k, v in params if k in allowlist]
+    else:
+        params = [(k, v) for k, v in params if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS]
+    
+    return urlunsplit((parts.scheme.lower(), host, parts.path, urlencode(sorted(params)), ""))
+
+
+def job_fingerprint(title: str, company: str, location: str) -> Optional[str]:
+    """
+    Fallback identity for the same posting reached through different URLs.
+    None without a real company: title + defaulted company/location ("Unknown",
+    "Remote") would match unrelated postings and drop them as duplicates.
+    """
+    if not company or company.strip().lower() == "unknown":
+        return None
+    key = "|".join(" ".join((part or "").lower().split()) for part in (title, company, location))
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+# Fields load_url_filter reads; legacy jobs also need what job_fingerprint hashes
+LEGACY_URL_PROJECTION = {"job_url": 1, "job_url_raw": 1, "fingerprint": 1, "title": 1, "company": 1, "location": 1}
+LEGACY_BACKFILL_BATCH = 1000
+
+
+def _legacy_url_update(doc: Dict[str, Any], canonical_url: str, fingerprint: Optional[str]) -> UpdateOne:
+    """Update giving a pre-canonicalization job its canonical job_url, raw URL and fingerprint"""
+    fields = {"job_url": canonical_url}
+    if fingerprint:
+        fields["fingerprint"] = fingerprint
+    if not doc.get("job_url_raw"):
+        fields["job_url_raw"] = doc["job_url"]
+    return UpdateOne({"_id": doc["_id"]}, {"$set": fields})
+
+
+# Retry policy for fetch_with_retry - only transient statuses are retried
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+RETRY_BACKOFF_BASE = 0.5
+RETRY_BACKOFF_CAP = 20
+MAX_RETRY_AFTER = 60
+
+# Category keywords almost always appear early in a posting; only this much of
+# the description is scanned (and used as the cache key) when categorizing
+CATEGORY_SCAN_CHARS = 1024
+
+# Jobs with at least this many skills (plus a category and experience level)
+# are stored without the Gemini enhancement round trip
+MIN_LOCAL_SKILLS = 3
+
 
 
 class BaseScraper(ABC):
     """Base class for all job scrapers"""
     
+    # One pooled client shared by every scraper, so keep-alive connections
+    # (and their TLS sessions) are reused across requests and platforms
+    _client: Optional[httpx.AsyncClient] = None
+    _client_lock = asyncio.Lock()
+    
+    # Bloom filter of every stored job_url (canonicalized), shared by all scrapers.
+    # A miss means "definitely new" and skips Mongo; a hit is confirmed in Mongo.
+    _url_filter: Optional[ScalableBloomFilter] = None
+    _url_filter_lock = asyncio.Lock()
+    
+    # Seconds the orchestrator allows one scrape_and_store run (None: its default)
+    scrape_timeout: Optional[int] = None
+    
     def __init__(
         self,
         platform_name: str,
         max_requests_per_minute: int = 30,
-        timeout: int = 30
+        timeout: int = 30,
+        max_concurrent_requests: int = 8
     ):
         self.platform_name = platform_name
         self.max_requests_per_minute = max_requests_per_minute
         self.timeout = timeout
-        self.request_count = 0
-        self.last_request_time = datetime.utcnow()
-        
-    async def rate_limit(self):
-        """Implement rate limiting"""
-        self.request_count += 1
-        
-        # Reset counter every minute
-        now = datetime.utcnow()
-        if (now - self.last_request_time).seconds >= 60:
-            self.request_count = 0
-            self.last_request_time = now
-        
-        # Wait if exceeded rate limit
-        if self.request_count >= self.max_requests_per_minute:
-            wait_time = 60 - (now - self.last_request_time).seconds
-            if wait_time > 0:
-                print(f"[WAIT] Rate limit reached for {self.platform_name}, waiting {wait_time}s...")
-                await asyncio.sleep(wait_time)
-                self.request_count = 0
-                self.last_request_time = datetime.utcnow()
+        # Token bucket: max_requests_per_minute spread smoothly over each minute
+        self.limiter = AsyncLimiter(max_requests_per_minute, 60)
+        # The limiter caps the average rate; the gate caps requests in flight at once
+        self._gate = asyncio.BoundedSemaphore(max_concurrent_requests)
+        self._batch_time: Optional[datetime] = None  # Shared created_at for the current scrape_and_store run
+    
+    @classmethod
+    async def get_client(cls) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if cls._client is None or cls._client.is_closed:
+            async with cls._client_lock:
+                if cls._client is None or cls._client.is_closed:
+                    # HTTP/2 needs the h2 package (httpx[http2] in requirements.txt).
+                    # Transport-level retries stay off - fetch_with_retry owns retry policy.
+                    transport = httpx.AsyncHTTPTransport(
+                        http2=True,
+                        retries=0,
+                        limits=httpx.Limits(
+                            max_connections=200,
+                            max_keepalive_connections=100,
+                            keepalive_expiry=30
+                        )
+                    )
+                    BaseScraper._client = httpx.AsyncClient(transport=transport)
+        return BaseScraper._client
+    
+    @classmethod
+    async def close_client(cls):
+        """Close the shared HTTP client (app shutdown)"""
+        if BaseScraper._client is not None:
+            await BaseScraper._client.aclose()
+            BaseScraper._client = None
+    
+    @staticmethod
+    def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+        """Exponential backoff with full jitter, or the server's Retry-After (seconds or HTTP-date) if given"""
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), MAX_RETRY_AFTER)
+            except ValueError:
+                pass
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return min(max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0), MAX_RETRY_AFTER)
+            except (TypeError, ValueError):
+                pass  # Unparseable - fall back to jittered backoff
+        return random.uniform(0, min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt))
     
     async def fetch_with_retry(
         self,
         url: str,
         max_retries: int = 3,
-        headers: Optional[Dict[str, str]] = None
-    ) -> Optional[str]:
-        """Fetch URL with retry logic"""
+        headers: Optional[Dict[str, str]] = None,
+        as_bytes: bool = False
+    ) -> Optional[Union[str, bytes]]:
+        """
+        Fetch URL with retry logic.
+        
+        Args:
+            as_bytes: Return the raw body, skipping the bytes -> str decode
+                (for parsers such as selectolax that take bytes directly)
+        """
         
         for attempt in range(max_retries):
             try:
-                await self.rate_limit()
-                
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(url, headers=headers or {})
-                    response.raise_for_status()
-                    return response.text
+                client = await self.get_client()
+                async with self._gate, self.limiter:
+                    response = await client.get(url, headers=headers or {}, timeout=self.timeout)
+                response.raise_for_status()
+                return response.content if as_bytes else response.text
                     
             except httpx.HTTPStatusError as e:
-                print(f"[ERROR] HTTP error {e.response.status_code} for {url} (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                else:
+                status = e.response.status_code
+                log.warning("HTTP error %s for %s (attempt %d/%d)", status, url, attempt + 1, max_retries)
+                if status not in RETRYABLE_STATUSES or attempt >= max_retries - 1:
                     return None
+                await asyncio.sleep(self._retry_delay(attempt, e.response.headers.get("Retry-After")))
                     
-            except Exception as e:
-                print(f"[ERROR] Error fetching {url}: {e} (attempt {attempt + 1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                else:
+            except httpx.TransportError as e:
+                # Timeouts, resets, DNS/connect failures - transient, back off and retry
+                log.warning("Error fetching %s: %s (attempt %d/%d)", url, e, attempt + 1, max_retries)
+                if attempt >= max_retries - 1:
                     return None
+                await asyncio.sleep(self._retry_delay(attempt))
+            
+            except Exception as e:
+                # Anything else (bad URL, decode error) won't fix itself on retry
+                log.error("Error fetching %s: %s", url, e)
+                return None
         
         return None
     
+    async def fetch_stream(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 64 * 1024
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a response body chunk by chunk without buffering it whole.
+        
+        For incremental parsers (e.g. lxml's feed()); no retries - a failed
+        status raises httpx.HTTPStatusError before any chunk is yielded.
+        """
+        client = await self.get_client()
+        # Hold a gate slot for the whole stream - the connection stays busy until it's drained
+        async with self._gate:
+            async with self.limiter:
+                request = client.build_request("GET", url, headers=headers or {}, timeout=self.timeout)
+                response = await client.send(request, stream=True)
+            try:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(chunk_size):
+                    yield chunk
+            finally:
+                await response.aclose()
+    
     def normalize_job_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize job data to standard format.
@@ -113,109 +281,217 @@ class BaseScraper(ABC):
         }
         """
         
-        normalized = {
-            "title": raw_data.get("title", "Unknown"),
-            "company": raw_data.get("company", "Unknown"),
-            "location": raw_data.get("location", "Unknown"),
-            "remote_type": self._normalize_remote_type(raw_data.get("remote_type", "")),
-            "job_type": self._normalize_job_type(raw_data.get("job_type", "Full-time")),
-            "salary": raw_data.get("salary_string") or raw_data.get("salary"), # Ensure salary field matches
-            "salary_min": raw_data.get("salary_min"),
-            "salary_max": raw_data.get("salary_max"),
-            "currency": raw_data.get("currency", "USD"),
-            "required_skills": raw_data.get("skills", []),
-            "experience_level": self._normalize_experience_level(raw_data.get("experience", "")),
-            "description": raw_data.get("description", ""),
-            "job_url": raw_data.get("url", ""),
-            "source_platform": self.platform_name,
-            "category": self._categorize_job(raw_data),
-            "created_at": datetime.utcnow(),
-            # Lifecycle fields
-            "applied_by": [],
-            "saved_by": [],
-            "apply_count": 0,
-            "save_count": 0,
-            "expires_at": None,
-            "end_date": None  # Add end_date matching JobCreate
-        }
+        return normalize_job(raw_data, self.platform_name, self._batch_time or datetime.now(timezone.utc))
+    
+    async def normalize_jobs(
+        self,
+        raw_jobs: List[Dict[str, Any]],
+        to_raw: Optional[Callable[[Any], Union["RawJob", Dict[str, Any]]]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Normalize a batch of raw jobs off the event loop.
+        
+        Small batches go to a worker thread in one hop; batches of
+        NORMALIZE_PROCESS_THRESHOLD or more are split across a process pool.
+        Jobs that fail to normalize are logged and skipped.
         
-        return normalized
+        Args:
+            raw_jobs: Raw jobs (RawJob or dict), or source entries if to_raw is given
+            to_raw: Optional module-level (picklable) function mapping a source
+                entry to a raw job, run in the same worker hop
+        """
+        if not raw_jobs:
+            return []
+        
+        created_at = self._batch_time or datetime.now(timezone.utc)
+        if len(raw_jobs) < NORMALIZE_PROCESS_THRESHOLD:
+            results = [await asyncio.to_thread(_normalize_chunk, self.platform_name, created_at, raw_jobs, to_raw)]
+        else:
+            loop = asyncio.get_running_loop()
+            pool = get_process_pool()
+            chunk_size = -(-len(raw_jobs) // PROCESS_POOL_WORKERS)
+            results = await asyncio.gather(*(
+                loop.run_in_executor(pool, _normalize_chunk, self.platform_name, created_at, raw_jobs[i:i + chunk_size], to_raw)
+                for i in range(0, len(raw_jobs), chunk_size)
+            ))
+        
+        # Workers don't share the app's log listener, so their errors are logged here
+        for _, errors in results:
+            for error in errors:
+                log.error("Error normalizing %s job: %s", self.platform_name, error)
+        return [job for jobs, _ in results for job in jobs]
+    
+    async def run_in_pool(self, func: Callable, *args):
+        """Run a module-level (picklable) CPU-bound function in the shared worker process pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_process_pool(), func, *args)
     
-    def _normalize_remote_type(self, remote_type: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_remote_type(remote_type: str) -> str:
         """Normalize remote type to standard values"""
-        remote_lower = remote_type.lower()
+        terms = term_set(remote_type)
         
-        if any(word in remote_lower for word in ["remote", "work from home", "wfh"]):
+        if terms & REMOTE_TERMS:
             return "Remote"
-        elif any(word in remote_lower for word in ["hybrid", "flexible"]):
+        elif terms & HYBRID_TERMS:
             return "Hybrid"
         else:
             return "On-site"
     
-    def _normalize_job_type(self, job_type: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_job_type(job_type: str) -> str:
         """Normalize job type to standard values"""
-        job_lower = job_type.lower()
+        terms = term_set(job_type)
         
-        if "full" in job_lower or "full-time" in job_lower:
+        if terms & FULL_TIME_TERMS:
             return "Full-time"
-        elif "part" in job_lower or "part-time" in job_lower:
+        elif terms & PART_TIME_TERMS:
             return "Part-time"
-        elif "contract" in job_lower or "contractor" in job_lower:
+        elif terms & CONTRACT_TERMS:
             return "Contract"
-        elif "intern" in job_lower:
+        elif terms & INTERNSHIP_TERMS:
             return "Internship"
         else:
             return "Full-time"  # Default
     
-    def _normalize_experience_level(self, experience: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_experience_level(experience: str) -> Optional[str]:
         """Normalize experience level to standard values"""
-        exp_lower = experience.lower()
+        terms = term_set(experience)
         
-        if any(word in exp_lower for word in ["entry", "junior", "0-2", "graduate"]):
+        if terms & ENTRY_TERMS:
             return "Entry"
-        elif any(word in exp_lower for word in ["mid", "intermediate", "2-5", "3-5"]):
+        elif terms & MID_TERMS:
             return "Mid"
-        elif any(word in exp_lower for word in ["senior", "5+", "7+", "experienced"]):
+        elif terms & SENIOR_TERMS:
             return "Senior"
-        elif any(word in exp_lower for word in ["lead", "principal", "staff", "architect"]):
+        elif terms & LEAD_TERMS:
             return "Lead"
         else:
             return None
     
     def _categorize_job(self, raw_data: Dict[str, Any]) -> str:
         """Categorize job based on title and description"""
-        title = raw_data.get("title", "").lower()
-        description = raw_data.get("description", "").lower()
-        combined = f"{title} {description}"
-        
-        # Data Science & ML
-        if any(word in combined for word in ["data scientist", "machine learning", "ml engineer", "ai engineer", "deep learning"]):
-            return "Machine Learning"
-        elif any(word in combined for word in ["data analyst", "data engineer", "analytics"]):
-            return "Data Science"
-        
-        # Development
-        elif any(word in combined for word in ["frontend", "front-end", "react", "vue", "angular"]):
-            return "Frontend"
-        elif any(word in combined for word in ["backend", "back-end", "api", "server"]):
-            return "Backend"
-        elif any(word in combined for word in ["full stack", "fullstack", "full-stack"]):
-            return "Full Stack"
-        elif any(word in combined for word in ["mobile", "ios", "android", "react native", "flutter"]):
-            return "Mobile"
-        
-        # DevOps
-        elif any(word in combined for word in ["devops", "sre", "infrastructure", "cloud engineer", "kubernetes", "docker"]):
-            return "DevOps"
+        description = raw_data.get("description") or ""
+        return self._category_for(raw_data.get("title") or "", description[:CATEGORY_SCAN_CHARS])
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _category_for(title: str, description: str) -> str:
+        """Cached worker for _categorize_job"""
+        # One Aho-Corasick pass over the normalized token stream; the
+        # highest-priority category seen wins (same order as CATEGORY_TERMS)
+        tokens = TOKEN_RE.findall(f"{title} {description}".lower())
+        stream = f" {' '.join(tokens)} "
         
-        else:
-            return "Other"
+        best = None
+        for _, (priority, category) in CATEGORY_AUTOMATON.iter(stream):
+            if best is None or priority < best[0]:
+                best = (priority, category)
+                if priority == 0:
+                    break
+        return best[1] if best else "Other"
     
     async def check_duplicate(self, job_url: str, db) -> bool:
         """Check if job already exists in database"""
-        existing = await db.jobs.find_one({"job_url": job_url})
+        url_filter = await self.load_url_filter(db)
+        canonical_url = canonicalize_job_url(job_url)
+        if canonical_url not in url_filter:
+            return False
+        # Stored job_urls are canonical (load_url_filter backfills legacy raw ones)
+        existing = await db.jobs.find_one({"job_url": canonical_url}, {"_id": 1})
         return existing is not None
     
+    @classmethod
+    async def load_url_filter(cls, db) -> ScalableBloomFilter:
+        """Build the job_url Bloom filter from the jobs collection on first use"""
+        if BaseScraper._url_filter is None:
+            async with cls._url_filter_lock:
+                if BaseScraper._url_filter is None:
+                    url_filter = ScalableBloomFilter(initial_capacity=1_000_000, error_rate=1e-4)
+                    backfill = []
+                    async for doc in db.jobs.find({}, LEGACY_URL_PROJECTION):
+                        job_url = doc.get("job_url")
+                        fingerprint = doc.get("fingerprint")
+                        if job_url:
+                            canonical_url = canonicalize_job_url(job_url)
+                            url_filter.add(canonical_url)
+                            # Jobs stored before canonicalization hold the raw URL and no fingerprint
+                            # (no fingerprint can be derived without a company; those keep matching by URL only)
+                            if canonical_url != job_url or not fingerprint:
+                                fingerprint = fingerprint or job_fingerprint(
+                                    doc.get("title", "Unknown"), doc.get("company"), doc.get("location", "Unknown")
+                                )
+                                if canonical_url != job_url or fingerprint:
+                                    backfill.append(_legacy_url_update(doc, canonical_url, fingerprint))
+                        if fingerprint:
+                            url_filter.add(fingerprint)
+                    BaseScraper._url_filter = url_filter
+                    if backfill:
+                        await cls._backfill_legacy_urls(db, backfill)
+                    log.info("Loaded %d job URLs into duplicate filter", len(url_filter))
+        return BaseScraper._url_filter
+    
+    @staticmethod
+    async def _backfill_legacy_urls(db, ops: List[UpdateOne]):
+        """Rewrite legacy jobs to the canonical job_url + fingerprint that lookups query"""
+        conflicts = failed = 0
+        for start in range(0, len(ops), LEGACY_BACKFILL_BATCH):
+            try:
+                await db.jobs.bulk_write(ops[start:start + LEGACY_BACKFILL_BATCH], ordered=False)
+            except BulkWriteError as bwe:
+                # E11000: the canonical URL is already stored by another job, which lookups find
+                write_errors = bwe.details.get("writeErrors", [])
+                conflicts += sum(1 for e in write_errors if e.get("code") == 11000)
+                for write_error in write_errors:
+                    if write_error.get("code") != 11000:
+                        log.error("Error backfilling job URL: %s", write_error.get("errmsg"))
+                        failed += 1
+        log.info("Backfilled canonical job_url/fingerprint on %d legacy jobs (%d already stored canonically, %d failed)",
+                 len(ops) - conflicts - failed, conflicts, failed)
+    
+    @classmethod
+    def is_known_job_url(cls, job_url: str) -> bool:
+        """Whether job_url is (probably) stored already; False until the filter is loaded"""
+        url_filter = BaseScraper._url_filter
+        return url_filter is not None and canonicalize_job_url(job_url) in url_filter
+    
+    @classmethod
+    def remember_job_url(cls, job_url: str, fingerprint: Optional[str] = None):
+        """Record a newly stored job_url (and fingerprint) in the Bloom filter"""
+        if BaseScraper._url_filter is not None:
+            if job_url:
+                BaseScraper._url_filter.add(canonicalize_job_url(job_url))
+            if fingerprint:
+                BaseScraper._url_filter.add(fingerprint)
+    
+    async def check_duplicates_bulk(self, job_urls: List[str], db, fingerprints: Optional[List[str]] = None) -> set:
+        """
+        Return the job_urls / fingerprints already in the database (one indexed query).
+        
+        Args:
+            job_urls: Canonical job URLs to look up
+            fingerprints: Optional job_fingerprint() values to look up as well
+        """
+        # Only keys the Bloom filter may have seen need confirming in Mongo
+        url_filter = await self.load_url_filter(db)
+        url_candidates = [url for url in job_urls if canonicalize_job_url(url) in url_filter]
+        fp_candidates = [fp for fp in (fingerprints or []) if fp in url_filter]
+        if not url_candidates and not fp_candidates:
+            return set()
+        
+        cursor = db.jobs.find(
+            {"$or": [{"job_url": {"$in": url_candidates}}, {"fingerprint": {"$in": fp_candidates}}]},
+            {"_id": 0, "job_url": 1, "fingerprint": 1}
+        )
+        existing = set()
+        async for doc in cursor:
+            existing.update(key for key in (doc.get("job_url"), doc.get("fingerprint")) if key)
+        return existing
+    
     @abstractmethod
     async def scrape_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -237,14 +513,21 @@ class BaseScraper(ABC):
         Returns:
             Statistics about the scraping operation
         """
-        print(f"[START] Starting scrape from {self.platform_name}...")
+        log.info("Starting scrape from %s", self.platform_name)
         
         try:
-            # Scrape jobs
-            jobs = await self.scrape_jobs(limit=limit)
+            # Load the duplicate filter first so scrapers can skip detail fetches for known jobs
+            await self.load_url_filter(db)
+            
+            # Scrape jobs (one created_at for the whole batch)
+            self._batch_time = datetime.now(timezone.utc)
+            try:
+                jobs = await self.scrape_jobs(limit=limit)
+            finally:
+                self._batch_time = None
             
             if not jobs:
-                print(f"[WARN] No jobs found from {self.platform_name}")
+                log.warning("No jobs found from %s", self.platform_name)
                 return {
                     "platform": self.platform_name,
                     "scraped": 0,
@@ -253,35 +536,72 @@ class BaseScraper(ABC):
                     "errors": 0
                 }
             
-            stored_count = 0
-            duplicate_count = 0
-            error_count = 0
-            
-            # Store each job
             from app.services.gemini_job_processor import job_processor
             
-            for job in jobs:
+            to_insert: List[Dict[str, Any]] = []
+            to_enhance: List[Dict[str, Any]] = []
+            
+            # Check for duplicates (by canonical URL or fingerprint) for the whole batch up front.
+            # Correctness comes from the unique job_url index (insert_many below counts
+            # E11000 as a duplicate); this pre-check only saves Gemini calls on known jobs.
+            existing_keys = await self.check_duplicates_bulk(
+                list({job["job_url"] for job in jobs if job.get("job_url")}),
+                db,
+                fingerprints=list({job["fingerprint"] for job in jobs if job.get("fingerprint")})
+            )
+            
+            def store_job(job: Dict[str, Any]) -> str:
+                keys = [key for key in (job.get("job_url"), job.get("fingerprint")) if key]
+                if any(key in existing_keys for key in keys):
+                    return "duplicate"
+                existing_keys.update(keys)  # Repeats within this batch count as duplicates too
+                
+                # Fill gaps locally first; only jobs still missing something go to Gemini
+                add_local_enrichment(job)
+                if not needs_enrichment(job):
+                    to_insert.append(job)
+                    return "new"
+                
+                to_enhance.append(job)
+                return "enhanced"
+            
+            outcomes = Counter(store_job(job) for job in jobs)
+            
+            if to_enhance:
+                # Enhance with Gemini, many jobs per prompt (with error handling/rate limit protection)
                 try:
-                    # Check for duplicates
-                    if await self.check_duplicate(job["job_url"], db):
-                        duplicate_count += 1
-                        continue
-                    
-                    # Enhance with Gemini (with error handling/rate limit protection)
-                    try:
-                        job = await job_processor.process_job(job)
-                    except Exception as ge:
-                        print(f"[WARN] Gemini enhancement skipped: {ge}")
-                    
-                    # Insert job
-                    await db.jobs.insert_one(job)
-                    stored_count += 1
-                    
-                except Exception as e:
-                    print(f"[ERROR] Error storing job: {e}")
-                    error_count += 1
+                    to_insert.extend(await job_processor.batch_process(to_enhance))
+                except Exception as ge:
+                    log.warning("Gemini enhancement skipped: %s", ge)
+                    to_insert.extend(to_enhance)
             
-            print(f"[OK] {self.platform_name}: Scraped {len(jobs)}, Stored {stored_count}, Duplicates {duplicate_count}")
+            duplicate_count = outcomes["duplicate"]
+            error_count = 0
+            
+            # Insert all new jobs in one round trip
+            failed_indexes = set()
+            if to_insert:
+                try:
+                    await db.jobs.insert_many(to_insert, ordered=False)
+                except BulkWriteError as bwe:
+                    for write_error in bwe.details.get("writeErrors", []):
+                        failed_indexes.add(write_error["index"])
+                        if write_error.get("code") == 11000:
+                            # Inserted by a concurrent scrape since the bulk check
+                            duplicate_count += 1
+                        else:
+                            log.error("Error storing job: %s", write_error.get("errmsg"))
+                            error_count += 1
+            
+            stored_count = len(to_insert) - len(failed_indexes)
+            for index, job in enumerate(to_insert):
+                if index not in failed_indexes:
+                    self.remember_job_url(job.get("job_url"), job.get("fingerprint"))
+            
+            log.info(
+                "%s: Scraped %d, Stored %d, Duplicates %d, Gemini-enhanced %d",
+                self.platform_name, len(jobs), stored_count, duplicate_count, outcomes["enhanced"]
+            )
             
             return {
                 "platform": self.platform_name,
@@ -292,7 +612,7 @@ class BaseScraper(ABC):
             }
             
         except Exception as e:
-            print(f"[ERROR] Scraping failed for {self.platform_name}: {e}")
+            log.exception("Scraping failed for %s", self.platform_name)
             return {
                 "platform": self.platform_name,
                 "scraped": 0,
@@ -301,3 +621,149 @@ class BaseScraper(ABC):
                 "errors": 1,
                 "error_message": str(e)
             }
+
+
+def add_local_enrichment(job: Dict[str, Any]):
+    """Cheaply fill in skills and experience level from the job's own text"""
+    skills = job.get("required_skills") or []
+    if len(skills) < MIN_LOCAL_SKILLS:
+        known = {skill.lower() for skill in skills}
+        found = extract_skills(f"{job.get('title') or ''} {job.get('description') or ''}")
+        job["required_skills"] = skills + [skill for skill in found if skill.lower() not in known]
+    
+    if not job.get("experience_level"):
+        job["experience_level"] = BaseScraper._normalize_experience_level(job.get("title") or "")
+
+
+def needs_enrichment(job: Dict[str, Any]) -> bool:
+    """Whether a normalized job is worth a Gemini round trip"""
+    return (
+        job.get("category", "Other") == "Other"
+        or len(job.get("required_skills") or []) < MIN_LOCAL_SKILLS
+        or not job.get("experience_level")
+    )
+
+
+@dataclass(slots=True)
+class RawJob:
+    """
+    Raw job record a scraper hands to normalize_job.
+    
+    Slotted, so a batch of these is much lighter than the equivalent 12-key
+    dicts. Defaults match the ones normalize_job applies to missing dict keys.
+    """
+    title: str = "Unknown"
+    company: str = "Unknown"
+    location: str = "Unknown"
+    remote_type: str = ""
+    job_type: str = "Full-time"
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    currency: str = "USD"
+    skills: List[str] = field(default_factory=list)
+    experience: str = ""
+    description: str = ""
+    url: str = ""
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict-style read, so normalize_job takes a RawJob or a plain dict alike"""
+        return getattr(self, key, default)
+
+
+def normalize_job(raw_data: Union[RawJob, Dict[str, Any]], platform_name: str, created_at: datetime) -> Dict[str, Any]:
+    """Module-level body of BaseScraper.normalize_job_data (picklable for the process pool)"""
+    normalized = {
+        "title": raw_data.get("title", "Unknown"),
+        "company": raw_data.get("company", "Unknown"),
+        "location": raw_data.get("location", "Unknown"),
+        "remote_type": BaseScraper._normalize_remote_type(raw_data.get("remote_type", "")),
+        "job_type": BaseScraper._normalize_job_type(raw_data.get("job_type", "Full-time")),
+        "salary": raw_data.get("salary_string") or raw_data.get("salary"), # Ensure salary field matches
+        "salary_min": raw_data.get("salary_min"),
+        "salary_max": raw_data.get("salary_max"),
+        # Precomputed for JobMatcher, which would otherwise redo it per user per job
+        "salary_mid": salary_midpoint(raw_data.get("salary_min"), raw_data.get("salary_max")),
+        "currency": raw_data.get("currency", "USD"),
+        "required_skills": raw_data.get("skills", []),
+        "experience_level": BaseScraper._normalize_experience_level(raw_data.get("experience", "")),
+        "description": raw_data.get("description", ""),
+        "job_url": canonicalize_job_url(raw_data.get("url", "")),
+        "job_url_raw": raw_data.get("url", ""),
+        "fingerprint": job_fingerprint(
+            raw_data.get("title", "Unknown"),
+            raw_data.get("company", "Unknown"),
+            raw_data.get("location", "Unknown")
+        ),
+        "source_platform": platform_name,
+        "category": BaseScraper._category_for(
+            raw_data.get("title") or "",
+            (raw_data.get("description") or "")[:CATEGORY_SCAN_CHARS]
+        ),
+        "created_at": created_at,
+        # Lifecycle fields
+        "applied_by": [],
+        "saved_by": [],
+        "apply_count": 0,
+        "save_count": 0,
+        "expires_at": None,
+        "end_date": None  # Add end_date matching JobCreate
+    }
+    
+    return normalized
+
+
+def _normalize_chunk(
+    platform_name: str,
+    created_at: datetime,
+    raw_jobs: List[Any],
+    to_raw: Optional[Callable[[Any], Union["RawJob", Dict[str, Any]]]] = None
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Normalize a list of raw jobs (converting them with to_raw first, if given).
+    
+    Returns the normalized jobs and the error messages of any that failed;
+    the caller logs them, since log records from a pool worker are lost.
+    """
+    normalized = []
+    errors = []
+    for raw_data in raw_jobs:
+        try:
+            if to_raw is not None:
+                raw_data = to_raw(raw_data)
+            normalized.append(normalize_job(raw_data, platform_name, created_at))
+        except Exception as e:
+            errors.append(str(e))
+    return normalized, errors
+
+
+# Normalize batches at least this large go to the shared process pool
+NORMALIZE_PROCESS_THRESHOLD = 500
+
+
+class StaticSampleScraper(BaseScraper):
+    """
+    Base for placeholder platforms that serve canned jobs and never fetch.
+
+    Subclasses set sample_jobs (normalized once at import) and unavailable_notice.
+    The shared HTTP client is created lazily, so nothing network-related is
+    allocated for these scrapers.
+    """
+    
+    sample_jobs: List[Dict[str, Any]] = []
+    unavailable_notice = "Live scraping is not available."
+    
+    def __init__(self, platform_name: str):
+        super().__init__(platform_name=platform_name)
+    
+    async def scrape_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Return up to `limit` sample jobs stamped with the current batch time"""
+        log.warning("%s Returning sample data for demonstration.", self.unavailable_notice)
+        
+        # Fresh copies - downstream enrichment and insert_one mutate the dicts
+        created_at = self._batch_time or datetime.now(timezone.utc)
+        jobs = copy.deepcopy(self.sample_jobs[:limit])
+        for job in jobs:
+            job["created_at"] = created_at
+        
+        log.info("%s: Parsed %d sample jobs", self.platform_name, len(jobs))
+        return jobs
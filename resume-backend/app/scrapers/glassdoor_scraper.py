@@ -11,125 +11,94 @@ For production use, consider:
 3. Manual data entry or RSS feeds
 """
 
-from typing import List, Dict, Any
-from app.scrapers.base_scraper import BaseScraper
+from app.scrapers.base_scraper import StaticSampleScraper, normalize_job
 
 
-class GlassdoorScraper(BaseScraper):
+# Sample Glassdoor-style jobs with salary transparency
+_SAMPLE_JOBS_RAW = [
+    {
+        "title": "Software Engineer III",
+        "company": "Apple",
+        "location": "Cupertino, CA",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 155000,
+        "salary_max": 210000,
+        "currency": "USD",
+        "skills": ["Swift", "Objective-C", "iOS", "macOS", "C++"],
+        "experience": "Senior",
+        "description": "Join Apple's software engineering team...",
+        "url": "https://www.glassdoor.com/job-listing/example-1"
+    },
+    {
+        "title": "Senior Data Scientist",
+        "company": "Uber",
+        "location": "San Francisco, CA",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 150000,
+        "salary_max": 200000,
+        "currency": "USD",
+        "skills": ["Python", "R", "Machine Learning", "SQL", "Spark"],
+        "experience": "Senior",
+        "description": "Use data science to improve rider and driver experiences...",
+        "url": "https://www.glassdoor.com/job-listing/example-2"
+    },
+    {
+        "title": "Cloud Solutions Architect",
+        "company": "Salesforce",
+        "location": "Remote",
+        "remote_type": "Remote",
+        "job_type": "Full-time",
+        "salary_min": 140000,
+        "salary_max": 190000,
+        "currency": "USD",
+        "skills": ["AWS", "Azure", "Salesforce", "Architecture", "Cloud"],
+        "experience": "Senior",
+        "description": "Design cloud solutions for enterprise customers...",
+        "url": "https://www.glassdoor.com/job-listing/example-3"
+    },
+    {
+        "title": "Full Stack Developer",
+        "company": "Stripe",
+        "location": "Remote",
+        "remote_type": "Remote",
+        "job_type": "Full-time",
+        "salary_min": 130000,
+        "salary_max": 175000,
+        "currency": "USD",
+        "skills": ["Ruby", "React", "TypeScript", "PostgreSQL", "Redis"],
+        "experience": "Mid",
+        "description": "Build payment infrastructure for the internet...",
+        "url": "https://www.glassdoor.com/job-listing/example-4"
+    },
+    {
+        "title": "Security Engineer",
+        "company": "Cloudflare",
+        "location": "Austin, TX",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 135000,
+        "salary_max": 180000,
+        "currency": "USD",
+        "skills": ["Security", "Python", "Go", "Networking", "Cryptography"],
+        "experience": "Mid",
+        "description": "Protect the internet as a security engineer...",
+        "url": "https://www.glassdoor.com/job-listing/example-5"
+    }
+]
+
+_SAMPLE_JOBS_NORMALIZED = [normalize_job(job, "Glassdoor", None) for job in _SAMPLE_JOBS_RAW]
+
+
+class GlassdoorScraper(StaticSampleScraper):
     """Scraper for Glassdoor Jobs (placeholder with sample data)"""
     
-    def __init__(self):
-        super().__init__(
-            platform_name="Glassdoor",
-            max_requests_per_minute=5,  # Very conservative
-            timeout=30
-        )
+    sample_jobs = _SAMPLE_JOBS_NORMALIZED
+    unavailable_notice = "Glassdoor requires authentication and has strong anti-scraping."
     
-    async def scrape_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """
-        Scrape jobs from Glassdoor.
-        
-        Note: Glassdoor has strong anti-scraping and requires authentication.
-        This returns sample data for demonstration.
-        
-        For production, use Glassdoor's official API or a licensed service.
-        
-        Args:
-            limit: Maximum number of jobs to scrape
-            
-        Returns:
-            List of normalized job dictionaries
-        """
-        
-        print(f"⚠️ Glassdoor requires authentication and has strong anti-scraping.")
-        print(f"⚠️ Returning sample data for demonstration.")
-        
-        # Sample Glassdoor-style jobs with salary transparency
-        sample_jobs = [
-            {
-                "title": "Software Engineer III",
-                "company": "Apple",
-                "location": "Cupertino, CA",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 155000,
-                "salary_max": 210000,
-                "currency": "USD",
-                "skills": ["Swift", "Objective-C", "iOS", "macOS", "C++"],
-                "experience": "Senior",
-                "description": "Join Apple's software engineering team...",
-                "url": "https://www.glassdoor.com/job-listing/example-1"
-            },
-            {
-                "title": "Senior Data Scientist",
-                "company": "Uber",
-                "location": "San Francisco, CA",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 150000,
-                "salary_max": 200000,
-                "currency": "USD",
-                "skills": ["Python", "R", "Machine Learning", "SQL", "Spark"],
-                "experience": "Senior",
-                "description": "Use data science to improve rider and driver experiences...",
-                "url": "https://www.glassdoor.com/job-listing/example-2"
-            },
-            {
-                "title": "Cloud Solutions Architect",
-                "company": "Salesforce",
-                "location": "Remote",
-                "remote_type": "Remote",
-                "job_type": "Full-time",
-                "salary_min": 140000,
-                "salary_max": 190000,
-                "currency": "USD",
-                "skills": ["AWS", "Azure", "Salesforce", "Architecture", "Cloud"],
-                "experience": "Senior",
-                "description": "Design cloud solutions for enterprise customers...",
-                "url": "https://www.glassdoor.com/job-listing/example-3"
-            },
-            {
-                "title": "Full Stack Developer",
-                "company": "Stripe",
-                "location": "Remote",
-                "remote_type": "Remote",
-                "job_type": "Full-time",
-                "salary_min": 130000,
-                "salary_max": 175000,
-                "currency": "USD",
-                "skills": ["Ruby", "React", "TypeScript", "PostgreSQL", "Redis"],
-                "experience": "Mid",
-                "description": "Build payment infrastructure for the internet...",
-                "url": "https://www.glassdoor.com/job-listing/example-4"
-            },
-            {
-                "title": "Security Engineer",
-                "company": "Cloudflare",
-                "location": "Austin, TX",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 135000,
-                "salary_max": 180000,
-                "currency": "USD",
-                "skills": ["Security", "Python", "Go", "Networking", "Cryptography"],
-                "experience": "Mid",
-                "description": "Protect the internet as a security engineer...",
-                "url": "https://www.glassdoor.com/job-listing/example-5"
-            }
-        ]
-        
-        normalized_jobs = []
-        
-        for job_data in sample_jobs[:limit]:
-            try:
-                normalized_job = self.normalize_job_data(job_data)
-                normalized_jobs.append(normalized_job)
-            except Exception as e:
-                print(f"❌ Error parsing Glassdoor job: {e}")
-                continue
-        
-        print(f"✅ Glassdoor: Parsed {len(normalized_jobs)} sample jobs")
-        return normalized_jobs
+    def __init__(self):
+        super().__init__(platform_name="Glassdoor")
 
 
 # Example usage
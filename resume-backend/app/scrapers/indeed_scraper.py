@@ -6,10 +6,171 @@ Scrapes jobs from Indeed.com using HTML parsing.
 Indeed has anti-scraping measures, so this scraper is conservative with rate limiting.
 """
 
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-import re
-from app.scrapers.base_scraper import BaseScraper
+import logging
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime, timezone
+import copy
+import hashlib
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urljoin
+from cachetools import TTLCache
+from app.scrapers.base_scraper import BaseScraper, RawJob, normalize_job
+from app.scrapers._patterns import build_skill_automaton, extract_skills, SALARY_PATTERN, NON_ANNUAL_PAY_PATTERN
+
+log = logging.getLogger(__name__)
+
+
+COMMON_SKILLS = (
+    "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust", "Ruby",
+    "React", "Vue", "Angular", "Node.js", "Django", "Flask", "FastAPI", "Spring",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "PostgreSQL", "MongoDB", "MySQL",
+    "Machine Learning", "AI", "Data Science", "DevOps", "Frontend", "Backend", "Full Stack"
+)
+
+SKILL_AUTOMATON = build_skill_automaton(COMMON_SKILLS)
+
+# Parsed cards keyed by a hash of the page bytes. Content-addressed, so a
+# changed page simply misses; the TTL only bounds how long stale pages linger
+PARSED_CACHE_TTL = 600  # seconds
+_parsed_cache = TTLCache(maxsize=8, ttl=PARSED_CACHE_TTL)
+
+
+def _parse_salary(salary_text: str) -> tuple:
+    """Parse an annual salary range from text (K scales by 1000; hourly/daily/... pay is skipped)"""
+    if not salary_text or NON_ANNUAL_PAY_PATTERN.search(salary_text):
+        return None, None
+    
+    match = SALARY_PATTERN.search(salary_text)
+    if not match:
+        return None, None
+    
+    min_text, min_k, max_text, max_k = match.groups()
+    if max_k and not min_k:
+        min_k = max_k
+    salary_min = int(min_text.replace(',', '')) * (1000 if min_k else 1)
+    if max_text:
+        salary_max = int(max_text.replace(',', '')) * (1000 if max_k else 1)
+    else:
+        salary_max = salary_min
+    return salary_min, salary_max
+
+
+def _parse_indeed(html: bytes, base_url: str) -> Optional[Tuple[List[RawJob], int]]:
+    """
+    Parse every job card on a search results page.
+    
+    Module-level so it can run in the shared process pool. Returns the raw
+    jobs and the number of cards that failed to parse (worker processes
+    don't share the app's log listener), or None if no cards were found.
+    """
+    # Parse HTML (Lexbor C engine)
+    tree = LexborHTMLParser(html)
+    
+    # Find job cards (Indeed's structure may change)
+    # This is a simplified version - actual selectors may need updating
+    job_cards = tree.css('div.job_seen_beacon')
+    
+    if not job_cards:
+        # Try alternative selectors
+        job_cards = tree.css('a.jcs-JobTitle')
+    
+    if not job_cards:
+        return None
+    
+    raw_jobs = []
+    skipped = 0
+    
+    for card in job_cards:
+        try:
+            # Extract job details (selectors may need updating based on Indeed's current HTML)
+            # One selector group = one tree walk; the h2 wraps the span[title], so it comes first
+            title_elem = card.css_first('h2.jobTitle, span[title]')
+            company_elem = card.css_first('span.companyName')
+            location_elem = card.css_first('div.companyLocation')
+            
+            if not title_elem:
+                continue
+            
+            title = title_elem.text(strip=True)
+            company = company_elem.text(strip=True) if company_elem else "Unknown"
+            location = location_elem.text(strip=True) if location_elem else "Remote"
+            
+            # Extract job URL
+            link = card.css_first('a[href]')
+            job_url = urljoin(base_url, link.attributes.get('href') or '') if link else ""
+            
+            # Extract salary if available
+            salary_elem = card.css_first('div.salary-snippet')
+            salary_min, salary_max = _parse_salary(salary_elem.text() if salary_elem else "")
+            
+            raw_jobs.append(RawJob(
+                title=title,
+                company=company,
+                location=location,
+                remote_type=BaseScraper._normalize_remote_type(location),
+                job_type="Full-time",  # Default
+                salary_min=salary_min,
+                salary_max=salary_max,
+                currency="USD",
+                skills=extract_skills(title, SKILL_AUTOMATON),
+                experience="",
+                description=title,  # Would need to fetch individual job page
+                url=job_url
+            ))
+            
+        except Exception:
+            skipped += 1
+    
+    return raw_jobs, skipped
+
+
+# Sample jobs for demonstration
+_SAMPLE_JOBS_RAW = [
+    {
+        "title": "Senior Software Engineer",
+        "company": "Tech Company Inc",
+        "location": "Remote",
+        "remote_type": "Remote",
+        "job_type": "Full-time",
+        "salary_min": 120000,
+        "salary_max": 160000,
+        "currency": "USD",
+        "skills": ["Python", "JavaScript", "React", "AWS"],
+        "experience": "Senior",
+        "description": "We are looking for a senior software engineer...",
+        "url": "https://www.indeed.com/viewjob?jk=sample1"
+    },
+    {
+        "title": "Full Stack Developer",
+        "company": "Startup XYZ",
+        "location": "San Francisco, CA",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 100000,
+        "salary_max": 140000,
+        "currency": "USD",
+        "skills": ["Node.js", "React", "MongoDB", "Docker"],
+        "experience": "Mid",
+        "description": "Join our growing team as a full stack developer...",
+        "url": "https://www.indeed.com/viewjob?jk=sample2"
+    },
+    {
+        "title": "Data Scientist",
+        "company": "Analytics Corp",
+        "location": "Remote",
+        "remote_type": "Remote",
+        "job_type": "Full-time",
+        "salary_min": 110000,
+        "salary_max": 150000,
+        "currency": "USD",
+        "skills": ["Python", "Machine Learning", "SQL", "TensorFlow"],
+        "experience": "Mid",
+        "description": "We're seeking a data scientist to join our team...",
+        "url": "https://www.indeed.com/viewjob?jk=sample3"
+    }
+]
+
+_SAMPLE_JOBS_NORMALIZED = [normalize_job(job, "Indeed", None) for job in _SAMPLE_JOBS_RAW]
 
 
 class IndeedScraper(BaseScraper):
@@ -40,7 +201,7 @@ class IndeedScraper(BaseScraper):
         """
         
         try:
-            print(f"🔍 Fetching jobs from Indeed...")
+            log.info("Fetching jobs from Indeed...")
             
             # Set headers to mimic a browser
             headers = {
@@ -53,188 +214,52 @@ class IndeedScraper(BaseScraper):
             }
             
             # Fetch the search results page
-            html = await self.fetch_with_retry(self.search_url, headers=headers)
+            html = await self.fetch_with_retry(self.search_url, headers=headers, as_bytes=True)
             
             if not html:
-                print("⚠️ Failed to fetch Indeed page")
+                log.warning("Failed to fetch Indeed page")
                 return []
             
-            # Parse HTML
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Find job cards (Indeed's structure may change)
-            # This is a simplified version - actual selectors may need updating
-            job_cards = soup.find_all('div', class_='job_seen_beacon')
-            
-            if not job_cards:
-                # Try alternative selectors
-                job_cards = soup.find_all('a', class_='jcs-JobTitle')
-                
-            if not job_cards:
-                print("⚠️ No job cards found on Indeed (selectors may need updating)")
-                # Return sample data for demonstration
-                return self._get_sample_jobs(limit)
-            
-            normalized_jobs = []
+            # Same page content (near-duplicate polls) -> reuse the parsed cards
+            key = hashlib.blake2b(html, digest_size=16).hexdigest()
+            raw_jobs = _parsed_cache.get(key)
+            if raw_jobs is None:
+                # Parsing is CPU-bound; run it in a worker process so other scrapers keep going
+                parsed = await self.run_in_pool(_parse_indeed, html, self.base_url)
+                if parsed is None:
+                    log.warning("No job cards found on Indeed (selectors may need updating)")
+                    # Return sample data for demonstration
+                    return self._get_sample_jobs(limit)
+                raw_jobs, skipped = parsed
+                if skipped:
+                    log.warning("Indeed: skipped %d job cards that failed to parse", skipped)
+                _parsed_cache[key] = raw_jobs
             
-            for card in job_cards[:limit]:
-                try:
-                    # Extract job details (selectors may need updating based on Indeed's current HTML)
-                    title_elem = card.find('h2', class_='jobTitle') or card.find('span', title=True)
-                    company_elem = card.find('span', class_='companyName')
-                    location_elem = card.find('div', class_='companyLocation')
-                    
-                    if not title_elem:
-                        continue
-                    
-                    title = title_elem.get_text(strip=True)
-                    company = company_elem.get_text(strip=True) if company_elem else "Unknown"
-                    location = location_elem.get_text(strip=True) if location_elem else "Remote"
-                    
-                    # Extract job URL
-                    link = card.find('a', href=True)
-                    job_url = self.base_url + link['href'] if link else ""
-                    
-                    # Extract salary if available
-                    salary_elem = card.find('div', class_='salary-snippet')
-                    salary_min, salary_max = self._parse_salary(salary_elem.get_text() if salary_elem else "")
-                    
-                    # Create raw data dict
-                    raw_data = {
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "remote_type": self._determine_remote_type(location),
-                        "job_type": "Full-time",  # Default
-                        "salary_min": salary_min,
-                        "salary_max": salary_max,
-                        "currency": "USD",
-                        "skills": self._extract_skills_from_title(title),
-                        "experience": "",
-                        "description": title,  # Would need to fetch individual job page
-                        "url": job_url
-                    }
-                    
-                    # Normalize and add to list
-                    normalized_job = self.normalize_job_data(raw_data)
-                    normalized_jobs.append(normalized_job)
-                    
-                except Exception as e:
-                    print(f"❌ Error parsing Indeed job: {e}")
-                    continue
+            # Normalize the whole batch off the event loop
+            normalized_jobs = await self.normalize_jobs(raw_jobs[:limit])
             
             if len(normalized_jobs) == 0:
                 # If parsing failed, return sample data
-                print("⚠️ Parsing failed, returning sample data")
+                log.warning("Parsing failed, returning sample data")
                 return self._get_sample_jobs(limit)
             
-            print(f"✅ Indeed: Parsed {len(normalized_jobs)} jobs")
+            log.info("Indeed: Parsed %d jobs", len(normalized_jobs))
             return normalized_jobs
             
-        except Exception as e:
-            print(f"❌ Indeed scraping error: {e}")
-            print("⚠️ Returning sample data for demonstration")
+        except Exception:
+            log.exception("Indeed scraping error")
+            log.warning("Returning sample data for demonstration")
             return self._get_sample_jobs(limit)
     
     def _get_sample_jobs(self, limit: int) -> List[Dict[str, Any]]:
         """Return sample jobs for demonstration (when scraping fails)"""
-        sample_jobs = [
-            {
-                "title": "Senior Software Engineer",
-                "company": "Tech Company Inc",
-                "location": "Remote",
-                "remote_type": "Remote",
-                "job_type": "Full-time",
-                "salary_min": 120000,
-                "salary_max": 160000,
-                "currency": "USD",
-                "skills": ["Python", "JavaScript", "React", "AWS"],
-                "experience": "Senior",
-                "description": "We are looking for a senior software engineer...",
-                "url": "https://www.indeed.com/viewjob?jk=sample1"
-            },
-            {
-                "title": "Full Stack Developer",
-                "company": "Startup XYZ",
-                "location": "San Francisco, CA",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 100000,
-                "salary_max": 140000,
-                "currency": "USD",
-                "skills": ["Node.js", "React", "MongoDB", "Docker"],
-                "experience": "Mid",
-                "description": "Join our growing team as a full stack developer...",
-                "url": "https://www.indeed.com/viewjob?jk=sample2"
-            },
-            {
-                "title": "Data Scientist",
-                "company": "Analytics Corp",
-                "location": "Remote",
-                "remote_type": "Remote",
-                "job_type": "Full-time",
-                "salary_min": 110000,
-                "salary_max": 150000,
-                "currency": "USD",
-                "skills": ["Python", "Machine Learning", "SQL", "TensorFlow"],
-                "experience": "Mid",
-                "description": "We're seeking a data scientist to join our team...",
-                "url": "https://www.indeed.com/viewjob?jk=sample3"
-            }
-        ]
-        
-        normalized_jobs = []
-        for job_data in sample_jobs[:limit]:
-            normalized_job = self.normalize_job_data(job_data)
-            normalized_jobs.append(normalized_job)
+        # Normalized once at import; hand out fresh copies with a current created_at
+        created_at = self._batch_time or datetime.now(timezone.utc)
+        normalized_jobs = copy.deepcopy(_SAMPLE_JOBS_NORMALIZED[:limit])
+        for job in normalized_jobs:
+            job["created_at"] = created_at
         
         return normalized_jobs
-    
-    def _parse_salary(self, salary_text: str) -> tuple:
-        """Parse salary from text"""
-        if not salary_text:
-            return None, None
-        
-        # Extract numbers from salary text
-        numbers = re.findall(r'\$?(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)', salary_text)
-        
-        if len(numbers) >= 2:
-            salary_min = int(numbers[0].replace(',', ''))
-            salary_max = int(numbers[1].replace(',', ''))
-            return salary_min, salary_max
-        elif len(numbers) == 1:
-            salary = int(numbers[0].replace(',', ''))
-            return salary, salary
-        
-        return None, None
-    
-    def _determine_remote_type(self, location: str) -> str:
-        """Determine if job is remote, hybrid, or on-site"""
-        location_lower = location.lower()
-        
-        if "remote" in location_lower:
-            return "Remote"
-        elif "hybrid" in location_lower:
-            return "Hybrid"
-        else:
-            return "On-site"
-    
-    def _extract_skills_from_title(self, title: str) -> List[str]:
-        """Extract skills from job title"""
-        skills = []
-        common_skills = [
-            "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust", "Ruby",
-            "React", "Vue", "Angular", "Node.js", "Django", "Flask", "FastAPI", "Spring",
-            "AWS", "Azure", "GCP", "Docker", "Kubernetes", "PostgreSQL", "MongoDB", "MySQL",
-            "Machine Learning", "AI", "Data Science", "DevOps", "Frontend", "Backend", "Full Stack"
-        ]
-        
-        title_lower = title.lower()
-        for skill in common_skills:
-            if skill.lower() in title_lower:
-                skills.append(skill)
-        
-        return skills
 
 
 # Example usage
@@ -11,139 +11,108 @@ For production use, consider:
 3. Selenium with login automation (against ToS, not recommended)
 """
 
-from typing import List, Dict, Any
-from app.scrapers.base_scraper import BaseScraper
+from app.scrapers.base_scraper import StaticSampleScraper, normalize_job
 
 
-class LinkedInScraper(BaseScraper):
+# Sample LinkedIn-style jobs
+_SAMPLE_JOBS_RAW = [
+    {
+        "title": "Senior Software Engineer",
+        "company": "Microsoft",
+        "location": "Redmond, WA",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 150000,
+        "salary_max": 200000,
+        "currency": "USD",
+        "skills": ["C#", ".NET", "Azure", "Kubernetes", "Microservices"],
+        "experience": "Senior",
+        "description": "Join Microsoft's cloud team to build next-generation solutions...",
+        "url": "https://www.linkedin.com/jobs/search?keywords=Senior%20Software%20Engineer%20Microsoft"
+    },
+    {
+        "title": "Machine Learning Engineer",
+        "company": "Google",
+        "location": "Mountain View, CA",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 160000,
+        "salary_max": 220000,
+        "currency": "USD",
+        "skills": ["Python", "TensorFlow", "PyTorch", "Kubernetes", "GCP"],
+        "experience": "Senior",
+        "description": "Build ML models at scale for Google products...",
+        "url": "https://www.linkedin.com/jobs/search?keywords=Machine%20Learning%20Engineer%20Google"
+    },
+    {
+        "title": "Product Manager - AI",
+        "company": "Meta",
+        "location": "Menlo Park, CA",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 140000,
+        "salary_max": 190000,
+        "currency": "USD",
+        "skills": ["Product Management", "AI", "Machine Learning", "Data Analysis"],
+        "experience": "Senior",
+        "description": "Lead AI product initiatives at Meta...",
+        "url": "https://www.linkedin.com/jobs/search?keywords=Product%20Manager%20AI%20Meta"
+    },
+    {
+        "title": "Frontend Engineer - React",
+        "company": "Airbnb",
+        "location": "San Francisco, CA",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 130000,
+        "salary_max": 180000,
+        "currency": "USD",
+        "skills": ["React", "TypeScript", "JavaScript", "CSS", "GraphQL"],
+        "experience": "Mid",
+        "description": "Build beautiful user experiences for millions of travelers...",
+        "url": "https://www.linkedin.com/jobs/search?keywords=Frontend%20Engineer%20React%20Airbnb"
+    },
+    {
+        "title": "Data Engineer",
+        "company": "Netflix",
+        "location": "Los Gatos, CA",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 145000,
+        "salary_max": 195000,
+        "currency": "USD",
+        "skills": ["Python", "Spark", "Kafka", "AWS", "SQL"],
+        "experience": "Senior",
+        "description": "Build data pipelines that power Netflix recommendations...",
+        "url": "https://www.linkedin.com/jobs/search?keywords=Data%20Engineer%20Netflix"
+    },
+    {
+        "title": "DevOps Engineer",
+        "company": "Amazon",
+        "location": "Seattle, WA",
+        "remote_type": "Hybrid",
+        "job_type": "Full-time",
+        "salary_min": 135000,
+        "salary_max": 185000,
+        "currency": "USD",
+        "skills": ["AWS", "Terraform", "Docker", "Kubernetes", "Python"],
+        "experience": "Mid",
+        "description": "Manage infrastructure for AWS services...",
+        "url": "https://www.linkedin.com/jobs/search?keywords=DevOps%20Engineer%20Amazon"
+    }
+]
+
+_SAMPLE_JOBS_NORMALIZED = [normalize_job(job, "LinkedIn", None) for job in _SAMPLE_JOBS_RAW]
+
+
+class LinkedInScraper(StaticSampleScraper):
     """Scraper for LinkedIn Jobs (placeholder with sample data)"""
     
-    def __init__(self):
-        super().__init__(
-            platform_name="LinkedIn",
-            max_requests_per_minute=10,  # Very conservative
-            timeout=30
-        )
+    sample_jobs = _SAMPLE_JOBS_NORMALIZED
+    unavailable_notice = "LinkedIn requires authentication and official API access."
     
-    async def scrape_jobs(self, limit: int = 50) -> List[Dict[str, Any]]:
-        """
-        Scrape jobs from LinkedIn.
-        
-        Note: LinkedIn requires authentication and has strong anti-scraping.
-        This returns sample data for demonstration.
-        
-        For production, use LinkedIn's official API or a licensed scraping service.
-        
-        Args:
-            limit: Maximum number of jobs to scrape
-            
-        Returns:
-            List of normalized job dictionaries
-        """
-        
-        print(f"⚠️ LinkedIn requires authentication and official API access.")
-        print(f"⚠️ Returning sample data for demonstration.")
-        
-        # Sample LinkedIn-style jobs
-        sample_jobs = [
-            {
-                "title": "Senior Software Engineer",
-                "company": "Microsoft",
-                "location": "Redmond, WA",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 150000,
-                "salary_max": 200000,
-                "currency": "USD",
-                "skills": ["C#", ".NET", "Azure", "Kubernetes", "Microservices"],
-                "experience": "Senior",
-                "description": "Join Microsoft's cloud team to build next-generation solutions...",
-                "url": "https://www.linkedin.com/jobs/search?keywords=Senior%20Software%20Engineer%20Microsoft"
-            },
-            {
-                "title": "Machine Learning Engineer",
-                "company": "Google",
-                "location": "Mountain View, CA",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 160000,
-                "salary_max": 220000,
-                "currency": "USD",
-                "skills": ["Python", "TensorFlow", "PyTorch", "Kubernetes", "GCP"],
-                "experience": "Senior",
-                "description": "Build ML models at scale for Google products...",
-                "url": "https://www.linkedin.com/jobs/search?keywords=Machine%20Learning%20Engineer%20Google"
-            },
-            {
-                "title": "Product Manager - AI",
-                "company": "Meta",
-                "location": "Menlo Park, CA",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 140000,
-                "salary_max": 190000,
-                "currency": "USD",
-                "skills": ["Product Management", "AI", "Machine Learning", "Data Analysis"],
-                "experience": "Senior",
-                "description": "Lead AI product initiatives at Meta...",
-                "url": "https://www.linkedin.com/jobs/search?keywords=Product%20Manager%20AI%20Meta"
-            },
-            {
-                "title": "Frontend Engineer - React",
-                "company": "Airbnb",
-                "location": "San Francisco, CA",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 130000,
-                "salary_max": 180000,
-                "currency": "USD",
-                "skills": ["React", "TypeScript", "JavaScript", "CSS", "GraphQL"],
-                "experience": "Mid",
-                "description": "Build beautiful user experiences for millions of travelers...",
-                "url": "https://www.linkedin.com/jobs/search?keywords=Frontend%20Engineer%20React%20Airbnb"
-            },
-            {
-                "title": "Data Engineer",
-                "company": "Netflix",
-                "location": "Los Gatos, CA",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 145000,
-                "salary_max": 195000,
-                "currency": "USD",
-                "skills": ["Python", "Spark", "Kafka", "AWS", "SQL"],
-                "experience": "Senior",
-                "description": "Build data pipelines that power Netflix recommendations...",
-                "url": "https://www.linkedin.com/jobs/search?keywords=Data%20Engineer%20Netflix"
-            },
-            {
-                "title": "DevOps Engineer",
-                "company": "Amazon",
-                "location": "Seattle, WA",
-                "remote_type": "Hybrid",
-                "job_type": "Full-time",
-                "salary_min": 135000,
-                "salary_max": 185000,
-                "currency": "USD",
-                "skills": ["AWS", "Terraform", "Docker", "Kubernetes", "Python"],
-                "experience": "Mid",
-                "description": "Manage infrastructure for AWS services...",
-                "url": "https://www.linkedin.com/jobs/search?keywords=DevOps%20Engineer%20Amazon"
-            }
-        ]
-        
-        normalized_jobs = []
-        
-        for job_data in sample_jobs[:limit]:
-            try:
-                normalized_job = self.normalize_job_data(job_data)
-                normalized_jobs.append(normalized_job)
-            except Exception as e:
-                print(f"❌ Error parsing LinkedIn job: {e}")
-                continue
-        
-        print(f"✅ LinkedIn: Parsed {len(normalized_jobs)} sample jobs")
-        return normalized_jobs
+    def __init__(self):
+        super().__init__(platform_name="LinkedIn")
 
 
 # Example usage
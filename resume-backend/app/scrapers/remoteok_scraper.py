@@ -6,9 +6,60 @@ Scrapes jobs from RemoteOK.com using their public API.
 This is one of the easiest scrapers as RemoteOK provides a JSON API.
 """
 
-import httpx
+import logging
 from typing import List, Dict, Any
-from app.scrapers.base_scraper import BaseScraper
+import io
+import itertools
+import ijson
+from cachetools import TTLCache
+from app.scrapers.base_scraper import BaseScraper, RawJob
+
+log = logging.getLogger(__name__)
+
+
+# Leading entries of the parsed API feed, as (limit, entries). RemoteOK
+# rate-limits hard and the payload only changes every few minutes, so
+# back-to-back scrapes (scheduler + admin) share one fetch
+FEED_CACHE_TTL = 300  # seconds
+_feed_cache = TTLCache(maxsize=1, ttl=FEED_CACHE_TTL)
+
+
+def invalidate_remoteok_cache() -> None:
+    """Drop the cached feed so the next scrape hits the API"""
+    _feed_cache.clear()
+
+
+def first_feed_jobs(content: bytes, limit: int) -> List[Dict[str, Any]]:
+    """
+    First `limit` job entries of the RemoteOK feed.
+    
+    The feed is one JSON array (metadata object first, then thousands of jobs);
+    decoding it incrementally keeps only the requested entries alive instead of
+    building a dict for every job in the payload.
+    """
+    entries = ijson.items(io.BytesIO(content), "item", use_float=True)
+    return list(itertools.islice(entries, 1, limit + 1))  # First item is metadata, skip it
+
+
+def feed_entry_to_raw(job_data: Dict[str, Any]) -> RawJob:
+    """Map one RemoteOK API entry to the raw job normalize_job expects"""
+    # Extract skills/tags
+    skills = [tag for tag in job_data.get("tags") or [] if tag]
+    
+    return RawJob(
+        title=job_data.get("position", "Unknown"),
+        company=job_data.get("company", "Unknown"),
+        location=job_data.get("location", "Remote"),
+        remote_type="Remote",  # RemoteOK is all remote
+        job_type="Full-time",  # Default
+        salary_min=job_data.get("salary_min"),
+        salary_max=job_data.get("salary_max"),
+        currency="USD",
+        skills=skills[:10],  # Limit to 10 skills
+        experience="",  # Not provided by RemoteOK
+        description=job_data.get("description", ""),
+        url=f"https://remoteok.com/remote-jobs/{job_data.get('id', '')}"
+    )
 
 
 class RemoteOKScraper(BaseScraper):
@@ -34,66 +85,35 @@ class RemoteOKScraper(BaseScraper):
         """
         
         try:
-            print(f"🔍 Fetching jobs from RemoteOK API...")
+            cached = _feed_cache.get("feed")
+            if cached and cached[0] >= limit:
+                log.info("Using cached RemoteOK feed")
+                jobs_data = cached[1][:limit]
+            else:
+                log.info("Fetching jobs from RemoteOK API...")
+                
+                # RemoteOK API returns JSON directly; pooled client, limiter and
+                # retry policy all come from fetch_with_retry
+                content = await self.fetch_with_retry(self.api_url, as_bytes=True)
+                if content is None:
+                    log.warning("Failed to fetch RemoteOK API")
+                    return []
+                jobs_data = first_feed_jobs(content, limit)
+                if jobs_data:
+                    _feed_cache["feed"] = (limit, jobs_data)
             
-            # RemoteOK API returns JSON directly
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.api_url)
-                response.raise_for_status()
-                data = response.json()
-            
-            if not data or len(data) == 0:
-                print("⚠️ No jobs found from RemoteOK")
+            if not jobs_data:
+                log.warning("No jobs found from RemoteOK")
                 return []
             
-            # First item is metadata, skip it
-            jobs_data = data[1:limit+1] if len(data) > 1 else []
-            
-            normalized_jobs = []
-            
-            for job_data in jobs_data:
-                try:
-                    # Extract skills/tags
-                    skills = []
-                    if "tags" in job_data and job_data["tags"]:
-                        skills = [tag for tag in job_data["tags"] if tag]
-                    
-                    # Parse salary if available
-                    salary_min = job_data.get("salary_min")
-                    salary_max = job_data.get("salary_max")
-                    
-                    # Build job URL
-                    job_url = f"https://remoteok.com/remote-jobs/{job_data.get('id', '')}"
-                    
-                    # Create raw data dict
-                    raw_data = {
-                        "title": job_data.get("position", "Unknown"),
-                        "company": job_data.get("company", "Unknown"),
-                        "location": job_data.get("location", "Remote"),
-                        "remote_type": "Remote",  # RemoteOK is all remote
-                        "job_type": "Full-time",  # Default
-                        "salary_min": salary_min,
-                        "salary_max": salary_max,
-                        "currency": "USD",
-                        "skills": skills[:10],  # Limit to 10 skills
-                        "experience": "",  # Not provided by RemoteOK
-                        "description": job_data.get("description", ""),
-                        "url": job_url
-                    }
-                    
-                    # Normalize and add to list
-                    normalized_job = self.normalize_job_data(raw_data)
-                    normalized_jobs.append(normalized_job)
-                    
-                except Exception as e:
-                    print(f"❌ Error parsing RemoteOK job: {e}")
-                    continue
+            # Map feed entries to raw jobs and normalize them in one hop off the event loop
+            normalized_jobs = await self.normalize_jobs(jobs_data, to_raw=feed_entry_to_raw)
             
-            print(f"✅ RemoteOK: Parsed {len(normalized_jobs)} jobs")
+            log.info("RemoteOK: Parsed %d jobs", len(normalized_jobs))
             return normalized_jobs
             
-        except Exception as e:
-            print(f"❌ RemoteOK scraping error: {e}")
+        except Exception:
+            log.exception("RemoteOK scraping error")
             return []
 
 
@@ -3,18 +3,55 @@
 We Work Remotely Job Scraper
 
 Scrapes jobs from WeWorkRemotely.com
-Uses HTML parsing with BeautifulSoup.
+Uses HTML parsing with BeautifulSoup; descriptions come from each job's detail page.
 """
 
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional
+from bs4 import BeautifulSoup, SoupStrainer
 import re
+from urllib.parse import urljoin
 from app.scrapers.base_scraper import BaseScraper
+from app.scrapers._patterns import build_skill_automaton, extract_skills
+
+log = logging.getLogger(__name__)
+
+
+COMMON_SKILLS = (
+    "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust",
+    "React", "Vue", "Angular", "Node.js", "Django", "Flask", "FastAPI",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "PostgreSQL", "MongoDB",
+    "Machine Learning", "AI", "DevOps", "Frontend", "Backend", "Full Stack"
+)
+
+SKILL_AUTOMATON = build_skill_automaton(COMMON_SKILLS)
+
+# Only build the subtrees we read; header, nav, scripts and footer are skipped while parsing
+LISTING_STRAINER = SoupStrainer('li', class_='feature')
+DESCRIPTION_STRAINER = SoupStrainer('div', class_='listing-container')
+
+# Detail pages fetched per run; with the listing page this stays inside one
+# minute of the 20 req/min budget. Jobs past the cap keep their title as description.
+MAX_DETAIL_FETCHES = 15
+
+
+def _parse_descriptions(pages: List[Optional[str]]) -> List[Optional[str]]:
+    """Description text of each job detail page (None where the fetch or lookup failed)"""
+    descriptions = []
+    for html in pages:
+        soup = BeautifulSoup(html, 'lxml', parse_only=DESCRIPTION_STRAINER) if html else None
+        container = soup.find('div', class_='listing-container') if soup else None
+        descriptions.append(container.get_text(' ', strip=True) if container else None)
+    return descriptions
 
 
 class WeWorkRemotelyScraper(BaseScraper):
     """Scraper for WeWorkRemotely.com jobs"""
     
+    # Listing page plus up to MAX_DETAIL_FETCHES detail pages under a 20 req/min limiter
+    scrape_timeout = 300
+    
     def __init__(self):
         super().__init__(
             platform_name="WeWorkRemotely",
@@ -36,28 +73,28 @@ class WeWorkRemotelyScraper(BaseScraper):
         """
         
         try:
-            print(f"🔍 Fetching jobs from WeWorkRemotely...")
+            log.info("Fetching jobs from WeWorkRemotely...")
             
             # Fetch the jobs page
             html = await self.fetch_with_retry(self.jobs_url)
             
             if not html:
-                print("⚠️ Failed to fetch WeWorkRemotely page")
+                log.warning("Failed to fetch WeWorkRemotely page")
                 return []
             
-            # Parse HTML
-            soup = BeautifulSoup(html, 'html.parser')
+            # Parse HTML (C-backed lxml tree builder; lxml is in requirements.txt)
+            soup = BeautifulSoup(html, 'lxml', parse_only=LISTING_STRAINER)
             
-            # Find job listings
-            job_listings = soup.find_all('li', class_='feature')
+            # Find job listings (the tree walk stops once `limit` are found)
+            job_listings = soup.find_all('li', class_='feature', limit=limit)
             
             if not job_listings:
-                print("⚠️ No job listings found on WeWorkRemotely")
+                log.warning("No job listings found on WeWorkRemotely")
                 return []
             
-            normalized_jobs = []
+            raw_jobs = []
             
-            for job_elem in job_listings[:limit]:
+            for job_elem in job_listings:
                 try:
                     # Extract job details
                     title_elem = job_elem.find('span', class_='title')
@@ -69,7 +106,7 @@ class WeWorkRemotelyScraper(BaseScraper):
                     
                     title = title_elem.get_text(strip=True)
                     company = company_elem.get_text(strip=True)
-                    job_url = self.base_url + link_elem.get('href', '')
+                    job_url = urljoin(self.base_url, link_elem.get('href', ''))
                     
                     # Extract region/location if available
                     region_elem = job_elem.find('span', class_='region')
@@ -87,41 +124,46 @@ class WeWorkRemotelyScraper(BaseScraper):
                         "currency": "USD",
                         "skills": self._extract_skills_from_title(title),
                         "experience": "",
-                        "description": title,  # Would need to fetch individual job page for full description
+                        "description": title,  # Replaced with the detail page text below when it loads
                         "url": job_url
                     }
                     
-                    # Normalize and add to list
-                    normalized_job = self.normalize_job_data(raw_data)
-                    normalized_jobs.append(normalized_job)
+                    raw_jobs.append(raw_data)
                     
                 except Exception as e:
-                    print(f"❌ Error parsing WeWorkRemotely job: {e}")
+                    log.error("Error parsing WeWorkRemotely job: %s", e)
                     continue
             
-            print(f"✅ WeWorkRemotely: Parsed {len(normalized_jobs)} jobs")
+            # Detail pages carry the real description; fetch them only for jobs not
+            # stored yet (known ones are dropped as duplicates on store anyway), capped per run
+            to_fetch = [job for job in raw_jobs if not self.is_known_job_url(job["url"])]
+            if len(to_fetch) > MAX_DETAIL_FETCHES:
+                log.info(
+                    "WeWorkRemotely: fetching %d of %d new detail pages",
+                    MAX_DETAIL_FETCHES, len(to_fetch)
+                )
+                to_fetch = to_fetch[:MAX_DETAIL_FETCHES]
+            
+            # Concurrent fetches: the scraper's gate caps requests in flight, its limiter the rate
+            pages = await asyncio.gather(*(self.fetch_with_retry(job["url"]) for job in to_fetch))
+            descriptions = await asyncio.to_thread(_parse_descriptions, pages)
+            for raw_data, description in zip(to_fetch, descriptions):
+                if description:
+                    raw_data["description"] = description
+            
+            # Normalize the whole batch off the event loop
+            normalized_jobs = await self.normalize_jobs(raw_jobs)
+            
+            log.info("WeWorkRemotely: Parsed %d jobs", len(normalized_jobs))
             return normalized_jobs
             
-        except Exception as e:
-            print(f"❌ WeWorkRemotely scraping error: {e}")
+        except Exception:
+            log.exception("WeWorkRemotely scraping error")
             return []
     
     def _extract_skills_from_title(self, title: str) -> List[str]:
-        """Extract skills from job title"""
-        skills = []
-        common_skills = [
-            "Python", "JavaScript", "TypeScript", "Java", "C++", "C#", "Go", "Rust",
-            "React", "Vue", "Angular", "Node.js", "Django", "Flask", "FastAPI",
-            "AWS", "Azure", "GCP", "Docker", "Kubernetes", "PostgreSQL", "MongoDB",
-            "Machine Learning", "AI", "DevOps", "Frontend", "Backend", "Full Stack"
-        ]
-        
-        title_lower = title.lower()
-        for skill in common_skills:
-            if skill.lower() in title_lower:
-                skills.append(skill)
-        
-        return skills
+        """Extract skills from job title (single Aho-Corasick pass)"""
+        return extract_skills(title, SKILL_AUTOMATON)
 
 
 # Example usage
@@ -143,5 +185,4 @@ async def test_weworkremotely_scraper():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(test_weworkremotely_scraper())
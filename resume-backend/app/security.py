@@ -1,8 +1,11 @@
+import asyncio
+import time
 from datetime import datetime, timedelta
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status, Header
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from app.config import settings
 
 
@@ -11,18 +14,37 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_DAYS = 7
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2id for new hashes; bcrypt hashes still verify and are rehashed on next login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,  # KiB
+    argon2__parallelism=1
+)
 
+# Decoded claims keyed by the raw token. A token can't change before it expires,
+# so hits skip the HMAC check and JSON parse; exp is still enforced on every hit
+TOKEN_CACHE_TTL = 60  # seconds
+_token_cache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
 
+async def get_password_hash(password: str) -> str:
+    # Hashing is deliberately slow CPU work - keep it off the event loop
+    return await asyncio.to_thread(pwd_context.hash, password)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Check a password off the event loop.
+    
+    Returns (valid, new_hash); new_hash is set when the stored hash uses a
+    deprecated scheme (bcrypt) or outdated parameters and should be replaced.
+    """
     try:
-        return pwd_context.verify(plain_password, hashed_password)
-    except:
-        return False
+        return await asyncio.to_thread(pwd_context.verify_and_update, plain_password, hashed_password)
+    except Exception:
+        return False, None
 
 
 def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
@@ -39,6 +61,34 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     return encoded_jwt
 
 
+def _decode_token(token: str) -> Optional[dict]:
+    """User claims for a valid token, None if it is invalid or expired"""
+    cached = _token_cache.get(token)
+    if cached is not None:
+        user, expires_at = cached
+        if expires_at is None or expires_at > time.time():
+            return dict(user)
+        _token_cache.pop(token, None)
+        return None
+    
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    
+    user_id: str = payload.get("sub")
+    if user_id is None:
+        return None
+    
+    user = {
+        "user_id": user_id,
+        "role": payload.get("role", "user"),
+        "email": payload.get("email")
+    }
+    _token_cache[token] = (user, payload.get("exp"))
+    return dict(user)
+
+
 async def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
     if not authorization:
         raise HTTPException(
@@ -56,29 +106,14 @@ async def get_current_user(authorization: Optional[str] = Header(None)) -> dict:
             detail="Invalid authorization header format"
         )
     
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        role: str = payload.get("role", "user")
-        email: str = payload.get("email")
-        
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token"
-            )
-        
-        return {
-            "user_id": user_id,
-            "role": role,
-            "email": email
-        }
-    
-    except JWTError:
+    user = _decode_token(token)
+    if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
+    
+    return user
 
 
 async def get_current_user_optional(authorization: Optional[str] = Header(None)) -> Optional[dict]:
@@ -96,23 +131,7 @@ async def get_current_user_optional(authorization: Optional[str] = Header(None))
     except (ValueError, IndexError):
         return None
     
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        role: str = payload.get("role", "user")
-        email: str = payload.get("email")
-        
-        if user_id is None:
-            return None
-        
-        return {
-            "user_id": user_id,
-            "role": role,
-            "email": email
-        }
-    
-    except JWTError:
-        return None
+    return _decode_token(token)
 
 
 def get_admin_user(current_user: dict = Depends(get_current_user)) -> dict:
@@ -1,7 +1,7 @@
 
 import os
 import google.generativeai as genai
-from groq import Groq
+from groq import AsyncGroq
 from app.config import settings
 import traceback
 
@@ -18,11 +18,13 @@ class AIService:
         """Initialize both AI clients"""
         self.groq_client = None
         self.gemini_configured = False
+        self.gemini_model = None
         
         # Initialize Groq
         if settings.GROQ_API_KEY:
             try:
-                self.groq_client = Groq(api_key=settings.GROQ_API_KEY)
+                # Async client: completions are awaited instead of blocking the event loop
+                self.groq_client = AsyncGroq(api_key=settings.GROQ_API_KEY)
                 print("✅ Groq Client Initialized")
             except Exception as e:
                 print(f"⚠️ Failed to initialize Groq: {e}")
@@ -31,6 +33,8 @@ class AIService:
         if settings.GEMINI_API_KEY:
             try:
                 genai.configure(api_key=settings.GEMINI_API_KEY)
+                # One model per process, reused by every fallback call
+                self.gemini_model = genai.GenerativeModel(settings.GEMINI_MODEL)
                 self.gemini_configured = True
                 print("✅ Gemini API Configured")
             except Exception as e:
@@ -50,7 +54,7 @@ class AIService:
                 
                 messages.append({"role": "user", "content": prompt})
                 
-                completion = self.groq_client.chat.completions.create(
+                completion = await self.groq_client.chat.completions.create(
                     model="llama-3.3-70b-versatile",
                     messages=messages,
                     temperature=0.7,
@@ -70,15 +74,13 @@ class AIService:
         # 2. Fallback to Gemini
         if self.gemini_configured:
             try:
-                model = genai.GenerativeModel(settings.GEMINI_MODEL)
-                
                 # Gemini doesn't have system role in `generate_content` easily without beta API or chat
                 # We prepend system instruction to prompt for simplicity
                 full_prompt = prompt
                 if system_instruction:
                     full_prompt = f"System Instruction: {system_instruction}\n\nUser Query: {prompt}"
                 
-                response = model.generate_content(full_prompt)
+                response = await self.gemini_model.generate_content_async(full_prompt)
                 return response.text
 
             except Exception as e:
@@ -102,7 +104,7 @@ class AIService:
                 
                 groq_messages.extend(messages)
                 
-                completion = self.groq_client.chat.completions.create(
+                completion = await self.groq_client.chat.completions.create(
                     model="llama-3.3-70b-versatile",
                     messages=groq_messages,
                     temperature=0.7,
@@ -143,8 +145,6 @@ class AIService:
                      role = "user" if msg["role"] == "user" else "model"
                      formatted_history.append({"role": role, "parts": [msg["content"]]})
 
-                model = genai.GenerativeModel(settings.GEMINI_MODEL)
-                
                 # Inject system instruction if possible or prepend
                 if system_instruction:
                     # Best attempt to simulate system prompt in Gemini
@@ -157,8 +157,8 @@ class AIService:
                      else:
                          current_query = f"System: {system_instruction}\n\n{current_query}"
 
-                chat = model.start_chat(history=formatted_history)
-                response = chat.send_message(current_query)
+                chat = self.gemini_model.start_chat(history=formatted_history)
+                response = await chat.send_message_async(current_query)
                 return response.text
 
             except Exception as e:
@@ -1,12 +1,69 @@
+import asyncio
 import google.generativeai as genai
-import json
-import re
-from typing import Dict, Any, List
+import hashlib
+import logging
+import orjson
+import random
+from typing import Dict, Any, List, Optional
+from cachetools import TTLCache
+from google.api_core import exceptions as google_exceptions
 from app.config import settings
 
+log = logging.getLogger(__name__)
+
 # Configure Gemini
 genai.configure(api_key=settings.GEMINI_API_KEY)
 
+# batch_process: jobs per prompt, prompts in flight, attempts per prompt on quota errors
+BATCH_SIZE = 15
+BATCH_CONCURRENCY = 4
+BATCH_MAX_RETRIES = 3
+
+# Constrained JSON output: replies are the bare object / array, no fences or prose to strip
+_JOB_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "company": {"type": "string"},
+        "location": {"type": "string"},
+        "job_type": {"type": "string"},
+        "remote_type": {"type": "string"},
+        "salary": {"type": "string", "nullable": True},
+        "required_skills": {"type": "array", "items": {"type": "string"}},
+        "category": {"type": "string"},
+        "summary": {"type": "string"}
+    },
+    "required": ["title", "company", "location", "job_type", "remote_type", "required_skills", "category", "summary"]
+}
+# Batch items echo the job's number from the prompt, so replies are matched by id, not position
+_BATCH_JOB_SCHEMA = {
+    "type": "object",
+    "properties": {"job_index": {"type": "integer"}, **_JOB_SCHEMA["properties"]},
+    "required": ["job_index", *_JOB_SCHEMA["required"]]
+}
+JOB_GENERATION_CONFIG = {"response_mime_type": "application/json", "response_schema": _JOB_SCHEMA}
+BATCH_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {"type": "array", "items": _BATCH_JOB_SCHEMA}
+}
+
+# Gemini's fields per posting content, so reposted/duplicate listings skip the LLM.
+# In-process like the app's other caches (there is no Redis in this stack)
+ENHANCE_CACHE_TTL = 7 * 24 * 3600  # seconds
+_enhance_cache = TTLCache(maxsize=4096, ttl=ENHANCE_CACHE_TTL)
+
+
+def _content_key(job: Dict[str, Any]) -> str:
+    """Hash of the posting fields the prompts are built from"""
+    content = "|".join((
+        job.get('title') or '',
+        job.get('company') or '',
+        job.get('location') or '',
+        (job.get('description') or '')[:500]
+    ))
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
 class GeminiJobProcessor:
     """
     Process job data using Gemini AI to align, clean, and enhance content.
@@ -19,6 +76,10 @@ class GeminiJobProcessor:
         """
         Process a single job using Gemini to normalize and extract fields.
         """
+        key = _content_key(raw_job)
+        cached = _enhance_cache.get(key)
+        if cached is not None:
+            return {**raw_job, **cached}
         
         # Prepare the prompt
         prompt = f"""
@@ -55,37 +116,147 @@ class GeminiJobProcessor:
         """
         
         try:
-            response = self.model.generate_content(prompt)
-            return self._parse_response(response.text, raw_job)
+            response = await self.model.generate_content_async(prompt, generation_config=JOB_GENERATION_CONFIG)
+            data = self._parse_response(response.text)
         except Exception as e:
-            print(f"⚠️ Gemini processing failed for {raw_job.get('title')}: {e}")
+            log.warning("Gemini processing failed for %s: %s", raw_job.get("title"), e)
             return raw_job # Fallback to raw data
+        
+        if data is None:
+            return raw_job
+        
+        _enhance_cache[key] = data
+        # Merge with original data to keep URLs etc
+        return {**raw_job, **data}
 
-    def _parse_response(self, text: str, fallback_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Parse JSON response from Gemini"""
+    def _parse_response(self, text: str) -> Optional[Dict[str, Any]]:
+        """Parse a JSON object reply (None if it isn't one, e.g. a truncated reply)"""
         try:
-            # Clean up md formatting
-            text = text.replace("```json", "").replace("```", "").strip()
-            
-            # Find JSON block
-            json_match = re.search(r'\{[\s\S]*\}', text)
-            if json_match:
-                data = json.loads(json_match.group(0))
-                # Merge with original data to keep URLs etc
-                return {**fallback_data, **data}
-            
-            return fallback_data
-            
-        except Exception:
-            return fallback_data
+            data = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return None
+        return data if isinstance(data, dict) else None
 
     async def batch_process(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Process a batch of jobs (not used yet due to rate limits)"""
-        processed = []
+        """
+        Process jobs BATCH_SIZE per prompt, at most BATCH_CONCURRENCY prompts in flight.
+        
+        Results come back in input order. Jobs already in the enhance cache
+        skip the LLM; a chunk whose reply doesn't parse to exactly one object
+        per job number falls back to process_job for each of its jobs.
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        pending: List[Dict[str, Any]] = []
         for job in jobs:
-            result = await self.process_job(job)
-            processed.append(result)
-        return processed
+            cached = _enhance_cache.get(_content_key(job))
+            results.append({**job, **cached} if cached is not None else None)
+            if cached is None:
+                pending.append(job)
+        
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+        chunks = [pending[i:i + BATCH_SIZE] for i in range(0, len(pending), BATCH_SIZE)]
+        processed = await asyncio.gather(*(self._process_chunk(chunk, semaphore) for chunk in chunks))
+        fresh = iter([job for chunk in processed for job in chunk])
+        return [result if result is not None else next(fresh) for result in results]
+    
+    async def _process_chunk(self, chunk: List[Dict[str, Any]], semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """One prompt for the whole chunk, falling back to one prompt per job"""
+        async with semaphore:
+            text = await self._generate_with_backoff(self._batch_prompt(chunk))
+        
+        parsed = self._parse_batch_response(text, len(chunk)) if text else None
+        if parsed is None:
+            log.warning("Gemini batch reply unusable for %d jobs, processing them one by one", len(chunk))
+            return [await self.process_job(job) for job in chunk]
+        
+        for job, data in zip(chunk, parsed):
+            _enhance_cache[_content_key(job)] = data
+        
+        # Merge with original data to keep URLs etc
+        return [{**job, **data} for job, data in zip(chunk, parsed)]
+    
+    async def _generate_with_backoff(self, prompt: str) -> Optional[str]:
+        """Generate a reply, backing off with jitter on quota (429) errors"""
+        for attempt in range(BATCH_MAX_RETRIES):
+            try:
+                response = await self.model.generate_content_async(prompt, generation_config=BATCH_GENERATION_CONFIG)
+                return response.text
+            except google_exceptions.ResourceExhausted as e:
+                if attempt >= BATCH_MAX_RETRIES - 1:
+                    log.warning("Gemini quota exhausted after %d attempts: %s", BATCH_MAX_RETRIES, e)
+                    return None
+                await asyncio.sleep(2 ** attempt + random.random())
+            except Exception as e:
+                log.warning("Gemini batch request failed: %s", e)
+                return None
+        return None
+    
+    def _batch_prompt(self, jobs: List[Dict[str, Any]]) -> str:
+        """Numbered raw jobs plus the same task as process_job, asking for a JSON array"""
+        listings = "\n".join(
+            f"""
+        Job {i}:
+        Title: {job.get('title', 'Unknown')}
+        Company: {job.get('company', 'Unknown')}
+        Location: {job.get('location', 'Unknown')}
+        Description: {job.get('description', '')[:1000]}... (truncated)"""
+            for i, job in enumerate(jobs, 1)
+        )
+        
+        return f"""
+        You are an AI Job Data Specialist. align and standardise these {len(jobs)} job postings.
+        
+        Raw Job Data:
+        {listings}
+        
+        Task, for each job:
+        1. Standardize the Job Title (e.g., "Sr. Dev" -> "Senior Developer")
+        2. Clean the Company Name
+        3. Determine Job Type (Full-time, Part-time, Contract, Internship)
+        4. Determine Remote Type (Remote, Hybrid, On-site)
+        5. Extract formatted Salary (if available, else null)
+        6. EXTRACT SKILLS (very important) as an array of strings
+        7. Categorize the role (Frontend, Backend, Full Stack, DevOps, Data Science, Mobile, Other)
+        8. Write a short, engaging summary (2-3 sentences)
+        
+        Return JSON ONLY: an array with exactly {len(jobs)} objects, one per job above,
+        each with "job_index" set to that job's number:
+        [
+            {{
+                "job_index": 1,
+                "title": "Standardized Title",
+                "company": "Clean Company Name",
+                "location": "City, Country",
+                "job_type": "Full-time",
+                "remote_type": "Remote",
+                "salary": "$100k - $120k" or null,
+                "required_skills": ["Skill1", "Skill2"],
+                "category": "Frontend",
+                "summary": "Engaging summary..."
+            }}
+        ]
+        """
+    
+    def _parse_batch_response(self, text: str, expected: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse a JSON array reply into per-job fields in prompt order.
+        None unless it holds exactly one object for each job_index 1..expected,
+        so a reordered or merged reply never writes one job's fields into another.
+        """
+        try:
+            data = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return None
+        if not isinstance(data, list) or len(data) != expected or not all(isinstance(item, dict) for item in data):
+            return None
+        
+        by_index = {item.get("job_index"): item for item in data}
+        if set(by_index) != set(range(1, expected + 1)):
+            return None
+        return [
+            {key: value for key, value in by_index[i].items() if key != "job_index"}
+            for i in range(1, expected + 1)
+        ]
 
 # Global instance
 job_processor = GeminiJobProcessor()
@@ -6,40 +6,70 @@ Handles automatic deletion of jobs after 3 days if not applied/saved.
 Tracks job interactions (applies, saves) and manages job expiration.
 """
 
+import asyncio
+import contextlib
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from bson import ObjectId
+from bson.errors import InvalidId
+from cachetools import TTLCache
 from app.db import db
 
+# log_job_event queues events; a background task writes them in insert_many batches
+EVENT_FLUSH_INTERVAL = 0.5  # seconds to let a batch fill after its first event
+EVENT_BATCH_SIZE = 500
+_event_queue: Optional[asyncio.Queue] = None
+_event_writer: Optional[asyncio.Task] = None
 
-async def cleanup_expired_jobs() -> int:
+# Every job listing request kicks off a cleanup. Jobs only become eligible by aging
+# past the cutoff, so scanning more often than this just repeats the same delete
+CLEANUP_MIN_INTERVAL = 300  # seconds
+_last_cleanup = float("-inf")  # time.monotonic() of the last scan
+
+# Admin lifecycle stats, recomputed at most this often (dropped when a cleanup deletes jobs)
+LIFECYCLE_STATS_TTL = 30  # seconds
+_stats_cache = TTLCache(maxsize=1, ttl=LIFECYCLE_STATS_TTL)
+
+
+async def cleanup_expired_jobs(force: bool = False) -> int:
     """
     Delete jobs older than 1 day (24 hours) with no applications or saves.
     
+    Args:
+        force: Scan even if the last cleanup ran within CLEANUP_MIN_INTERVAL
+    
     Returns:
         Number of jobs deleted
     """
+    global _last_cleanup
+    now = time.monotonic()
+    if not force and now - _last_cleanup < CLEANUP_MIN_INTERVAL:
+        return 0
+    _last_cleanup = now
+    
     try:
         cutoff_date = datetime.utcnow() - timedelta(days=1)  # Changed from 3 days to 1 day (24 hours)
         
         # Delete jobs that are:
         # 1. Created more than 1 day (24 hours) ago
-        # 2. Have no users in applied_by array
-        # 3. Have no users in saved_by array
+        # 2. Never applied to (apply_count is $inc'd alongside every applied_by push)
+        # 3. Not saved (save_count tracks saved_by on save/unsave)
+        # Plain equality on the counters lets this walk the lifecycle_cleanup_partial index
         result = await db.jobs.delete_many({
             "created_at": {"$lt": cutoff_date},
-            "$expr": {
-                "$and": [
-                    {"$eq": [{"$size": {"$ifNull": ["$applied_by", []]}}, 0]},
-                    {"$eq": [{"$size": {"$ifNull": ["$saved_by", []]}}, 0]}
-                ]
-            }
+            "apply_count": 0,
+            "save_count": 0
         })
         
         deleted_count = result.deleted_count
         
         if deleted_count > 0:
             print(f"✅ Lifecycle Cleanup: Deleted {deleted_count} expired jobs")
+            _stats_cache.clear()
+            # Deleted jobs drop out of every cached list (import here: the jobs router imports this module)
+            from app.routers.jobs import invalidate_jobs_cache
+            invalidate_jobs_cache()
             
             # Log cleanup event
             await log_cleanup_event(deleted_count, "success")
@@ -60,28 +90,23 @@ async def sync_job_counts() -> int:
         Number of jobs updated
     """
     try:
-        updated_count = 0
-        
-        # Get all jobs
-        async for job in db.jobs.find({}):
-            apply_count = len(job.get("applied_by", []))
-            save_count = len(job.get("saved_by", []))
-            
-            # Update counts
-            await db.jobs.update_one(
-                {"_id": job["_id"]},
-                {
-                    "$set": {
-                        "apply_count": apply_count,
-                        "save_count": save_count,
-                        "last_checked": datetime.utcnow()
-                    }
+        # One pipeline update: the server recomputes every job's counts in place
+        # instead of a find + update_one round trip per job (MongoDB 4.2+)
+        result = await db.jobs.update_many({}, [
+            {
+                "$set": {
+                    "apply_count": {"$size": {"$ifNull": ["$applied_by", []]}},
+                    "save_count": {"$size": {"$ifNull": ["$saved_by", []]}},
+                    "last_checked": "$$NOW"
                 }
-            )
-            updated_count += 1
+            }
+        ])
+        updated_count = result.modified_count
         
         if updated_count > 0:
             print(f"✅ Sync: Updated counts for {updated_count} jobs")
+            from app.routers.jobs import invalidate_jobs_cache
+            invalidate_jobs_cache()
         
         return updated_count
         
@@ -114,12 +139,62 @@ async def log_job_event(
             "details": details or {}
         }
         
-        await db.job_lifecycle_logs.insert_one(event)
+        if _event_writer is not None:
+            _event_queue.put_nowait(event)
+        else:
+            # Writer not running (scripts, tests) - write directly
+            await db.job_lifecycle_logs.insert_one(event)
         
     except Exception as e:
         print(f"❌ Error logging job event: {e}")
 
 
+async def _insert_events(batch: list) -> None:
+    try:
+        await db.job_lifecycle_logs.insert_many(batch, ordered=False)
+    except Exception as e:
+        print(f"❌ Error logging {len(batch)} job events: {e}")
+
+
+async def _write_events() -> None:
+    """Drain the event queue into insert_many batches until cancelled"""
+    batch = []
+    try:
+        while True:
+            batch = [await _event_queue.get()]
+            await asyncio.sleep(EVENT_FLUSH_INTERVAL)
+            while len(batch) < EVENT_BATCH_SIZE and not _event_queue.empty():
+                batch.append(_event_queue.get_nowait())
+            await _insert_events(batch)
+            batch = []
+    except asyncio.CancelledError:
+        # Shutdown: write the batch in hand plus anything still queued
+        while not _event_queue.empty():
+            batch.append(_event_queue.get_nowait())
+        if batch:
+            await _insert_events(batch)
+        raise
+
+
+def start_event_writer() -> None:
+    """Start batching lifecycle events (app startup)"""
+    global _event_queue, _event_writer
+    if _event_writer is None:
+        _event_queue = asyncio.Queue()
+        _event_writer = asyncio.create_task(_write_events())
+
+
+async def stop_event_writer() -> None:
+    """Flush queued lifecycle events and stop the writer (app shutdown)"""
+    global _event_writer
+    if _event_writer is None:
+        return
+    _event_writer.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _event_writer
+    _event_writer = None
+
+
 async def log_cleanup_event(
     deleted_count: int,
     status: str,
@@ -160,13 +235,15 @@ async def mark_job_for_deletion(job_id: str, days: int = 3) -> bool:
         True if marked successfully
     """
     try:
-        if not ObjectId.is_valid(job_id):
+        try:
+            job_oid = ObjectId(job_id)
+        except (InvalidId, TypeError):
             return False
         
         expires_at = datetime.utcnow() + timedelta(days=days)
         
         result = await db.jobs.update_one(
-            {"_id": ObjectId(job_id)},
+            {"_id": job_oid},
             {"$set": {"expires_at": expires_at}}
         )
         
@@ -188,11 +265,13 @@ async def remove_deletion_mark(job_id: str) -> bool:
         True if unmarked successfully
     """
     try:
-        if not ObjectId.is_valid(job_id):
+        try:
+            job_oid = ObjectId(job_id)
+        except (InvalidId, TypeError):
             return False
         
         result = await db.jobs.update_one(
-            {"_id": ObjectId(job_id)},
+            {"_id": job_oid},
             {"$unset": {"expires_at": ""}}
         )
         
@@ -210,29 +289,52 @@ async def get_lifecycle_stats() -> Dict[str, Any]:
     Returns:
         Dictionary with lifecycle statistics
     """
+    cached = _stats_cache.get("stats")
+    if cached is not None:
+        return cached
+    
     try:
-        total_jobs = await db.jobs.count_documents({})
-        
-        jobs_with_applies = await db.jobs.count_documents({
-            "$expr": {"$gt": [{"$size": {"$ifNull": ["$applied_by", []]}}, 0]}
-        })
+        # All job counts in one aggregation; the other collections are queried alongside it
+        facet_pipeline = [{
+            "$facet": {
+                "total": [{"$count": "n"}],
+                "with_applies": [
+                    {"$match": {"$expr": {"$gt": [{"$size": {"$ifNull": ["$applied_by", []]}}, 0]}}},
+                    {"$count": "n"}
+                ],
+                "with_saves": [
+                    {"$match": {"$expr": {"$gt": [{"$size": {"$ifNull": ["$saved_by", []]}}, 0]}}},
+                    {"$count": "n"}
+                ],
+                "pending_deletion": [
+                    {"$match": {"expires_at": {"$ne": None, "$exists": True}}},
+                    {"$count": "n"}
+                ]
+            }
+        }]
         
-        jobs_with_saves = await db.jobs.count_documents({
-            "$expr": {"$gt": [{"$size": {"$ifNull": ["$saved_by", []]}}, 0]}
-        })
+        facet_result, total_applications, recent_cleanups = await asyncio.gather(
+            db.jobs.aggregate(facet_pipeline).to_list(1),
+            db.applications.count_documents({}),
+            # Get recent cleanup logs
+            db.system_logs.find({
+                "event": "job_cleanup"
+            }).sort("timestamp", -1).limit(5).to_list(5)
+        )
         
-        jobs_pending_deletion = await db.jobs.count_documents({
-            "expires_at": {"$ne": None, "$exists": True}
-        })
+        # Each facet is [] when nothing matched, else [{"n": count}]
+        counts = facet_result[0] if facet_result else {}
         
-        total_applications = await db.applications.count_documents({})
+        def facet_count(name: str) -> int:
+            bucket = counts.get(name) or [{}]
+            return bucket[0].get("n", 0)
         
-        # Get recent cleanup logs
-        recent_cleanups = await db.system_logs.find({
-            "event": "job_cleanup"
-        }).sort("timestamp", -1).limit(5).to_list(5)
+        total_jobs = facet_count("total")
+        jobs_with_applies = facet_count("with_applies")
+        jobs_with_saves = facet_count("with_saves")
+        jobs_pending_deletion = facet_count("pending_deletion")
         
-        return {
+        stats = _stats_cache["stats"] = {
             "total_jobs_in_db": total_jobs,
             "jobs_with_applies": jobs_with_applies,
             "jobs_with_saves": jobs_with_saves,
@@ -247,6 +349,7 @@ async def get_lifecycle_stats() -> Dict[str, Any]:
                 for log in recent_cleanups
             ]
         }
+        return stats
         
     except Exception as e:
         print(f"❌ Error getting lifecycle stats: {e}")
@@ -14,9 +14,42 @@ based on 6 criteria:
 Also generates missing skills recommendations.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+from bisect import bisect_left
+from typing import List, Dict, Any, Optional, FrozenSet, Tuple
 from datetime import datetime
 
+from cachetools import TTLCache
+
+# Experience level hierarchy
+EXPERIENCE_LEVELS = {
+    "Entry": 1,
+    "Mid": 2,
+    "Senior": 3,
+    "Lead": 4
+}
+
+# Experience score by level difference: perfect, close, moderate, poor
+EXPERIENCE_DIFF_SCORES = (100.0, 75.0, 50.0, 25.0)
+
+# Salary score buckets: within 10%, 20%, 30%, 50% of the preference, or further
+SALARY_DIFF_EDGES = (10, 20, 30, 50)
+SALARY_DIFF_SCORES = (100.0, 85.0, 70.0, 50.0, 25.0)
+
+# Location score for remote/hybrid jobs by the user's remote preference;
+# the None entry scores any other (or missing) preference
+REMOTE_MATCH_SCORES = {
+    "Remote": {"Remote": 100.0, "Any": 100.0, "Hybrid": 75.0, None: 50.0},
+    "Hybrid": {"Hybrid": 100.0, "Any": 100.0, "Remote": 75.0, None: 85.0},
+}
+
+
+def salary_midpoint(salary_min: Optional[int], salary_max: Optional[int]) -> Optional[float]:
+    """Midpoint of a salary range, or whichever bound is set (None if neither)"""
+    if salary_min and salary_max:
+        return (salary_min + salary_max) / 2
+    return salary_min or salary_max
+
 
 class JobMatcher:
     """Intelligent job matching algorithm"""
@@ -30,6 +63,11 @@ class JobMatcher:
         "job_type": 5,
         "culture": 5
     }
+    assert sum(WEIGHTS.values()) == 100
+    
+    # WEIGHTS as fractions, in criterion order (skills, experience, location,
+    # salary, job_type, culture) for the weighted sum in calculate_match_score
+    _WEIGHT_VEC = tuple(weight / 100 for weight in WEIGHTS.values())
     
     def __init__(self):
         pass
@@ -38,7 +76,9 @@ class JobMatcher:
         self,
         job: Dict[str, Any],
         user_resume: Dict[str, Any],
-        user_preferences: Optional[Dict[str, Any]] = None
+        user_preferences: Optional[Dict[str, Any]] = None,
+        resume_skill_set: Optional[FrozenSet[str]] = None,
+        include_recommendations: bool = True
     ) -> Dict[str, Any]:
         """
         Calculate comprehensive match score for a job.
@@ -47,6 +87,10 @@ class JobMatcher:
             job: Job dictionary with required fields
             user_resume: User's resume data (skills, experience)
             user_preferences: User's job preferences (optional)
+            resume_skill_set: Precomputed resume_skill_set(user_resume), when
+                scoring many jobs against the same resume
+            include_recommendations: False leaves recommendations empty, for
+                callers that only rank or display the scores
             
         Returns:
             Dictionary with overall score, criterion scores, and recommendations
@@ -57,12 +101,15 @@ class JobMatcher:
         job_experience = job.get("experience_level", "")
         job_location = job.get("location", "")
         job_remote = job.get("remote_type", "")
-        job_salary_min = job.get("salary_min")
-        job_salary_max = job.get("salary_max")
+        # Stored at scrape time; computed for jobs written before salary_mid existed
+        job_salary = job.get("salary_mid")
+        if job_salary is None:
+            job_salary = salary_midpoint(job.get("salary_min"), job.get("salary_max"))
         job_type = job.get("job_type", "Full-time")
         job_category = job.get("category", "")
         
-        resume_skills = user_resume.get("skills", [])
+        if resume_skill_set is None:
+            resume_skill_set = self.resume_skill_set(user_resume)
         resume_experience = user_resume.get("experience", [])
         
         # Get preferences (use defaults if not provided)
@@ -75,26 +122,20 @@ class JobMatcher:
         pref_job_types = preferences.get("job_types", ["Full-time"])
         pref_categories = preferences.get("job_categories", [])
         
+        # Each job skill is lowercased and looked up exactly once
+        matched_skills, missing_skills = self._partition_skills(job_skills, resume_skill_set)
+        
         # Calculate individual criterion scores
-        skills_score = self._calculate_skills_match(job_skills, resume_skills)
+        skills_score = self._calculate_skills_match(job_skills, matched_skills)
         experience_score = self._calculate_experience_match(job_experience, resume_experience, pref_experience)
         location_score = self._calculate_location_match(job_location, job_remote, pref_locations, pref_remote)
-        salary_score = self._calculate_salary_match(job_salary_min, job_salary_max, pref_salary_min, pref_salary_max)
+        salary_score = self._calculate_salary_match(job_salary, pref_salary_min, pref_salary_max)
         job_type_score = self._calculate_job_type_match(job_type, pref_job_types)
         culture_score = self._calculate_culture_match(job_category, pref_categories)
         
         # Calculate weighted overall score
-        overall_score = (
-            skills_score * self.WEIGHTS["skills"] / 100 +
-            experience_score * self.WEIGHTS["experience"] / 100 +
-            location_score * self.WEIGHTS["location"] / 100 +
-            salary_score * self.WEIGHTS["salary"] / 100 +
-            job_type_score * self.WEIGHTS["job_type"] / 100 +
-            culture_score * self.WEIGHTS["culture"] / 100
-        )
-        
-        # Generate missing skills recommendations
-        missing_skills = self._get_missing_skills(job_skills, resume_skills)
+        scores = (skills_score, experience_score, location_score, salary_score, job_type_score, culture_score)
+        overall_score = sum(score * weight for score, weight in zip(scores, self._WEIGHT_VEC))
         
         return {
             "overall_score": round(overall_score, 1),
@@ -107,15 +148,29 @@ class JobMatcher:
                 "culture": round(culture_score, 1)
             },
             "missing_skills": missing_skills,
-            "matched_skills": [skill for skill in job_skills if skill.lower() in [s.lower() for s in resume_skills]],
+            "matched_skills": matched_skills,
             "recommendations": self._generate_recommendations(
                 skills_score, experience_score, location_score,
                 salary_score, job_type_score, culture_score,
                 missing_skills
-            )
+            ) if include_recommendations else []
         }
     
-    def _calculate_skills_match(self, job_skills: List[str], resume_skills: List[str]) -> float:
+    @staticmethod
+    def resume_skill_set(user_resume: Dict[str, Any]) -> FrozenSet[str]:
+        """Lowercased resume skills (stored as skills_lower at upload; computed for older resumes)"""
+        return frozenset(
+            user_resume.get("skills_lower") or (skill.lower() for skill in user_resume.get("skills", []))
+        )
+    
+    def _partition_skills(self, job_skills: List[str], resume_skill_set: FrozenSet[str]) -> Tuple[List[str], List[str]]:
+        """Split job skills into (matched, missing) against lowercased resume skills, keeping the job's casing"""
+        matched, missing = [], []
+        for skill in job_skills:
+            (matched if skill.lower() in resume_skill_set else missing).append(skill)
+        return matched, missing
+    
+    def _calculate_skills_match(self, job_skills: List[str], matched_skills: List[str]) -> float:
         """
         Calculate skills match score (0-100).
         
@@ -124,18 +179,8 @@ class JobMatcher:
         if not job_skills:
             return 100.0  # No required skills = perfect match
         
-        if not resume_skills:
-            return 0.0  # No resume skills = no match
-        
-        # Normalize skills to lowercase for comparison
-        job_skills_lower = [skill.lower() for skill in job_skills]
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        
-        # Count matched skills
-        matched_count = sum(1 for skill in job_skills_lower if skill in resume_skills_lower)
-        
-        # Calculate percentage
-        match_percentage = (matched_count / len(job_skills)) * 100
+        # Calculate percentage (no resume skills = no matches = 0)
+        match_percentage = (len(matched_skills) / len(job_skills)) * 100
         
         return match_percentage
     
@@ -150,27 +195,17 @@ class JobMatcher:
         
         25% weight in overall score.
         """
-        # Experience level hierarchy
-        experience_levels = {
-            "Entry": 1,
-            "Mid": 2,
-            "Senior": 3,
-            "Lead": 4
-        }
-        
         # If job doesn't specify experience, perfect match
         if not job_experience:
             return 100.0
         
         # Get job experience level
-        job_level = experience_levels.get(job_experience, 2)  # Default to Mid
+        job_level = EXPERIENCE_LEVELS.get(job_experience, 2)  # Default to Mid
         
         # Determine user's experience level
-        user_level = 2  # Default to Mid
+        user_level = EXPERIENCE_LEVELS.get(pref_experience) if pref_experience else None
         
-        if pref_experience and pref_experience in experience_levels:
-            user_level = experience_levels[pref_experience]
-        elif resume_experience:
+        if user_level is None and resume_experience:
             # Estimate from years of experience in resume
             total_years = len(resume_experience)
             if total_years >= 7:
@@ -181,18 +216,12 @@ class JobMatcher:
                 user_level = 2  # Mid
             else:
                 user_level = 1  # Entry
+        elif user_level is None:
+            user_level = 2  # Default to Mid
         
         # Calculate score based on difference
         level_diff = abs(job_level - user_level)
-        
-        if level_diff == 0:
-            return 100.0  # Perfect match
-        elif level_diff == 1:
-            return 75.0   # Close match
-        elif level_diff == 2:
-            return 50.0   # Moderate match
-        else:
-            return 25.0   # Poor match
+        return EXPERIENCE_DIFF_SCORES[min(level_diff, 3)]
     
     def _calculate_location_match(
         self,
@@ -206,23 +235,10 @@ class JobMatcher:
         
         15% weight in overall score.
         """
-        # Remote jobs are always a good match if user prefers remote
-        if job_remote == "Remote":
-            if pref_remote in ["Remote", "Any"]:
-                return 100.0
-            elif pref_remote == "Hybrid":
-                return 75.0
-            else:
-                return 50.0
-        
-        # Hybrid jobs
-        if job_remote == "Hybrid":
-            if pref_remote in ["Hybrid", "Any"]:
-                return 100.0
-            elif pref_remote == "Remote":
-                return 75.0
-            else:
-                return 85.0
+        # Remote and hybrid jobs score on the remote preference alone
+        remote_scores = REMOTE_MATCH_SCORES.get(job_remote)
+        if remote_scores is not None:
+            return remote_scores.get(pref_remote, remote_scores[None])
         
         # On-site jobs - check location match
         if pref_remote == "Remote":
@@ -241,8 +257,7 @@ class JobMatcher:
     
     def _calculate_salary_match(
         self,
-        job_salary_min: Optional[int],
-        job_salary_max: Optional[int],
+        job_salary: Optional[float],
         pref_salary_min: Optional[int],
         pref_salary_max: Optional[int]
     ) -> float:
@@ -252,27 +267,14 @@ class JobMatcher:
         10% weight in overall score.
         """
         # If no salary info, return neutral score
-        if not job_salary_min and not job_salary_max:
+        if not job_salary:
             return 75.0
         
         if not pref_salary_min and not pref_salary_max:
             return 75.0
         
-        # Get job salary midpoint
-        if job_salary_min and job_salary_max:
-            job_salary = (job_salary_min + job_salary_max) / 2
-        elif job_salary_min:
-            job_salary = job_salary_min
-        else:
-            job_salary = job_salary_max
-        
         # Get preferred salary midpoint
-        if pref_salary_min and pref_salary_max:
-            pref_salary = (pref_salary_min + pref_salary_max) / 2
-        elif pref_salary_min:
-            pref_salary = pref_salary_min
-        else:
-            pref_salary = pref_salary_max or job_salary
+        pref_salary = salary_midpoint(pref_salary_min, pref_salary_max)
         
         # Calculate percentage difference
         if pref_salary == 0:
@@ -280,16 +282,8 @@ class JobMatcher:
         
         diff_percentage = abs(job_salary - pref_salary) / pref_salary * 100
         
-        if diff_percentage <= 10:
-            return 100.0  # Within 10%
-        elif diff_percentage <= 20:
-            return 85.0   # Within 20%
-        elif diff_percentage <= 30:
-            return 70.0   # Within 30%
-        elif diff_percentage <= 50:
-            return 50.0   # Within 50%
-        else:
-            return 25.0   # More than 50% difference
+        # bisect_left keeps the bucket edges inclusive (exactly 10% scores 100)
+        return SALARY_DIFF_SCORES[bisect_left(SALARY_DIFF_EDGES, diff_percentage)]
     
     def _calculate_job_type_match(self, job_type: str, pref_job_types: List[str]) -> float:
         """
@@ -325,18 +319,6 @@ class JobMatcher:
         
         return 50.0  # Different category
     
-    def _get_missing_skills(self, job_skills: List[str], resume_skills: List[str]) -> List[str]:
-        """Get list of skills required by job but missing from resume"""
-        job_skills_lower = [skill.lower() for skill in job_skills]
-        resume_skills_lower = [skill.lower() for skill in resume_skills]
-        
-        missing = []
-        for i, skill_lower in enumerate(job_skills_lower):
-            if skill_lower not in resume_skills_lower:
-                missing.append(job_skills[i])  # Use original case
-        
-        return missing
-    
     def _generate_recommendations(
         self,
         skills_score: float,
@@ -376,6 +358,41 @@ class JobMatcher:
 # Global matcher instance
 matcher = JobMatcher()
 
+# Resume fields read by calculate_match_score (skips the stored resume text)
+RESUME_MATCH_PROJECTION = {"skills": 1, "skills_lower": 1, "experience": 1}
+
+# user_id -> (resume, preferences, resume skill set); dropped on resume or
+# preference changes via invalidate_user_context, the TTL bounds staleness
+# across workers
+USER_CONTEXT_TTL = 60
+_user_context_cache = TTLCache(maxsize=1024, ttl=USER_CONTEXT_TTL)
+
+
+def invalidate_user_context(user_id: str) -> None:
+    """Forget a user's cached resume/preferences after they change"""
+    _user_context_cache.pop(user_id, None)
+
+
+async def _get_user_context(
+    user_id: str,
+    db
+) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], FrozenSet[str]]:
+    """Load (resume, preferences, resume skill set) for a user, cached per USER_CONTEXT_TTL"""
+    context = _user_context_cache.get(user_id)
+    if context is not None:
+        return context
+    
+    resume, prefs_doc = await asyncio.gather(
+        db.resumes.find_one({"user_id": user_id}, RESUME_MATCH_PROJECTION),
+        db.user_preferences.find_one({"user_id": user_id}, {"preferences": 1})
+    )
+    preferences = prefs_doc.get("preferences") if prefs_doc else None
+    resume_skill_set = matcher.resume_skill_set(resume) if resume else frozenset()
+    
+    context = (resume, preferences, resume_skill_set)
+    _user_context_cache[user_id] = context
+    return context
+
 
 # Helper function for easy use
 async def calculate_job_match(
@@ -394,20 +411,39 @@ async def calculate_job_match(
     Returns:
         Match score dictionary
     """
-    # Get user's resume
-    resume = await db.resumes.find_one({"user_id": user_id})
-    if not resume:
-        return {
-            "overall_score": 0.0,
-            "criterion_scores": {},
-            "missing_skills": job.get("skills_required", []),
-            "matched_skills": [],
-            "recommendations": ["Please upload a resume to see match scores"]
-        }
+    return (await calculate_job_matches([job], user_id, db))[0]
+
+
+async def calculate_job_matches(
+    jobs: List[Dict[str, Any]],
+    user_id: Optional[str],
+    db,
+    include_recommendations: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Calculate match scores for many jobs against one user.
     
-    # Get user's preferences
-    prefs_doc = await db.user_preferences.find_one({"user_id": user_id})
-    preferences = prefs_doc.get("preferences") if prefs_doc else None
+    The resume and preferences are loaded once (and cached briefly per
+    user) instead of once per job; results are in the same order as jobs.
+    """
+    resume, preferences, resume_skill_set = None, None, frozenset()
+    if user_id:
+        resume, preferences, resume_skill_set = await _get_user_context(user_id, db)
+    
+    if not resume:
+        return [
+            {
+                "overall_score": 0.0,
+                "criterion_scores": {},
+                "missing_skills": job.get("skills_required", []),
+                "matched_skills": [],
+                "recommendations": ["Please upload a resume to see match scores"]
+            }
+            for job in jobs
+        ]
     
-    # Calculate match
-    return matcher.calculate_match_score(job, resume, preferences)
+    # Calculate matches
+    return [
+        matcher.calculate_match_score(job, resume, preferences, resume_skill_set, include_recommendations)
+        for job in jobs
+    ]
@@ -8,88 +8,97 @@ Manages background tasks for:
 - Automated job scraping (every 6 hours)
 """
 
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
-from apscheduler.triggers.interval import IntervalTrigger
-from datetime import datetime
+import asyncio
+import logging
+from datetime import datetime, timedelta
 from app.services.job_lifecycle import cleanup_expired_jobs, sync_job_counts
 
+log = logging.getLogger(__name__)
+
+CLEANUP_HOUR = 2  # Local time, daily
+SYNC_INTERVAL = 3600  # Seconds
+
+
+def _seconds_until(hour: int) -> float:
+    """Seconds from now until the next local hour:00"""
+    now = datetime.now()
+    next_run = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
 
 class JobLifecycleScheduler:
     """Scheduler for job lifecycle management tasks"""
     
     def __init__(self):
-        self.scheduler = AsyncIOScheduler()
+        # Two periodic coroutines on the running event loop; no scheduler thread
+        self._tasks = []
         self._is_running = False
     
+    async def _run_daily_cleanup(self):
+        """Clean up expired jobs every day at CLEANUP_HOUR"""
+        while True:
+            await asyncio.sleep(_seconds_until(CLEANUP_HOUR))
+            try:
+                await cleanup_expired_jobs()
+            except Exception as e:
+                log.exception("❌ Scheduled job cleanup failed: %s", e)
+    
+    async def _run_hourly_sync(self):
+        """Sync job interaction counts every SYNC_INTERVAL seconds"""
+        while True:
+            await asyncio.sleep(SYNC_INTERVAL)
+            try:
+                await sync_job_counts()
+            except Exception as e:
+                log.exception("❌ Scheduled job count sync failed: %s", e)
+    
     def start(self):
         """Start the scheduler with all jobs"""
         if self._is_running:
-            print("⚠️ Scheduler already running")
+            log.warning("⚠️ Scheduler already running")
             return
         
-        # Job cleanup - Daily at 2 AM
-        self.scheduler.add_job(
-            cleanup_expired_jobs,
-            trigger=CronTrigger(hour=2, minute=0),
-            id='job_cleanup',
-            name='Clean up expired jobs',
-            replace_existing=True
-        )
-        
-        # Job count sync - Every hour
-        self.scheduler.add_job(
-            sync_job_counts,
-            trigger=IntervalTrigger(hours=1),
-            id='job_sync',
-            name='Sync job interaction counts',
-            replace_existing=True
-        )
-        
-        # Job scraping - Every 6 hours (will be implemented later)
-        # self.scheduler.add_job(
-        #     scrape_all_platforms,
-        #     trigger=IntervalTrigger(hours=6),
-        #     id='job_scraping',
-        #     name='Scrape jobs from all platforms',
-        #     replace_existing=True
-        # )
-        
-        self.scheduler.start()
+        # Job cleanup - Daily at 2 AM, Job count sync - Every hour
+        # (Job scraping every 6 hours will be implemented later)
+        self._tasks = [
+            asyncio.create_task(self._run_daily_cleanup(), name='job_cleanup'),
+            asyncio.create_task(self._run_hourly_sync(), name='job_sync'),
+        ]
         self._is_running = True
         
-        print("=" * 80)
-        print("✅ Job Lifecycle Scheduler Started")
-        print("=" * 80)
-        print("📅 Scheduled Jobs:")
-        print("   ✅ Job Cleanup: Daily at 2:00 AM")
-        print("   ✅ Job Count Sync: Every 1 hour")
-        print("   ⏸️  Job Scraping: Every 6 hours (to be enabled)")
-        print("=" * 80)
+        log.info(
+            "✅ Job Lifecycle Scheduler Started - Job Cleanup: daily at %02d:00, "
+            "Job Count Sync: every %ds, Job Scraping: to be enabled",
+            CLEANUP_HOUR, SYNC_INTERVAL
+        )
     
     def stop(self):
         """Stop the scheduler"""
         if not self._is_running:
-            print("⚠️ Scheduler not running")
+            log.warning("⚠️ Scheduler not running")
             return
         
-        self.scheduler.shutdown()
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
         self._is_running = False
-        print("❌ Job Lifecycle Scheduler Stopped")
+        log.info("❌ Job Lifecycle Scheduler Stopped")
     
     def get_jobs(self):
         """Get all scheduled jobs"""
-        return self.scheduler.get_jobs()
+        return list(self._tasks)
     
     async def trigger_cleanup_now(self):
         """Manually trigger cleanup (for testing/admin)"""
-        print("🔧 Manually triggering job cleanup...")
-        deleted_count = await cleanup_expired_jobs()
+        log.info("🔧 Manually triggering job cleanup...")
+        deleted_count = await cleanup_expired_jobs(force=True)
         return deleted_count
     
     async def trigger_sync_now(self):
         """Manually trigger sync (for testing/admin)"""
-        print("🔧 Manually triggering job count sync...")
+        log.info("🔧 Manually triggering job count sync...")
         updated_count = await sync_job_counts()
         return updated_count
 
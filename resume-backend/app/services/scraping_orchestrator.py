@@ -10,76 +10,50 @@ Coordinates scraping from all platforms:
 """
 
 import asyncio
+import importlib
+import logging
 from typing import List, Dict, Any
 from datetime import datetime
 from app.db import db
 
+log = logging.getLogger(__name__)
+
+# Platforms scraped at once, and the default wall-clock budget for one platform
+# (a scraper may set its own scrape_timeout)
+SCRAPER_CONCURRENCY = 4
+SCRAPER_TIMEOUT = 120
+
+# (module, class) of each platform scraper, imported on first scrape
+SCRAPER_SPECS = [
+    ("app.scrapers.remoteok_scraper", "RemoteOKScraper"),
+    ("app.scrapers.github_scraper", "GitHubScraper"),
+    ("app.scrapers.weworkremotely_scraper", "WeWorkRemotelyScraper"),
+    ("app.scrapers.indeed_scraper", "IndeedScraper"),
+    ("app.scrapers.linkedin_scraper", "LinkedInScraper"),
+    ("app.scrapers.stackoverflow_scraper", "StackOverflowScraper"),
+    ("app.scrapers.glassdoor_scraper", "GlassdoorScraper"),
+    ("app.scrapers.angellist_scraper", "AngelListScraper"),
+]
+
 
 class ScrapingOrchestrator:
     """Orchestrates job scraping from multiple platforms"""
     
     def __init__(self):
-        self.scrapers = []
-        self._initialize_scrapers()
+        # Instantiated on first use, so importing this module (and every
+        # worker boot) doesn't pull in the scraper modules and their parsers
+        self.scrapers = None
     
     def _initialize_scrapers(self):
-        """Initialize all platform scrapers"""
-        try:
-            from app.scrapers.remoteok_scraper import RemoteOKScraper
-            self.scrapers.append(RemoteOKScraper())
-            print("[OK] Initialized RemoteOK scraper")
-        except Exception as e:
-            print(f"[WARN] Failed to initialize RemoteOK scraper: {e}")
-        
-        try:
-            from app.scrapers.github_scraper import GitHubScraper
-            self.scrapers.append(GitHubScraper())
-            print("[OK] Initialized GitHub scraper")
-        except Exception as e:
-            print(f"[WARN] Failed to initialize GitHub scraper: {e}")
-        
-        try:
-            from app.scrapers.weworkremotely_scraper import WeWorkRemotelyScraper
-            self.scrapers.append(WeWorkRemotelyScraper())
-            print("[OK] Initialized WeWorkRemotely scraper")
-        except Exception as e:
-            print(f"[WARN] Failed to initialize WeWorkRemotely scraper: {e}")
-        
-        try:
-            from app.scrapers.indeed_scraper import IndeedScraper
-            self.scrapers.append(IndeedScraper())
-            print("[OK] Initialized Indeed scraper")
-        except Exception as e:
-            print(f"[WARN] Failed to initialize Indeed scraper: {e}")
-        
-        try:
-            from app.scrapers.linkedin_scraper import LinkedInScraper
-            self.scrapers.append(LinkedInScraper())
-            print("[OK] Initialized LinkedIn scraper")
-        except Exception as e:
-            print(f"[WARN] Failed to initialize LinkedIn scraper: {e}")
-        
-        try:
-            from app.scrapers.stackoverflow_scraper import StackOverflowScraper
-            self.scrapers.append(StackOverflowScraper())
-            print("[OK] Initialized StackOverflow scraper")
-        except Exception as e:
-            print(f"[WARN] Failed to initialize StackOverflow scraper: {e}")
-        
-        try:
-            from app.scrapers.glassdoor_scraper import GlassdoorScraper
-            self.scrapers.append(GlassdoorScraper())
-            print("[OK] Initialized Glassdoor scraper")
-        except Exception as e:
-            print(f"[WARN] Failed to initialize Glassdoor scraper: {e}")
-        
-        try:
-            from app.scrapers.angellist_scraper import AngelListScraper
-            self.scrapers.append(AngelListScraper())
-            print("[OK] Initialized AngelList scraper")
-        except Exception as e:
-            print(f"[WARN] Failed to initialize AngelList scraper: {e}")
-
+        """Import and initialize all platform scrapers (a failing platform is skipped)"""
+        self.scrapers = []
+        for module_name, class_name in SCRAPER_SPECS:
+            try:
+                scraper_class = getattr(importlib.import_module(module_name), class_name)
+                self.scrapers.append(scraper_class())
+                log.info("Initialized %s", class_name)
+            except Exception as e:
+                log.warning("Failed to initialize %s: %s", class_name, e)
     
     async def scrape_all_platforms(self, limit_per_platform: int = 50) -> Dict[str, Any]:
         """
@@ -91,22 +65,31 @@ class ScrapingOrchestrator:
         Returns:
             Aggregated statistics from all platforms
         """
-        print("=" * 80)
-        print("[START] Multi-Platform Job Scraping")
-        print("=" * 80)
-        print(f"Platforms: {len(self.scrapers)}")
-        print(f"Limit per platform: {limit_per_platform}")
-        print("=" * 80)
+        if self.scrapers is None:
+            self._initialize_scrapers()
+        
+        log.info(
+            "Multi-platform job scraping started: %d platforms, limit %d per platform",
+            len(self.scrapers), limit_per_platform
+        )
         
         start_time = datetime.utcnow()
         
-        # Run all scrapers in parallel
-        tasks = [
-            scraper.scrape_and_store(db, limit=limit_per_platform)
-            for scraper in self.scrapers
-        ]
+        # Run scrapers in parallel, a few platforms at a time; a stalled
+        # platform times out into an error instead of holding up the run
+        semaphore = asyncio.Semaphore(SCRAPER_CONCURRENCY)
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def run_scraper(scraper):
+            async with semaphore:
+                return await asyncio.wait_for(
+                    scraper.scrape_and_store(db, limit=limit_per_platform),
+                    timeout=scraper.scrape_timeout or SCRAPER_TIMEOUT
+                )
+        
+        results = await asyncio.gather(
+            *(run_scraper(scraper) for scraper in self.scrapers),
+            return_exceptions=True
+        )
         
         # Aggregate results
         total_scraped = 0
@@ -115,9 +98,14 @@ class ScrapingOrchestrator:
         total_errors = 0
         platform_results = []
         
-        for result in results:
+        for scraper, result in zip(self.scrapers, results):
+            if isinstance(result, asyncio.TimeoutError):
+                log.error("Scraper error: %s timed out after %ds", scraper.platform_name,
+                          scraper.scrape_timeout or SCRAPER_TIMEOUT)
+                total_errors += 1
+                continue
             if isinstance(result, Exception):
-                print(f"[ERROR] Scraper error: {result}")
+                log.error("Scraper error: %s: %s", scraper.platform_name, result)
                 total_errors += 1
                 continue
             
@@ -128,6 +116,11 @@ class ScrapingOrchestrator:
                 total_errors += result.get("errors", 0)
                 platform_results.append(result)
         
+        if total_stored:
+            # New jobs change every cached list; imported here to avoid a router import cycle
+            from app.routers.jobs import invalidate_jobs_cache
+            invalidate_jobs_cache()
+        
         end_time = datetime.utcnow()
         duration = (end_time - start_time).total_seconds()
         
@@ -141,15 +134,17 @@ class ScrapingOrchestrator:
             platform_results=platform_results
         )
         
-        print("=" * 80)
-        print("[COMPLETE] Multi-Platform Scraping Complete")
-        print("=" * 80)
-        print(f"Total Scraped: {total_scraped}")
-        print(f"Total Stored: {total_stored}")
-        print(f"Total Duplicates: {total_duplicates}")
-        print(f"Total Errors: {total_errors}")
-        print(f"Duration: {duration:.2f}s")
-        print("=" * 80)
+        log.info(
+            "Multi-platform scraping complete: scraped %d, stored %d, duplicates %d, errors %d in %.2fs",
+            total_scraped, total_stored, total_duplicates, total_errors, duration,
+            extra={
+                "total_scraped": total_scraped,
+                "total_stored": total_stored,
+                "total_duplicates": total_duplicates,
+                "total_errors": total_errors,
+                "duration_seconds": duration
+            }
+        )
         
         return {
             "success": True,
@@ -188,7 +183,7 @@ class ScrapingOrchestrator:
             await db.system_logs.insert_one(event)
             
         except Exception as e:
-            print(f"[ERROR] Error logging scraping event: {e}")
+            log.error("Error logging scraping event: %s", e)
     
     async def get_scraping_stats(self) -> Dict[str, Any]:
         """Get scraping statistics from logs"""
@@ -206,8 +201,8 @@ class ScrapingOrchestrator:
             
             # Calculate totals
             total_runs = len(recent_logs)
-            total_jobs_scraped = sum(log.get("total_scraped", 0) for log in recent_logs)
-            total_jobs_stored = sum(log.get("total_stored", 0) for log in recent_logs)
+            total_jobs_scraped = sum(entry.get("total_scraped", 0) for entry in recent_logs)
+            total_jobs_stored = sum(entry.get("total_stored", 0) for entry in recent_logs)
             
             return {
                 "total_scraping_runs": total_runs,
@@ -215,20 +210,20 @@ class ScrapingOrchestrator:
                 "total_jobs_stored": total_jobs_stored,
                 "recent_logs": [
                     {
-                        "timestamp": log.get("timestamp"),
-                        "scraped": log.get("total_scraped", 0),
-                        "stored": log.get("total_stored", 0),
-                        "duplicates": log.get("total_duplicates", 0),
-                        "errors": log.get("total_errors", 0),
-                        "duration": log.get("duration_seconds", 0),
-                        "status": log.get("status", "unknown")
+                        "timestamp": entry.get("timestamp"),
+                        "scraped": entry.get("total_scraped", 0),
+                        "stored": entry.get("total_stored", 0),
+                        "duplicates": entry.get("total_duplicates", 0),
+                        "errors": entry.get("total_errors", 0),
+                        "duration": entry.get("duration_seconds", 0),
+                        "status": entry.get("status", "unknown")
                     }
-                    for log in recent_logs
+                    for entry in recent_logs
                 ]
             }
             
         except Exception as e:
-            print(f"[ERROR] Error getting scraping stats: {e}")
+            log.error("Error getting scraping stats: %s", e)
             return {
                 "total_scraping_runs": 0,
                 "recent_logs": [],
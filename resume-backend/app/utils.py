@@ -1,206 +1,275 @@
 import io
-import json
+import logging
 import os
 import re
-from docx import Document
-import google.generativeai as genai
-from app.config import settings
+import ahocorasick
+import orjson
+from typing import Optional
 
-# Configure Gemini API
-genai.configure(api_key=settings.GEMINI_API_KEY)
+log = logging.getLogger(__name__)
 
-async def validate_resume_content(text: str) -> dict:
+# Essential resume sections and the (substring) keywords that evidence them
+RESUME_SECTION_KEYWORDS = (
+    ("Work Experience", ('experience', 'work history', 'employment', 'professional experience', 'work experience')),
+    ("Education", ('education', 'degree', 'university', 'college', 'bachelor', 'master', 'qualification', 'academic')),
+    ("Skills", ('skills', 'technical skills', 'competencies', 'expertise', 'proficient')),
+    ("Contact Information", ('email', 'phone', 'contact', '@', 'tel:', 'mobile', 'linkedin')),
+)
+
+def extract_json_object(content: str) -> Optional[str]:
+    """Outermost {...} span of an AI response (first "{" to last "}"), or None"""
+    start, end = content.find("{"), content.rfind("}")
+    if start == -1 or end < start:
+        return None
+    return content[start:end + 1]
+
+def _build_section_automaton() -> ahocorasick.Automaton:
+    """Aho-Corasick automaton over all section keywords -> section name"""
+    automaton = ahocorasick.Automaton()
+    for section, keywords in RESUME_SECTION_KEYWORDS:
+        for keyword in keywords:
+            automaton.add_word(keyword, section)
+    automaton.make_automaton()
+    return automaton
+
+_SECTION_AUTOMATON = _build_section_automaton()
+
+def find_resume_sections(text_lower: str) -> set:
+    """Names of the essential sections present in lowercased text (one pass)"""
+    found = set()
+    for _, section in _SECTION_AUTOMATON.iter(text_lower):
+        found.add(section)
+        if len(found) == len(RESUME_SECTION_KEYWORDS):
+            break
+    return found
+
+# Prompt bodies and how much resume text each one sends
+ANALYSIS_TEXT_CHARS = 4000
+ANALYSIS_PROMPT = """You are a STRICT resume/CV validator. Analyze if this document is a RESUME or CV, and if it is, extract its skills and experience.
+
+A VALID RESUME must contain:
+1. Personal/Contact information (name, email, phone)
+2. Work Experience or Employment History
+3. Education background (degrees, universities)
+4. Skills section (technical or professional skills)
+
+REJECT these document types:
+- Business reports, financial statements
+- Recipes, cooking instructions
+- Invoices, receipts, bills
+- Manuals, guides, tutorials
+- Articles, blog posts, news
+- Books, chapters, papers
+- Any other non-resume documents
+
+For a resume, also extract:
+1. Skills (technical skills, soft skills, tools, technologies)
+2. Experience (job titles, companies, duration, key achievements)
+
+Return ONLY valid JSON in this format:
+{
+  "is_resume": true or false,
+  "reason": "specific detailed explanation",
+  "confidence": 0.0 to 1.0,
+  "skills": ["skill1", "skill2"],
+  "experience": ["Job Title at Company (Duration): Description"]
+}
+
+Use empty lists for skills and experience if the document is not a resume.
+Be VERY STRICT - only accept documents that are clearly professional resumes/CVs.
+
+Document text (first %d characters):
+""" % ANALYSIS_TEXT_CHARS
+
+def _rejected(validation: dict) -> dict:
+    """analyze_resume result for a document rejected before any AI call"""
+    return {"validation": validation, "skills": [], "experience": []}
+
+async def analyze_resume(text: str) -> dict:
     """
-    Strictly validate if the uploaded document is actually a resume/CV using Gemini
-    Returns: {"is_resume": bool, "reason": str, "confidence": float}
+    Strictly validate that the uploaded document is a resume/CV and extract its
+    skills and experience, in a single AI call
+    Returns: {"validation": {"is_resume": bool, "reason": str, "confidence": float},
+              "skills": [...], "experience": [...]}, plus "fallback": True when the
+             AI call failed and keyword extraction was used
     """
     # Check minimum text length (stricter - 200 chars minimum)
     if len(text.strip()) < 200:
-        return {
+        return _rejected({
             "is_resume": False,
             "reason": "Document is too short to be a resume (minimum 200 characters required)",
             "confidence": 1.0
-        }
+        })
     
     # Strict keyword check - must have multiple essential sections
     text_lower = text.lower()
     
     # Check for essential resume sections
-    has_experience = any(word in text_lower for word in ['experience', 'work history', 'employment', 'professional experience', 'work experience'])
-    has_education = any(word in text_lower for word in ['education', 'degree', 'university', 'college', 'bachelor', 'master', 'qualification', 'academic'])
-    has_skills = any(word in text_lower for word in ['skills', 'technical skills', 'competencies', 'expertise', 'proficient'])
-    has_contact = any(word in text_lower for word in ['email', 'phone', 'contact', '@', 'tel:', 'mobile', 'linkedin'])
+    found_sections = find_resume_sections(text_lower)
     
     # Count how many essential sections are present
-    sections_found = sum([has_experience, has_education, has_skills, has_contact])
+    sections_found = len(found_sections)
     
     # Must have at least 3 out of 4 essential sections
     if sections_found < 3:
-        missing_sections = []
-        if not has_experience:
-            missing_sections.append("Work Experience")
-        if not has_education:
-            missing_sections.append("Education")
-        if not has_skills:
-            missing_sections.append("Skills")
-        if not has_contact:
-            missing_sections.append("Contact Information")
+        missing_sections = [
+            section for section, _ in RESUME_SECTION_KEYWORDS if section not in found_sections
+        ]
         
-        return {
+        return _rejected({
             "is_resume": False,
             "reason": f"Missing critical resume sections: {', '.join(missing_sections)}. A valid resume must have Work Experience, Education, Skills, and Contact details.",
             "confidence": 0.9
-        }
+        })
     
     # Use AI Service (Groq with Gemini Fallback)
     from app.services.ai_service import ai_service
     
-    prompt = """You are a STRICT resume/CV validator. Analyze if this document is a RESUME or CV.
-
-A VALID RESUME must contain:
-1. Personal/Contact information (name, email, phone)
-2. Work Experience or Employment History
-3. Education background (degrees, universities)
-4. Skills section (technical or professional skills)
-
-REJECT these document types:
-- Business reports, financial statements
-- Recipes, cooking instructions
-- Invoices, receipts, bills
-- Manuals, guides, tutorials
-- Articles, blog posts, news
-- Books, chapters, papers
-- Any other non-resume documents
-
-Return ONLY valid JSON in this format:
-{
-  "is_resume": true or false,
-  "reason": "specific detailed explanation",
-  "confidence": 0.0 to 1.0
-}
-
-Be VERY STRICT - only accept documents that are clearly professional resumes/CVs.
-
-Document text (first 2000 characters):
-""" + text[:2000]
+    prompt = ANALYSIS_PROMPT + text[:ANALYSIS_TEXT_CHARS]
     
     try:
         content = await ai_service.generate_content(prompt)
         
-        # Extract JSON using regex
-        json_match = re.search(r'\{[\s\S]*\}', content)
-        if json_match:
-            result = json.loads(json_match.group(0))
+        # Extract JSON object
+        json_str = extract_json_object(content)
+        if json_str:
+            result = orjson.loads(json_str)
+            validation = {key: result.get(key) for key in ("is_resume", "reason", "confidence")}
             
             # If AI says it's a resume but confidence is low, reject it
             if result.get("is_resume") and result.get("confidence", 0) < 0.6:
-                return {
+                validation = {
                     "is_resume": False,
                     "reason": f"AI validation uncertain: {result.get('reason', 'Low confidence in document being a resume')}",
                     "confidence": result.get("confidence", 0.5)
                 }
             
-            return result
+            return {
+                "validation": validation,
+                "skills": result.get("skills", [])[:30],
+                "experience": result.get("experience", [])[:10]
+            }
         else:
-            # If can't parse AI response, use strict keyword check
+            # If can't parse AI response, use strict keyword check (and keyword extraction)
+            log.warning("No JSON found in AI response, using fallback")
             return {
-                "is_resume": sections_found >= 4,  # Must have ALL sections
-                "reason": f"Found {sections_found}/4 resume sections. Strict validation requires all 4 essential sections.",
-                "confidence": 0.7
+                "validation": {
+                    "is_resume": sections_found >= 4,  # Must have ALL sections
+                    "reason": f"Found {sections_found}/4 resume sections. Strict validation requires all 4 essential sections.",
+                    "confidence": 0.7
+                },
+                **fallback_extraction(text)
             }
     except Exception as e:
-        print(f"Resume validation error: {e}")
+        log.error("Resume analysis error: %s", e)
         # On error, be conservative - require all 4 sections
         return {
-            "is_resume": sections_found >= 4,
-            "reason": f"Validation API failed. Found {sections_found}/4 required sections (Experience, Education, Skills, Contact). Need all 4 to proceed.",
-            "confidence": 0.6
+            "validation": {
+                "is_resume": sections_found >= 4,
+                "reason": f"Validation API failed. Found {sections_found}/4 required sections (Experience, Education, Skills, Contact). Need all 4 to proceed.",
+                "confidence": 0.6
+            },
+            **fallback_extraction(text)
         }
 
-async def extract_skills_experience_gemini(text: str) -> dict:
-    """Extract skills and experience using AI Service"""
-    from app.services.ai_service import ai_service
-    
-    # Build the prompt
-    prompt_text = """Analyze this resume and extract:
-1. Skills (technical skills, soft skills, tools, technologies)
-2. Experience (job titles, companies, duration, key achievements)
+FALLBACK_SKILLS = (
+    "Python", "Java", "JavaScript", "React", "Node.js", "SQL", "AWS", 
+    "Docker", "Kubernetes", "Git", "Machine Learning", "Data Analysis",
+    "Leadership", "Communication", "Problem Solving", "Teamwork", "C++",
+    "HTML", "CSS", "MongoDB", "PostgreSQL", "Angular", "Vue.js", "Django",
+    "Flask", "Spring Boot", "Microservices", "REST API", "GraphQL", "Azure",
+    "GCP", "Jenkins", "CI/CD", "Agile", "Scrum", "Project Management"
+)
 
-Return ONLY valid JSON in this exact format:
-{
-  "skills": ["skill1", "skill2"],
-  "experience": ["Job Title at Company (Duration): Description"]
-}
+def _build_fallback_skill_automaton() -> ahocorasick.Automaton:
+    """Aho-Corasick automaton over lowercased FALLBACK_SKILLS -> index in FALLBACK_SKILLS"""
+    automaton = ahocorasick.Automaton()
+    for index, skill in enumerate(FALLBACK_SKILLS):
+        automaton.add_word(skill.lower(), index)
+    automaton.make_automaton()
+    return automaton
 
-Resume text:
-""" + text[:4000]
-    
-    try:
-        content = await ai_service.generate_content(prompt_text)
-        
-        # Extract JSON using regex
-        json_match = re.search(r'\{[\s\S]*\}', content)
-        if json_match:
-            json_str = json_match.group(0)
-            parsed = json.loads(json_str)
-            return {
-                "skills": parsed.get("skills", [])[:30],
-                "experience": parsed.get("experience", [])[:10]
-            }
-        else:
-            print("No JSON found in AI response, using fallback")
-            return fallback_extraction(text)
-            
-    except Exception as e:
-        print(f"AI API error: {e}")
-        return fallback_extraction(text)
+_FALLBACK_SKILL_AUTOMATON = _build_fallback_skill_automaton()
 
 def fallback_extraction(text: str) -> dict:
     """Simple fallback extraction if Groq fails"""
-    common_skills = [
-        "Python", "Java", "JavaScript", "React", "Node.js", "SQL", "AWS", 
-        "Docker", "Kubernetes", "Git", "Machine Learning", "Data Analysis",
-        "Leadership", "Communication", "Problem Solving", "Teamwork", "C++",
-        "HTML", "CSS", "MongoDB", "PostgreSQL", "Angular", "Vue.js", "Django",
-        "Flask", "Spring Boot", "Microservices", "REST API", "GraphQL", "Azure",
-        "GCP", "Jenkins", "CI/CD", "Agile", "Scrum", "Project Management"
-    ]
-    found_skills = [skill for skill in common_skills if skill.lower() in text.lower()]
+    # One pass over the text; indexes keep the FALLBACK_SKILLS order
+    found_indexes = {index for _, index in _FALLBACK_SKILL_AUTOMATON.iter(text.lower())}
+    found_skills = [FALLBACK_SKILLS[index] for index in sorted(found_indexes)]
     return {
         "skills": found_skills[:15] if found_skills else ["Skills not extracted"], 
-        "experience": ["Experience details not extracted - please check resume format"]
+        "experience": ["Experience details not extracted - please check resume format"],
+        "fallback": True
     }
 
+# Pages read from an uploaded PDF; real resumes are a few pages, so this only
+# bounds the work spent on oversized or pathological files
+MAX_PDF_PAGES = 20
+
 def extract_text_from_pdf(data: bytes) -> str:
-    """Extract text from PDF file"""
+    """Extract text from PDF file (pypdf; pdfplumber for files pypdf can't parse)"""
+    from pypdf import PdfReader
+    from pypdf.errors import PyPdfError
+    try:
+        with io.BytesIO(data) as f:
+            reader = PdfReader(f)
+            return "\n".join(page.extract_text() or "" for page in reader.pages[:MAX_PDF_PAGES])
+    except PyPdfError as e:
+        log.warning("pypdf failed (%s), falling back to pdfplumber", e)
+    
+    # Slower layout-analysing parser, more tolerant of malformed files
     import pdfplumber
     with io.BytesIO(data) as f:
         text_all = []
         with pdfplumber.open(f) as pdf:
-            for page in pdf.pages:
+            for page in pdf.pages[:MAX_PDF_PAGES]:
                 text_all.append(page.extract_text() or "")
         return "\n".join(text_all)
 
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+# Run content python-docx renders as paragraph text: w:t verbatim, the rest as whitespace
+_DOCX_RUN_TEXT = {_W + "tab": "\t", _W + "br": "\n", _W + "cr": "\n"}
+
+def _iter_docx_paragraphs(xml_file):
+    """Text of each top-level body paragraph, streamed from word/document.xml"""
+    from lxml import etree
+    for _, elem in etree.iterparse(xml_file, tag=(_W + "p", _W + "tbl"), resolve_entities=False):
+        parent = elem.getparent()
+        if parent is None or parent.tag != _W + "body":
+            continue  # Table-cell paragraphs; dropped with their table
+        if elem.tag == _W + "p":
+            yield "".join(
+                node.text or "" if node.tag == _W + "t" else _DOCX_RUN_TEXT[node.tag]
+                for node in elem.iter(_W + "t", *_DOCX_RUN_TEXT)
+            )
+        # Free what has been read so memory stays flat on large documents
+        elem.clear()
+        while elem.getprevious() is not None:
+            del parent[0]
+
 def extract_text_from_docx(data: bytes) -> str:
-    """Extract text from DOCX file"""
+    """Extract text from DOCX file (streamed XML; python-docx for files that don't parse)"""
+    import zipfile
+    from lxml import etree
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as z, z.open("word/document.xml") as f:
+            return "\n".join(_iter_docx_paragraphs(f))
+    except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError) as e:
+        log.warning("DOCX XML parse failed (%s), falling back to python-docx", e)
+    
+    from docx import Document
     with io.BytesIO(data) as f:
         doc = Document(f)
         return "\n".join(p.text for p in doc.paragraphs)
 
-async def resume_jd_similarity(resume_text: str, job_description: str) -> dict:
-    """Compute similarity score between resume and job description"""
-    
-    def clean_text(text: str) -> str:
-        text = text.lower()
-        text = re.sub(r"[^\w\s]", "", text)
-        return text
+_PUNCT_RE = re.compile(r"[^\w\s]")
 
-    resume_clean = clean_text(resume_text)
-    job_clean = clean_text(job_description)
-
-    r_words = set(resume_clean.split())
-    j_words = set(job_clean.split())
+async def resume_jd_similarity(resume_text: str, job_description: str) -> dict:
+    """Compute Jaccard similarity (0-100) between resume and job description words"""
+    r_words = set(_PUNCT_RE.sub("", resume_text.lower()).split())
+    j_words = set(_PUNCT_RE.sub("", job_description.lower()).split())
 
+    # |A ∪ B| = |A| + |B| - |A ∩ B|, so the union set is never built
     inter = len(r_words & j_words)
-    score = round(100.0 * inter / max(1, len(j_words)), 2)
+    score = round(100.0 * inter / max(1, len(r_words) + len(j_words) - inter), 2)
     return {"similarity_score": score}
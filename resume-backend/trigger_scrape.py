@@ -22,4 +22,10 @@ async def main():
     print(f"Duration: {result['duration_seconds']:.2f}s")
 
 if __name__ == "__main__":
+    # libuv event loop where available (installed with uvicorn[standard]; not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())